@@ -0,0 +1,279 @@
+"""
+Headless HTTP analysis service
+Async front end (Starlette/uvicorn) that runs the CPU-bound pipeline on a
+process pool
+
+Usage:
+    python api_server.py --host 0.0.0.0 --port 8000 --workers 4 --max-concurrency 16
+
+Endpoints:
+    POST /analyze   multipart form: resume (PDF file), job_description,
+                    willing_to_relocate (optional: true/false)
+                    or JSON: {"resume_text", "job_description", "willing_to_relocate"}
+    GET  /healthz   process is up
+    GET  /readyz    worker pool is warmed up and not saturated
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from config import (
+    SERVICE_HOST, SERVICE_PORT, SERVICE_WORKERS, SERVICE_MAX_CONCURRENCY,
+    SERVICE_MAX_UPLOAD_BYTES
+)
+from pipeline import analyze_pdf_bytes, analyze_resume
+from upload_spool import UploadTooLargeError
+
+logger = logging.getLogger('ats.api_server')
+
+
+def warm_up():
+    """Load the lazily imported libraries in a worker before real traffic arrives"""
+    analyze_resume("python developer", "python developer")
+    return True
+
+
+def _parse_relocation(value):
+    """Map a form/JSON value to True, False or None"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        return value
+    value = str(value).strip().lower()
+    if value in ('true', '1', 'yes'):
+        return True
+    if value in ('false', '0', 'no'):
+        return False
+    raise ValueError(f"Invalid willing_to_relocate value: {value!r}")
+
+
+class AnalysisService:
+    """
+    Request handling and worker pool state.
+
+    At most max_concurrency analyses are in flight; further requests are
+    rejected with 503 so callers can back off instead of queueing unbounded.
+    If a worker process dies, the pool is replaced and the service reports
+    not ready until the new workers are warmed up.
+    """
+
+    def __init__(self, workers=SERVICE_WORKERS, max_concurrency=SERVICE_MAX_CONCURRENCY,
+                 max_upload_bytes=SERVICE_MAX_UPLOAD_BYTES):
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self.max_upload_bytes = max_upload_bytes
+        self.pool = None
+        self.ready = False
+        self.in_flight = 0
+        self._restart_lock = None
+
+    async def startup(self):
+        self._restart_lock = asyncio.Lock()
+        await self._start_pool()
+
+    async def _start_pool(self):
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, warm_up) for _ in range(self.workers)))
+        self.ready = True
+
+    async def _restart_pool(self, broken_pool):
+        """Replace a pool whose worker died; concurrent callers restart it only once"""
+        async with self._restart_lock:
+            if self.pool is not broken_pool:
+                return
+            self.ready = False
+            broken_pool.shutdown(wait=False, cancel_futures=True)
+            try:
+                await self._start_pool()
+            except Exception as e:
+                # Stay not ready so the orchestrator restarts the process
+                logger.error("Could not restart the worker pool: %s", e)
+
+    async def shutdown(self):
+        self.ready = False
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+
+    async def healthz(self, request):
+        return JSONResponse({'status': 'ok'})
+
+    async def readyz(self, request):
+        saturated = self.in_flight >= self.max_concurrency
+        body = {
+            'ready': self.ready and not saturated,
+            'in_flight': self.in_flight,
+            'max_concurrency': self.max_concurrency
+        }
+        return JSONResponse(body, status_code=200 if body['ready'] else 503)
+
+    async def analyze(self, request):
+        if not self.ready:
+            return _error(503, "Service is not ready", retry_after=1)
+        if self.in_flight >= self.max_concurrency:
+            return _error(503, "Too many concurrent analyses", retry_after=1)
+
+        content_length = request.headers.get('content-length')
+        if content_length:
+            try:
+                content_length = int(content_length)
+            except ValueError:
+                return _error(400, f"Invalid Content-Length header: {content_length!r}")
+            if content_length > self.max_upload_bytes:
+                return _error(413, f"Request exceeds {self.max_upload_bytes} bytes")
+
+        self.in_flight += 1
+        try:
+            try:
+                body = await self._read_body(request)
+                func, args = await self._parse_request(_buffered_request(request, body))
+            except UploadTooLargeError as e:
+                return _error(413, str(e))
+            except ValueError as e:
+                return _error(400, str(e))
+
+            loop = asyncio.get_running_loop()
+            pool = self.pool
+            try:
+                result = await loop.run_in_executor(pool, func, *args)
+            except BrokenProcessPool:
+                await self._restart_pool(pool)
+                return _error(503, "Analysis worker crashed; please retry", retry_after=1)
+            except UploadTooLargeError as e:
+                return _error(413, str(e))
+            except ValueError as e:
+                # Includes PdfExtractionError: the upload is not a usable PDF
+                return _error(422, str(e))
+            except Exception as e:
+                return _error(500, f"Analysis failed: {e}")
+        finally:
+            self.in_flight -= 1
+
+        return JSONResponse(result)
+
+    async def _read_body(self, request):
+        """
+        Read the request body, stopping once it passes max_upload_bytes.
+        Chunked requests carry no Content-Length, so the limit is enforced here.
+        """
+        chunks = []
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > self.max_upload_bytes:
+                raise UploadTooLargeError(f"Request exceeds {self.max_upload_bytes} bytes")
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    async def _parse_request(self, request):
+        """Return the pipeline function and its arguments for a request"""
+        content_type = request.headers.get('content-type', '')
+
+        if content_type.startswith('application/json'):
+            try:
+                payload = json.loads(await request.body())
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON: {e}")
+            if not isinstance(payload, dict):
+                raise ValueError("JSON body must be an object")
+            resume_text = payload.get('resume_text')
+            job_description = payload.get('job_description')
+            if not resume_text or not job_description:
+                raise ValueError("resume_text and job_description are required")
+            if not isinstance(resume_text, str) or not isinstance(job_description, str):
+                raise ValueError("resume_text and job_description must be strings")
+            relocate = _parse_relocation(payload.get('willing_to_relocate'))
+            return analyze_resume, (resume_text, job_description, relocate)
+
+        form = await request.form()
+        upload = form.get('resume')
+        job_description = form.get('job_description')
+        if upload is None or not hasattr(upload, 'read') or not job_description:
+            raise ValueError("resume (PDF file) and job_description are required")
+        if not isinstance(job_description, str):
+            raise ValueError("job_description must be a text field")
+
+        # Starlette has already spooled the part; check its size before reading it into memory
+        if upload.size is not None and upload.size > self.max_upload_bytes:
+            raise UploadTooLargeError(f"Resume exceeds {self.max_upload_bytes} bytes")
+        pdf_bytes = await upload.read()
+        if len(pdf_bytes) > self.max_upload_bytes:
+            raise UploadTooLargeError(f"Resume exceeds {self.max_upload_bytes} bytes")
+        relocate = _parse_relocation(form.get('willing_to_relocate'))
+        # Pool workers extract pages serially; the pool already provides parallelism
+        return analyze_pdf_bytes, (pdf_bytes, job_description, relocate, 1)
+
+
+def _buffered_request(request, body):
+    """A Request that replays an already read body"""
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {'type': 'http.disconnect'}
+        sent = True
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    return Request(request.scope, receive)
+
+
+def _error(status_code, message, retry_after=None):
+    headers = {'Retry-After': str(retry_after)} if retry_after else None
+    return JSONResponse({'error': message}, status_code=status_code, headers=headers)
+
+
+def create_app(workers=SERVICE_WORKERS, max_concurrency=SERVICE_MAX_CONCURRENCY,
+               max_upload_bytes=SERVICE_MAX_UPLOAD_BYTES):
+    """Build the ASGI application"""
+    service = AnalysisService(workers, max_concurrency, max_upload_bytes)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await service.startup()
+        try:
+            yield
+        finally:
+            await service.shutdown()
+
+    app = Starlette(
+        routes=[
+            Route('/analyze', service.analyze, methods=['POST']),
+            Route('/healthz', service.healthz, methods=['GET']),
+            Route('/readyz', service.readyz, methods=['GET']),
+        ],
+        lifespan=lifespan
+    )
+    app.state.service = service
+    return app
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the resume analysis HTTP service.")
+    parser.add_argument('--host', default=SERVICE_HOST)
+    parser.add_argument('--port', type=int, default=SERVICE_PORT)
+    parser.add_argument('--workers', type=int, default=SERVICE_WORKERS, help="Analysis worker processes")
+    parser.add_argument('--max-concurrency', type=int, default=SERVICE_MAX_CONCURRENCY,
+                        help="Analyses in flight before requests get 503")
+    args = parser.parse_args(argv)
+
+    uvicorn.run(create_app(args.workers, args.max_concurrency), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,22 +3,24 @@ ATS Resume Analyzer - Main Application
 Streamlit-based tool for analyzing resume-job match scores
 """
 
+from contextlib import nullcontext
+
 import streamlit as st
-import matplotlib.pyplot as plt
 
-# Import custom modules
-from nltk_setup import setup_nltk
+# Import custom modules (sklearn and matplotlib load lazily on first analysis)
+from config import PDF_MAX_UPLOAD_BYTES, PDF_MAX_UPLOAD_MB, TIMINGS_ENABLED
+from instrumentation import collect_timings, enable_timing_logs
 from ui_components import (
     apply_custom_css, render_header, render_sidebar,
-    render_section_card, render_pro_tips
+    render_section_card, render_pro_tips, render_timings_panel
 )
-from text_extractors import extract_text_from_pdf
-from similarity_calculator import calculate_similarity, calculate_expected_score
-from section_analyzer import analyze_sections
-from visualization import create_section_impact_chart
-
-# Setup NLTK
-setup_nltk()
+from similarity_calculator import calculate_expected_score, combine_similarity
+from section_analyzer import analyze_location_section
+from streamlit_cache import (
+    uploaded_file_hash, content_hash, cached_pdf_extraction,
+    cached_resume_profile, cached_job_profile, cached_sections, cached_tfidf_similarity
+)
+from visualization import section_impact_chart_png
 
 # Page configuration
 st.set_page_config(
@@ -37,34 +39,168 @@ render_header()
 # Render sidebar
 render_sidebar()
 
+if TIMINGS_ENABLED:
+    enable_timing_logs()
 
-def main():
-    """Main application logic"""
+
+def run_analysis(uploaded_file, job_description, relocation_preference):
+    """
+    Run the full pipeline for a submitted form.
     
-    # Input section
-    col1, col2 = st.columns([1, 1], gap="large")
+    Returns:
+        dict or None: Analysis state for st.session_state, None on input errors
+    """
+    # Reject oversized uploads before hashing or parsing them
+    if uploaded_file.size > PDF_MAX_UPLOAD_BYTES:
+        st.error(f"❌ The PDF is larger than {PDF_MAX_UPLOAD_MB} MB. Please upload a smaller file.")
+        return None
     
-    with col1:
-        st.markdown("### 📄 Upload Resume")
-        uploaded_file = st.file_uploader(
-            "Drag and drop your resume here",
-            type=['pdf'],
-            help="Upload your resume in PDF format for analysis",
-            label_visibility="collapsed"
+    # Extract text from PDF (cached by upload content hash)
+    resume_hash = uploaded_file_hash(uploaded_file)
+    job_hash = content_hash(job_description)
+    try:
+        extraction = cached_pdf_extraction(resume_hash, uploaded_file)
+    except Exception as e:
+        st.error(f"❌ Error reading PDF: {str(e)}")
+        return None
+    
+    if not extraction.text:
+        st.error("❌ Could not extract text from PDF. Please try another file.")
+        return None
+    
+    # Parse the resume and job description once for every analyzer
+    resume_profile = cached_resume_profile(resume_hash, extraction.text)
+    job_profile = cached_job_profile(job_hash, job_description)
+    
+    analysis = {
+        'resume_profile': resume_profile,
+        'job_profile': job_profile,
+        'extraction': extraction,
+        # Analyze sections (with relocation preference)
+        'sections': cached_sections(resume_hash, job_hash, relocation_preference, resume_profile, job_profile),
+        'relocation': relocation_preference,
+        'raw_tfidf': cached_tfidf_similarity(resume_hash, job_hash, resume_profile, job_profile)
+    }
+    update_scores(analysis)
+    return analysis
+
+
+def update_scores(analysis):
+    """Recombine the final and expected scores from the stored sub-results"""
+    analysis['score'] = combine_similarity(
+        analysis['raw_tfidf'], analysis['resume_profile'], analysis['job_profile'], analysis['sections']
+    )
+    analysis['expected_score'], analysis['potential_gain'] = calculate_expected_score(
+        analysis['score'], analysis['sections']
+    )
+
+
+def apply_relocation_preference(analysis, relocation_preference):
+    """Re-run only the location analyzer (and the score) when the preference changes"""
+    if analysis['relocation'] == relocation_preference:
+        return
+    
+    location = analyze_location_section(
+        analysis['resume_profile'], analysis['job_profile'], relocation_preference
+    )
+    analysis['sections'] = [
+        location if section['title'] == location['title'] else section
+        for section in analysis['sections']
+    ]
+    analysis['relocation'] = relocation_preference
+    update_scores(analysis)
+
+
+def render_results(analysis):
+    """Render scores, chart and section cards for a stored analysis"""
+    extraction = analysis['extraction']
+    sections = analysis['sections']
+    
+    if extraction.truncated:
+        st.warning(
+            f"⚠️ Only the first {extraction.pages_extracted} of {extraction.page_count} pages "
+            "were analyzed. Long resumes are truncated to keep analysis fast."
         )
     
+    # Display info message
+    st.info(
+        "ℹ️ Visual PDFs may affect section extraction. "
+        "The analyzer uses semantic fallbacks where possible."
+    )
+    
+    # Results display
+    st.markdown("---")
+    st.markdown("## 📈 Analysis Results")
+    
+    # Score display - Current vs Expected
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="score-label">Current Match Score</div>', unsafe_allow_html=True)
+        st.metric("", f"{analysis['score']:.1f}%", delta=None)
+    
     with col2:
-        st.markdown("### 💼 Job Description")
-        job_description = st.text_area(
-            "Paste the complete job description",
-            height=235,
-            placeholder="Copy and paste the job posting here, including requirements, responsibilities, and qualifications...",
-            label_visibility="collapsed"
-        )
+        st.markdown('<div class="score-label">Expected After Improvements</div>', unsafe_allow_html=True)
+        delta_text = f"+{analysis['potential_gain']:.1f}%"
+        st.metric("", f"{analysis['expected_score']:.1f}%", delta=delta_text, delta_color="normal")
+    
+    # Visual line chart showing section-by-section impact
+    st.markdown("#### Section-by-Section Impact Analysis")
+    
+    st.image(section_impact_chart_png(sections), width='stretch')
     
     st.markdown("<br>", unsafe_allow_html=True)
     
-    # Relocation preference section
+    # Section-by-section analysis
+    st.markdown("---")
+    st.markdown("## 🔍 Section-by-Section Analysis")
+    st.markdown("*Detailed breakdown of what needs attention in your resume*")
+    
+    # Render section cards
+    for section in sections:
+        render_section_card(section)
+    
+    # Pro tips
+    st.markdown("---")
+    render_pro_tips()
+
+
+def main():
+    """Main application logic"""
+    
+    # Inputs live in a form so typing or uploading does not rerun the analysis
+    with st.form("analysis_form"):
+        col1, col2 = st.columns([1, 1], gap="large")
+        
+        with col1:
+            st.markdown("### 📄 Upload Resume")
+            uploaded_file = st.file_uploader(
+                "Drag and drop your resume here",
+                type=['pdf'],
+                max_upload_size=PDF_MAX_UPLOAD_MB,
+                help="Upload your resume in PDF format for analysis",
+                label_visibility="collapsed"
+            )
+        
+        with col2:
+            st.markdown("### 💼 Job Description")
+            job_description = st.text_area(
+                "Paste the complete job description",
+                height=235,
+                placeholder="Copy and paste the job posting here, including requirements, responsibilities, and qualifications...",
+                label_visibility="collapsed"
+            )
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Centered analyze button
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            analyze_button = st.form_submit_button("🔍 Analyze Resume Match", use_container_width=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Relocation preference section (outside the form: changes apply to the current results)
     st.markdown("### 📍 Relocation Preference (Optional)")
     col1, col2, col3 = st.columns([1, 1, 1])
     
@@ -88,14 +224,17 @@ def main():
     else:
         relocation_preference = None  # User hasn't specified or contradictory input
     
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    # Centered analyze button
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        analyze_button = st.button("🔍 Analyze Resume Match", use_container_width=True)
+    # Stage timings are only collected when logged or shown in the debug panel
+    show_timings = st.session_state.get('debug_timings', False)
+    with collect_timings(log=TIMINGS_ENABLED) if TIMINGS_ENABLED or show_timings else nullcontext() as timings:
+        run_and_render(analyze_button, uploaded_file, job_description, relocation_preference)
     
-    # Analysis logic
+    if show_timings and timings is not None:
+        render_timings_panel(timings)
+
+
+def run_and_render(analyze_button, uploaded_file, job_description, relocation_preference):
+    """Run the analysis on submit, then render the stored results"""
     if analyze_button:
         if not uploaded_file:
             st.warning("⚠️ Please upload your resume to continue")
@@ -105,69 +244,16 @@ def main():
             return
         
         with st.spinner("👀 Analyzing your resume..."):
-            # Extract text from PDF
-            try:
-                resume_text = extract_text_from_pdf(uploaded_file)
-            except Exception as e:
-                st.error(f"❌ Error reading PDF: {str(e)}")
-                return
-            
-            if not resume_text:
-                st.error("❌ Could not extract text from PDF. Please try another file.")
-                return 
-            
-            # Analyze sections (with relocation preference)
-            sections = analyze_sections(resume_text, job_description, relocation_preference)
-            
-            # Calculate similarity (pass sections for section score calculation)
-            similarity_score, resume_processed, job_processed = calculate_similarity(resume_text, job_description, sections)
-            
-            # Calculate expected score
-            expected_score, potential_gain = calculate_expected_score(similarity_score, sections)
-            
-            # Display info message
-            st.info(
-                "ℹ️ Visual PDFs may affect section extraction. "
-                "The analyzer uses semantic fallbacks where possible."
-            )
-            
-            # Results display
-            st.markdown("---")
-            st.markdown("## 📈 Analysis Results")
-            
-            # Score display - Current vs Expected
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown('<div class="score-label">Current Match Score</div>', unsafe_allow_html=True)
-                st.metric("", f"{similarity_score:.1f}%", delta=None)
-            
-            with col2:
-                st.markdown('<div class="score-label">Expected After Improvements</div>', unsafe_allow_html=True)
-                delta_text = f"+{potential_gain:.1f}%"
-                st.metric("", f"{expected_score:.1f}%", delta=delta_text, delta_color="normal")
-            
-            # Visual line chart showing section-by-section impact
-            st.markdown("#### Section-by-Section Impact Analysis")
-            
-            fig = create_section_impact_chart(sections)
-            st.pyplot(fig)
-            plt.close()
-            
-            st.markdown("<br>", unsafe_allow_html=True)
-            
-            # Section-by-section analysis
-            st.markdown("---")
-            st.markdown("## 🔍 Section-by-Section Analysis")
-            st.markdown("*Detailed breakdown of what needs attention in your resume*")
-            
-            # Render section cards
-            for section in sections:
-                render_section_card(section)
-            
-            # Pro tips
-            st.markdown("---")
-            render_pro_tips()
+            analysis = run_analysis(uploaded_file, job_description, relocation_preference)
+        if analysis is None:
+            return
+        st.session_state['analysis'] = analysis
+    
+    # Results persist across reruns; a relocation change only re-runs the location analyzer
+    analysis = st.session_state.get('analysis')
+    if analysis is not None:
+        apply_relocation_preference(analysis, relocation_preference)
+        render_results(analysis)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+"""
+Batch resume ranking
+Scores a directory of resume PDFs against one job description in parallel
+
+Usage:
+    python batch_rank.py resumes/ job_description.txt --workers 8 --chunk-size 4
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from pipeline import analyze_pdf_file
+from profiles import build_job_profile
+
+# Per-process state, set once by _init_worker
+_worker_job = None
+_worker_relocate = None
+
+
+def _init_worker(job_profile, willing_to_relocate):
+    """Receive the parsed job description once per worker process"""
+    global _worker_job, _worker_relocate
+    _worker_job = job_profile
+    _worker_relocate = willing_to_relocate
+
+
+def score_resume_file(path):
+    """
+    Score one resume inside a worker.
+    Never raises: failures are reported in the result so one bad PDF
+    does not abort the batch.
+    """
+    try:
+        # Already inside a pool worker: extract pages serially
+        result = analyze_pdf_file(path, _worker_job, _worker_relocate, extract_workers=1)
+    except Exception as e:
+        return {'file': path, 'error': str(e)}
+
+    result['file'] = path
+    return result
+
+
+def find_resumes(resume_dir, recursive=False):
+    """List the PDF files in a directory, sorted by path"""
+    paths = []
+    for root, dirs, files in os.walk(resume_dir):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith('.pdf'))
+        if not recursive:
+            break
+    return sorted(paths)
+
+
+def rank_resumes(paths, job_description, willing_to_relocate=None, workers=None, chunk_size=4):
+    """
+    Score resume PDFs in a process pool.
+
+    Args:
+        paths (list): Resume PDF paths
+        job_description (str): Job description text
+        willing_to_relocate (bool or None): Relocation preference applied to every resume
+        workers (int, optional): Worker process count (defaults to CPU count)
+        chunk_size (int): Files handed to a worker per task
+
+    Returns:
+        tuple: (ranked results sorted by score, failed results)
+    """
+    job_profile = build_job_profile(job_description)
+
+    if workers == 1:
+        _init_worker(job_profile, willing_to_relocate)
+        results = [score_resume_file(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(job_profile, willing_to_relocate)
+        ) as executor:
+            results = list(executor.map(score_resume_file, paths, chunksize=max(1, chunk_size)))
+
+    ranked = sorted((r for r in results if 'error' not in r), key=lambda r: r['score'], reverse=True)
+    failed = [r for r in results if 'error' in r]
+    return ranked, failed
+
+
+def format_table(ranked):
+    """Render ranked results as a plain-text table"""
+    lines = [f"{'Rank':>4}  {'Score':>6}  {'Expected':>8}  {'Weak':>4}  {'Missing':>7}  File"]
+    for rank, result in enumerate(ranked, start=1):
+        statuses = [s['status'] for s in result['sections']]
+        lines.append(
+            f"{rank:>4}  {result['score']:>6.1f}  {result['expected_score']:>8.1f}  "
+            f"{statuses.count('weak'):>4}  {statuses.count('missing'):>7}  {result['file']}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Rank a directory of resume PDFs against a job description.")
+    parser.add_argument('resume_dir', help="Directory containing resume PDFs")
+    parser.add_argument('job_file', help="Text file with the job description")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=4, help="Resumes sent to a worker per task (default: 4)")
+    parser.add_argument('--relocate', choices=['yes', 'no'], default=None, help="Relocation preference for every candidate")
+    parser.add_argument('--recursive', action='store_true', help="Include PDFs in subdirectories")
+    parser.add_argument('--top', type=int, default=None, help="Only print the top N resumes")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON instead of a table")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    args = parse_args(argv)
+
+    with open(args.job_file, encoding='utf-8') as f:
+        job_description = f.read()
+
+    paths = find_resumes(args.resume_dir, args.recursive)
+    if not paths:
+        print(f"No PDF files found in {args.resume_dir}", file=sys.stderr)
+        return 1
+
+    willing_to_relocate = {'yes': True, 'no': False}.get(args.relocate)
+    ranked, failed = rank_resumes(paths, job_description, willing_to_relocate, args.workers, args.chunk_size)
+    if args.top is not None:
+        ranked = ranked[:args.top]
+
+    if args.json:
+        print(json.dumps({'ranked': ranked, 'failed': failed}, ensure_ascii=False, indent=2))
+    else:
+        print(format_table(ranked))
+        for result in failed:
+            print(f"Failed: {result['file']}: {result['error']}", file=sys.stderr)
+
+    return 0 if ranked else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
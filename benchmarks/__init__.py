@@ -0,0 +1,8 @@
+"""
+Benchmark suite
+Synthetic resume/job corpus generator (benchmarks.corpus) and per-stage
+timing runner (benchmarks.run)
+
+Run from the repository root:
+    python -m benchmarks.run --pairs 200 --output bench.json
+"""
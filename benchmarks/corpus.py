@@ -0,0 +1,246 @@
+"""
+Synthetic resume and job description generator
+Builds realistic-looking documents from the project's own vocabularies
+(TECHNOLOGIES, SOFT_SKILLS, JOB_TYPE_KEYWORDS) and renders resumes as
+text-based PDFs of any length
+
+Usage:
+    python -m benchmarks.corpus out_dir --resumes 100 --jobs 10 [--min-pages 1] [--max-pages 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import List, NamedTuple
+
+from config import EDUCATION_KEYWORDS, IMPORTANT_KEYWORDS, JOB_TYPE_KEYWORDS
+from feature_extractors import SOFT_SKILLS, TECHNOLOGIES
+
+# Lines that fit on one US Letter page at 11pt with 14pt leading
+LINES_PER_PAGE = 50
+
+FIRST_NAMES = ['Aarav', 'Priya', 'John', 'Maria', 'Wei', 'Fatima', 'Lucas', 'Aisha', 'Kenji', 'Elena']
+LAST_NAMES = ['Sharma', 'Patel', 'Smith', 'Garcia', 'Chen', 'Khan', 'Silva', 'Okafor', 'Tanaka', 'Novak']
+CITIES = [
+    'Bangalore, India', 'Pune, India', 'Hyderabad, India', 'Mumbai, India', 'London, UK',
+    'Berlin, Germany', 'Toronto, Canada', 'Singapore', 'San Francisco, CA', 'New York, NY'
+]
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Tech', 'Hooli']
+DEGREES = ['Bachelor of Technology in Computer Science', 'Master of Science in Software Engineering',
+           'B.E. in Information Technology', 'BCA', 'MCA', 'PhD in Computer Science']
+ACTION_VERBS = ['Built', 'Designed', 'Led', 'Optimized', 'Migrated', 'Automated', 'Maintained', 'Shipped']
+OUTCOMES = ['reducing latency by {n}%', 'serving {n}k daily users', 'cutting costs by {n}%',
+            'improving test coverage to {n}%', 'with {n}% fewer incidents']
+
+
+class SyntheticDocument(NamedTuple):
+    """A generated document: its lines (LINES_PER_PAGE per PDF page) and page count"""
+    lines: List[str]
+    pages: int
+
+    @property
+    def text(self):
+        return "\n".join(self.lines)
+
+
+def _sample(rng, population, low, high):
+    population = sorted(population)
+    return rng.sample(population, min(len(population), rng.randint(low, high)))
+
+
+def _role(rng):
+    return rng.choice(sorted(JOB_TYPE_KEYWORDS))
+
+
+def _bullet(rng, technologies):
+    tech = ", ".join(rng.sample(technologies, min(len(technologies), 2)))
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 90))
+    return f"- {rng.choice(ACTION_VERBS)} {rng.choice(IMPORTANT_KEYWORDS)} features using {tech}, {outcome}"
+
+
+def generate_resume(rng, pages=1):
+    """
+    Generate a resume that fills roughly the requested number of pages.
+
+    Args:
+        rng (random.Random): Source of randomness (seed it for reproducible corpora)
+        pages (int): Target page count
+
+    Returns:
+        SyntheticDocument: Resume lines and page count
+    """
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    role = _role(rng)
+    role_terms = JOB_TYPE_KEYWORDS[role]
+    technologies = _sample(rng, TECHNOLOGIES, 6, 15)
+    soft_skills = _sample(rng, SOFT_SKILLS, 3, 6)
+    years = rng.randint(0, 15)
+
+    lines = [
+        name,
+        f"{name.split()[0].lower()}.{name.split()[1].lower()}@example.com | +91 98765 {rng.randint(10000, 99999)}",
+        f"Location: {rng.choice(CITIES)}",
+        f"github.com/{name.split()[0].lower()}{rng.randint(1, 99)} | linkedin.com/in/{name.replace(' ', '-').lower()}",
+        "",
+        "Summary",
+        f"{role.capitalize()} developer with {years}+ years of experience in {', '.join(role_terms[:3])}.",
+        "",
+        "Skills",
+        "Technologies: " + ", ".join(technologies),
+        "Soft skills: " + ", ".join(soft_skills),
+        "",
+        "Education",
+        f"{rng.choice(DEGREES)}, {rng.randint(2005, 2023)}",
+        "",
+    ]
+
+    target_lines = pages * LINES_PER_PAGE
+    section = 0
+    while len(lines) < target_lines:
+        if section % 2 == 0:
+            lines.append("Experience")
+            lines.append(f"{role.capitalize()} Engineer, {rng.choice(COMPANIES)} ({rng.randint(1, 6)} years)")
+        else:
+            lines.append("Projects")
+            lines.append(f"Project: {rng.choice(IMPORTANT_KEYWORDS).capitalize()} platform")
+        lines.extend(_bullet(rng, technologies) for _ in range(rng.randint(3, 6)))
+        lines.append("")
+        section += 1
+
+    return SyntheticDocument(lines[:target_lines], pages)
+
+
+def generate_job_description(rng):
+    """
+    Generate a job description for a random role.
+
+    Returns:
+        str: Job description text
+    """
+    role = _role(rng)
+    required = _sample(rng, TECHNOLOGIES, 4, 10)
+    role_terms = rng.sample(JOB_TYPE_KEYWORDS[role], min(4, len(JOB_TYPE_KEYWORDS[role])))
+    soft_skills = _sample(rng, SOFT_SKILLS, 2, 5)
+
+    return "\n".join([
+        f"{role.capitalize()} Engineer",
+        f"Location: {rng.choice(CITIES)}",
+        "",
+        f"We are looking for a {role} engineer with {rng.randint(1, 8)}+ years of experience "
+        f"in {', '.join(role_terms)}.",
+        "",
+        "Requirements:",
+        *(f"- Experience with {tech}" for tech in required),
+        f"- {rng.choice(EDUCATION_KEYWORDS).capitalize()} or equivalent",
+        "",
+        "Nice to have: " + ", ".join(_sample(rng, TECHNOLOGIES, 2, 5)),
+        "Soft skills: " + ", ".join(soft_skills),
+        "Responsibilities: " + ", ".join(rng.sample(IMPORTANT_KEYWORDS, 6)),
+    ])
+
+
+def _pdf_escape(line):
+    line = line.encode('latin-1', 'replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(document):
+    """
+    Render a document as a minimal text-based PDF (Helvetica, one text
+    object per page), good enough for PyPDF2 text extraction.
+
+    Args:
+        document (SyntheticDocument): Document to render
+
+    Returns:
+        bytes: PDF file content
+    """
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", b""]
+    font_id, pages_id = 1, 2
+    kids = []
+
+    for start in range(0, max(1, len(document.lines)), LINES_PER_PAGE):
+        page_lines = document.lines[start:start + LINES_PER_PAGE]
+        ops = " ".join(f"({_pdf_escape(line)}) '" for line in page_lines)
+        stream = f"BT /F1 11 Tf 50 760 Td 14 TL {ops} ET".encode('latin-1')
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (pages_id, content_id, font_id)
+        )
+        kids.append(len(objects))
+
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+    catalog_id = len(objects)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog_id, xref_offset
+    )
+    return bytes(out)
+
+
+def generate_corpus(resumes, jobs, min_pages=1, max_pages=50, seed=0):
+    """
+    Generate a reproducible corpus.
+
+    Args:
+        resumes (int): Number of resumes
+        jobs (int): Number of job descriptions
+        min_pages (int): Shortest resume in pages
+        max_pages (int): Longest resume in pages
+        seed (int): Random seed
+
+    Returns:
+        tuple: (list of SyntheticDocument resumes, list of job description strings)
+    """
+    rng = random.Random(seed)
+    resume_docs = [generate_resume(rng, rng.randint(min_pages, max_pages)) for _ in range(resumes)]
+    job_texts = [generate_job_description(rng) for _ in range(jobs)]
+    return resume_docs, job_texts
+
+
+def main(argv=None):
+    """Write a corpus to disk as resume PDFs/texts and job description texts"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume/job corpus.")
+    parser.add_argument('out_dir', help="Output directory")
+    parser.add_argument('--resumes', type=int, default=100)
+    parser.add_argument('--jobs', type=int, default=10)
+    parser.add_argument('--min-pages', type=int, default=1)
+    parser.add_argument('--max-pages', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    resumes, jobs = generate_corpus(args.resumes, args.jobs, args.min_pages, args.max_pages, args.seed)
+
+    os.makedirs(os.path.join(args.out_dir, 'resumes'), exist_ok=True)
+    os.makedirs(os.path.join(args.out_dir, 'jobs'), exist_ok=True)
+    for i, resume in enumerate(resumes):
+        base = os.path.join(args.out_dir, 'resumes', f"resume_{i:04d}")
+        with open(base + '.pdf', 'wb') as f:
+            f.write(render_pdf(resume))
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write(resume.text)
+    for i, job in enumerate(jobs):
+        with open(os.path.join(args.out_dir, 'jobs', f"job_{i:04d}.txt"), 'w', encoding='utf-8') as f:
+            f.write(job)
+
+    print(f"Wrote {len(resumes)} resumes and {len(jobs)} job descriptions to {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
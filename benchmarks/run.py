@@ -0,0 +1,243 @@
+"""
+Per-stage benchmark runner
+Times every pipeline stage on a synthetic corpus and writes JSON with
+percentiles, so runs can be compared across commits
+
+Usage:
+    python -m benchmarks.run [--pairs 100] [--min-pages 1] [--max-pages 50] [--output bench.json]
+    python -m benchmarks.run --compare baseline.json --output current.json
+
+The PDF text disk cache and the feature store are disabled unless
+ATS_PDF_CACHE_DIR / ATS_FEATURE_STORE are set, so extraction is always
+measured cold.
+"""
+
+import os
+
+os.environ.setdefault('ATS_PDF_CACHE_DIR', '')
+os.environ.setdefault('ATS_FEATURE_STORE', '')
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from io import BytesIO
+
+from benchmarks.corpus import generate_job_description, generate_resume, render_pdf
+from feature_extractors import clear_keyword_caches
+from incremental import get_incremental_analyzer
+from profiles import build_job_profile, build_resume_profile
+from section_analyzer import (
+    analyze_sections, analyze_skills_section, analyze_projects_section,
+    analyze_education_section, analyze_experience_section, analyze_location_section,
+    analyze_keywords_section
+)
+from similarity_calculator import calculate_similarity
+from text_extractors import clear_preprocess_cache, extract_pdf_document
+from visualization import clear_chart_cache, create_section_impact_chart, figure_png
+
+PERCENTILES = (50, 90, 95, 99)
+
+SECTION_ANALYZERS = [
+    ('analyze_skills_section', analyze_skills_section),
+    ('analyze_projects_section', analyze_projects_section),
+    ('analyze_education_section', analyze_education_section),
+    ('analyze_experience_section', analyze_experience_section),
+    ('analyze_location_section', analyze_location_section),
+    ('analyze_keywords_section', analyze_keywords_section),
+]
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(samples):
+    """
+    Summarize timings given in seconds.
+
+    Returns:
+        dict: count, mean, min, max and percentiles, in milliseconds
+    """
+    values = sorted(s * 1000 for s in samples)
+    summary = {
+        'count': len(values),
+        'mean_ms': sum(values) / len(values) if values else 0.0,
+        'min_ms': values[0] if values else 0.0,
+        'max_ms': values[-1] if values else 0.0,
+    }
+    for pct in PERCENTILES:
+        summary[f'p{pct}_ms'] = percentile(values, pct)
+    return {key: round(value, 4) if isinstance(value, float) else value for key, value in summary.items()}
+
+
+def _clear_caches():
+    """
+    Drop in-process memoization so each pair is measured from scratch.
+    Process-wide handles (page pool, corpus model, gazetteer) are setup
+    cost, paid during warmup, and are kept.
+    """
+    build_resume_profile.cache_clear()
+    build_job_profile.cache_clear()
+    clear_keyword_caches()
+    clear_preprocess_cache()
+    get_incremental_analyzer().clear()
+    clear_chart_cache()
+
+
+def run_pair(pdf_bytes, job_description, willing_to_relocate, timings):
+    """
+    Run every stage once for one resume/job pair, appending to timings.
+
+    Args:
+        pdf_bytes (bytes): Resume PDF
+        job_description (str): Job description text
+        willing_to_relocate (bool or None): Relocation preference
+        timings (dict): stage name -> list of seconds
+    """
+    clock = time.perf_counter
+    _clear_caches()
+
+    start = clock()
+    extraction = extract_pdf_document(BytesIO(pdf_bytes))
+    timings['pdf_extraction'].append(clock() - start)
+
+    start = clock()
+    resume = build_resume_profile(extraction.text)
+    job = build_job_profile(job_description)
+    timings['build_profiles'].append(clock() - start)
+
+    for name, analyzer in SECTION_ANALYZERS:
+        args = (resume, job, willing_to_relocate) if name == 'analyze_location_section' else (resume, job)
+        start = clock()
+        analyzer(*args)
+        timings[name].append(clock() - start)
+
+    start = clock()
+    sections = analyze_sections(resume, job, willing_to_relocate)
+    timings['analyze_sections'].append(clock() - start)
+
+    start = clock()
+    calculate_similarity(resume, job, sections)
+    timings['calculate_similarity'].append(clock() - start)
+
+    start = clock()
+    fig = create_section_impact_chart(sections)
+    timings['create_section_impact_chart'].append(clock() - start)
+
+    # What section_impact_chart_png does on a cache miss
+    start = clock()
+    figure_png(fig)
+    timings['chart_png'].append(clock() - start)
+
+
+def run_benchmark(pairs=100, min_pages=1, max_pages=50, jobs=10, seed=0, warmup=2):
+    """
+    Generate a corpus and time each stage.
+
+    Args:
+        pairs (int): Timed resume/job pairs
+        min_pages (int): Shortest resume in pages
+        max_pages (int): Longest resume in pages
+        jobs (int): Distinct job descriptions the pairs draw from
+        seed (int): Random seed for the corpus
+        warmup (int): Untimed pairs run first (lazy imports, first-call setup)
+
+    Returns:
+        dict: Benchmark report
+    """
+    rng = random.Random(seed)
+    job_texts = [generate_job_description(rng) for _ in range(jobs)]
+    page_counts = []
+    timings = defaultdict(list)
+
+    for index in range(warmup + pairs):
+        resume = generate_resume(rng, rng.randint(min_pages, max_pages))
+        pdf_bytes = render_pdf(resume)
+        relocate = rng.choice([None, True, False])
+
+        if index < warmup:
+            run_pair(pdf_bytes, job_texts[0], relocate, defaultdict(list))
+            continue
+
+        page_counts.append(resume.pages)
+        run_pair(pdf_bytes, rng.choice(job_texts), relocate, timings)
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'pairs': pairs,
+            'pages': {'min': min_pages, 'max': max_pages, 'total': sum(page_counts)},
+            'jobs': jobs,
+            'seed': seed,
+        },
+        'stages': {stage: summarize(samples) for stage, samples in timings.items()}
+    }
+
+
+def compare(baseline, current, metric='p50_ms'):
+    """Render a per-stage comparison table of two reports"""
+    lines = [f"{'Stage':<30}  {'Baseline':>10}  {'Current':>10}  {'Change':>8}"]
+    for stage, stats in current['stages'].items():
+        before = baseline.get('stages', {}).get(stage, {}).get(metric)
+        after = stats[metric]
+        if before:
+            change = f"{(after - before) / before * 100:+.1f}%"
+            lines.append(f"{stage:<30}  {before:>10.3f}  {after:>10.3f}  {change:>8}")
+        else:
+            lines.append(f"{stage:<30}  {'-':>10}  {after:>10.3f}  {'':>8}")
+    return "\n".join(lines)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark each analysis stage on a synthetic corpus.")
+    parser.add_argument('--pairs', type=int, default=100, help="Timed resume/job pairs (default: 100)")
+    parser.add_argument('--min-pages', type=int, default=1)
+    parser.add_argument('--max-pages', type=int, default=50)
+    parser.add_argument('--jobs', type=int, default=10, help="Distinct job descriptions (default: 10)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--warmup', type=int, default=2, help="Untimed warm-up pairs (default: 2)")
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    parser.add_argument('--compare', help="Baseline JSON report to compare p50 timings against")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.pairs, args.min_pages, args.max_pages, args.jobs, args.seed, args.warmup)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(compare(baseline, report), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
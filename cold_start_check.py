@@ -0,0 +1,74 @@
+"""
+Cold-start check
+Measures how long a fresh interpreter takes to import the application's
+modules and verifies that no heavy optional library is loaded on the way
+
+Usage:
+    python cold_start_check.py [--runs 5] [--target 1.0]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+from config import COLD_START_TARGET_SECONDS
+
+# What app.py imports before the first render
+APP_MODULES = [
+    'streamlit', 'ui_components', 'text_extractors', 'similarity_calculator',
+    'section_analyzer', 'visualization', 'profiles', 'streamlit_cache'
+]
+
+# Must not be imported until a feature actually needs them
+DEFERRED_MODULES = ['sklearn', 'matplotlib', 'nltk']
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+loaded = [m for m in {deferred!r} if m in sys.modules]
+print(json.dumps({{'seconds': elapsed, 'loaded': loaded}}))
+"""
+
+
+def measure_cold_start(runs=5):
+    """
+    Import the app modules in fresh interpreters.
+
+    Returns:
+        dict: best and worst import time in seconds, and deferred modules that got loaded
+    """
+    probe = _PROBE.format(modules=APP_MODULES, deferred=DEFERRED_MODULES)
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', probe], capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result['seconds'])
+        loaded.update(result['loaded'])
+
+    return {'best': min(timings), 'worst': max(timings), 'loaded': sorted(loaded)}
+
+
+def main(argv=None):
+    """Command-line entry point; exits non-zero when the budget is exceeded"""
+    parser = argparse.ArgumentParser(description="Check application cold-start time.")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters to time (default: 5)")
+    parser.add_argument('--target', type=float, default=COLD_START_TARGET_SECONDS,
+                        help=f"Budget in seconds (default: {COLD_START_TARGET_SECONDS})")
+    args = parser.parse_args(argv)
+
+    result = measure_cold_start(args.runs)
+    result['target'] = args.target
+    result['ok'] = result['best'] <= args.target and not result['loaded']
+    print(json.dumps(result, indent=2))
+    return 0 if result['ok'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
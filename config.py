@@ -2,6 +2,8 @@
 Configuration constants for ATS Resume Analyzer
 """
 
+import os
+
 # Application constants
 APP_TITLE = "ATS Resume Analyzer"
 APP_SUBTITLE = "Optimize your resume for Applicant Tracking Systems"
@@ -62,6 +64,60 @@ JOB_TYPE_KEYWORDS = {
     ]
 }
 
+# Surface forms and synonyms mapped to their canonical skill name
+SKILL_ALIASES = {
+    'reactjs': 'react',
+    'react.js': 'react',
+    'nodejs': 'node.js',
+    'node': 'node.js',
+    'nextjs': 'next.js',
+    'next': 'next.js',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'postgres': 'postgresql',
+    'mongo': 'mongodb',
+    'k8s': 'kubernetes',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+}
+
+# Aliases that are common English words: they normalize explicit skill names
+# (queries, lists) but are not detected in free text ("next steps")
+UNDETECTED_SKILL_ALIASES = {'next'}
+
+# Skill categories, used to group skills in rewrites and reports.
+# Each canonical skill belongs to one category.
+SKILL_CATEGORIES = {
+    'Programming Languages': [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php',
+        'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'matlab', 'sql'
+    ],
+    'Frontend': [
+        'html', 'css', 'react', 'angular', 'vue', 'svelte', 'next.js', 'nuxt', 'gatsby',
+        'webpack', 'babel', 'vite', 'rollup'
+    ],
+    'Backend & APIs': [
+        'node.js', 'express', 'django', 'flask', 'fastapi', 'spring', 'laravel', 'rails',
+        'rest', 'graphql', 'grpc', 'websockets', 'api', 'prisma', 'sequelize', 'mongoose'
+    ],
+    'Databases': [
+        'nosql', 'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch', 'cassandra'
+    ],
+    'Cloud & DevOps': [
+        'docker', 'kubernetes', 'jenkins', 'aws', 'azure', 'gcp', 'heroku', 'vercel', 'netlify',
+        'terraform', 'ansible'
+    ],
+    'Version Control': ['git', 'github', 'gitlab', 'bitbucket'],
+    'Data Science & ML': ['tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy'],
+    'Testing': ['jest', 'mocha', 'pytest', 'junit', 'selenium', 'cypress'],
+    'Soft Skills': [
+        'leadership', 'communication', 'teamwork', 'problem-solving', 'analytical',
+        'creative', 'organized', 'detail-oriented', 'time-management', 'adaptable',
+        'collaborative', 'initiative', 'critical-thinking', 'decision-making'
+    ]
+}
+
 # Score weights for similarity calculation
 SCORE_WEIGHTS = {
     'tfidf': 0.30,       # Text similarity
@@ -70,6 +126,79 @@ SCORE_WEIGHTS = {
     'sections': 0.10     # Section completeness
 }
 
+# Corpus TF-IDF model fitted offline with `python tfidf_model.py fit ...`.
+# When unset (or the file is missing) a TF-IDF vectorizer is fitted per request.
+TFIDF_MODEL_PATH = os.environ.get('ATS_TFIDF_MODEL', '')
+
+# Disk cache for extracted PDF text (set ATS_PDF_CACHE_DIR="" to disable)
+PDF_CACHE_DIR = os.environ.get(
+    'ATS_PDF_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'ats-resume-analyzer', 'pdf-text')
+)
+PDF_CACHE_MAX_BYTES = int(os.environ.get('ATS_PDF_CACHE_MAX_MB', '256')) * 1024 * 1024
+
+# PDF extraction limits. Pages beyond PDF_MAX_PAGES and text beyond
+# PDF_MAX_CHARS are dropped and the result is flagged as truncated (0 = no cap).
+PDF_MAX_PAGES = int(os.environ.get('ATS_PDF_MAX_PAGES', '50'))
+PDF_MAX_CHARS = int(os.environ.get('ATS_PDF_MAX_CHARS', '200000'))
+
+# Documents with at least PDF_PARALLEL_MIN_PAGES pages are extracted in
+# PDF_EXTRACT_WORKERS processes (1 = always serial)
+PDF_EXTRACT_WORKERS = int(os.environ.get('ATS_PDF_EXTRACT_WORKERS', str(min(4, os.cpu_count() or 1))))
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get('ATS_PDF_PARALLEL_MIN_PAGES', '8'))
+
+# Uploads over PDF_MAX_UPLOAD_BYTES are rejected before parsing. Accepted
+# uploads are spooled in memory up to PDF_SPOOL_MAX_BYTES, then on disk.
+PDF_MAX_UPLOAD_MB = int(os.environ.get('ATS_PDF_MAX_UPLOAD_MB', '50'))
+PDF_MAX_UPLOAD_BYTES = PDF_MAX_UPLOAD_MB * 1024 * 1024
+PDF_SPOOL_MAX_BYTES = int(os.environ.get('ATS_PDF_SPOOL_MB', '2')) * 1024 * 1024
+
+# NLTK data is never downloaded implicitly; set ATS_NLTK_ALLOW_DOWNLOAD=1
+# (or run `python nltk_setup.py`) to fetch missing packages
+NLTK_ALLOW_DOWNLOAD = os.environ.get('ATS_NLTK_ALLOW_DOWNLOAD', '') == '1'
+
+# Cold-start budget: importing the app's modules must stay under this many
+# seconds without loading sklearn, matplotlib or NLTK (see cold_start_check.py)
+COLD_START_TARGET_SECONDS = float(os.environ.get('ATS_COLD_START_TARGET', '1.0'))
+
+# Streamlit result caches (PDF text, profiles, section analysis, scores)
+CACHE_TTL_SECONDS = int(os.environ.get('ATS_CACHE_TTL_SECONDS', '3600'))
+CACHE_MAX_ENTRIES = int(os.environ.get('ATS_CACHE_MAX_ENTRIES', '256'))
+
+# Optional memory-mapped world gazetteer (world_gazetteer.py): index file built
+# with `python world_gazetteer.py build places.tsv gazetteer.idx`; "" disables it
+WORLD_GAZETTEER_PATH = os.environ.get('ATS_WORLD_GAZETTEER', '')
+
+# Per-stage timings (instrumentation.py): log one JSON record per analysis to
+# stderr; the sidebar debug panel can also be switched on per session
+TIMINGS_ENABLED = os.environ.get('ATS_TIMINGS', '') == '1'
+
+# HTTP analysis service (api_server.py)
+SERVICE_HOST = os.environ.get('ATS_SERVICE_HOST', '127.0.0.1')
+SERVICE_PORT = int(os.environ.get('ATS_SERVICE_PORT', '8000'))
+SERVICE_WORKERS = int(os.environ.get('ATS_SERVICE_WORKERS', str(os.cpu_count() or 1)))
+SERVICE_MAX_CONCURRENCY = int(os.environ.get('ATS_SERVICE_MAX_CONCURRENCY', str(4 * SERVICE_WORKERS)))
+SERVICE_MAX_UPLOAD_BYTES = int(os.environ.get('ATS_SERVICE_MAX_UPLOAD_MB', '10')) * 1024 * 1024
+
+# Durable job queue for bulk analysis (job_queue.py)
+QUEUE_DB_PATH = os.environ.get('ATS_QUEUE_DB', 'ats_jobs.sqlite3')
+QUEUE_LEASE_SECONDS = float(os.environ.get('ATS_QUEUE_LEASE_SECONDS', '300'))
+QUEUE_MAX_ATTEMPTS = int(os.environ.get('ATS_QUEUE_MAX_ATTEMPTS', '3'))
+QUEUE_RETRY_DELAY_SECONDS = float(os.environ.get('ATS_QUEUE_RETRY_DELAY_SECONDS', '5'))
+QUEUE_POLL_SECONDS = float(os.environ.get('ATS_QUEUE_POLL_SECONDS', '1.0'))
+
+# Parsed documents stored by content hash (feature_store.py). Off by default
+# because it keeps resume text on disk; set ATS_FEATURE_STORE to a database
+# path to enable it. Rows unused for FEATURE_STORE_MAX_AGE_DAYS are deleted,
+# and the least recently used rows go once there are more than
+# FEATURE_STORE_MAX_ROWS (0 = no limit for either).
+FEATURE_STORE_PATH = os.environ.get('ATS_FEATURE_STORE', '')
+FEATURE_STORE_MAX_ROWS = int(os.environ.get('ATS_FEATURE_STORE_MAX_ROWS', '10000'))
+FEATURE_STORE_MAX_AGE_DAYS = float(os.environ.get('ATS_FEATURE_STORE_MAX_AGE_DAYS', '30'))
+
+# Inverted skill index for candidate queries (skill_index.py)
+SKILL_INDEX_PATH = os.environ.get('ATS_SKILL_INDEX', 'skill_index.bin')
+
 # Improvement potential settings
 IMPROVEMENT_POTENTIAL = {
     'section_missing': 8.0,           # Points gained by adding missing section
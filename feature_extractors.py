@@ -3,8 +3,20 @@ Feature extraction utilities
 Extracts skills, technologies, education, experience, location, and projects from text
 """
 
-import re
-from typing import Set, List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, Set, List, Tuple, Optional
+
+from config import (
+    IMPORTANT_KEYWORDS, EDUCATION_KEYWORDS, JOB_TYPE_KEYWORDS, SKILL_ALIASES, UNDETECTED_SKILL_ALIASES
+)
+from keyword_matcher import KeywordMatch, KeywordMatcher
+from patterns import (
+    EDUCATION_SECTION_PATTERN, EXPERIENCE_RANGE_PATTERN, EXPERIENCE_PLUS_PATTERN,
+    EXPERIENCE_SINGLE_PATTERN, PROJECT_SECTION_PATTERNS, DATE_RANGE_PATTERN, PROJECT_MARKER_PATTERN,
+    LOCATION_MARKER_PATTERNS, CITY_STATE_PATTERN, LOCATION_FILLER_PATTERN, WHITESPACE_PATTERN,
+    LOCATION_CONTEXT_PATTERN, HEADER_FIELD_SEPARATOR_PATTERN
+)
+from world_gazetteer import get_world_gazetteer, normalize_place
 
 
 # Common technology and skill sets
@@ -19,7 +31,8 @@ TECHNOLOGIES = {
     'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy',
     'rest', 'graphql', 'grpc', 'websockets', 'api',
     'jest', 'mocha', 'pytest', 'junit', 'selenium', 'cypress',
-    'webpack', 'babel', 'vite', 'rollup', 'prisma', 'sequelize', 'mongoose'
+    'webpack', 'babel', 'vite', 'rollup', 'prisma', 'sequelize', 'mongoose',
+    'terraform', 'ansible'
 }
 
 SOFT_SKILLS = {
@@ -28,67 +41,176 @@ SOFT_SKILLS = {
     'collaborative', 'initiative', 'critical-thinking', 'decision-making'
 }
 
+# Lexicon categories
+CATEGORY_TECHNOLOGY = 'technology'
+CATEGORY_SOFT_SKILL = 'soft_skill'
+CATEGORY_KEYWORD = 'keyword'
+CATEGORY_EDUCATION = 'education'
+CATEGORY_LOCATION = 'location'
+ROLE_CATEGORY_PREFIX = 'role:'
+
+# Location gazetteer, in priority order: when several entries occur in a
+# text, extract_location() reports the one listed first
+INDIAN_CITIES = [
+    'bangalore', 'bengaluru', 'mumbai', 'delhi', 'hyderabad', 'pune', 'chennai',
+    'kolkata', 'ahmedabad', 'jaipur', 'surat', 'lucknow', 'kanpur', 'nagpur',
+    'indore', 'thane', 'bhopal', 'visakhapatnam', 'vadodara', 'kochi', 'trivandrum',
+    'thiruvananthapuram', 'noida', 'gurgaon', 'gurugram'
+]
+
+GLOBAL_CITIES = [
+    'london', 'new york', 'san francisco', 'seattle', 'austin', 'boston',
+    'toronto', 'vancouver', 'sydney', 'melbourne', 'singapore', 'dubai',
+    'paris', 'berlin', 'amsterdam', 'tokyo', 'beijing', 'shanghai'
+]
+
+COUNTRIES = [
+    'india', 'usa', 'uk', 'united kingdom', 'united states', 'canada',
+    'australia', 'germany', 'france', 'singapore', 'uae', 'netherlands',
+    'japan', 'china', 'remote'
+]
+
+LOCATION_GAZETTEER = INDIAN_CITIES + GLOBAL_CITIES + COUNTRIES
+LOCATION_PRIORITY = {}
+for _priority, _location in enumerate(LOCATION_GAZETTEER):
+    LOCATION_PRIORITY.setdefault(_location, _priority)
+
+
+def build_lexicon() -> KeywordMatcher:
+    """Compile every keyword vocabulary into a single matcher"""
+    matcher = KeywordMatcher()
+    matcher.add_many(TECHNOLOGIES, CATEGORY_TECHNOLOGY)
+    matcher.add_many(SOFT_SKILLS, CATEGORY_SOFT_SKILL)
+    # Synonyms ("k8s", "reactjs") are reported as their canonical skill
+    for alias, canonical in SKILL_ALIASES.items():
+        if alias not in UNDETECTED_SKILL_ALIASES:
+            category = CATEGORY_SOFT_SKILL if canonical in SOFT_SKILLS else CATEGORY_TECHNOLOGY
+            matcher.add(alias, category, canonical=canonical)
+    matcher.add_many(IMPORTANT_KEYWORDS, CATEGORY_KEYWORD)
+    matcher.add_many(EDUCATION_KEYWORDS, CATEGORY_EDUCATION)
+    matcher.add_many(LOCATION_GAZETTEER, CATEGORY_LOCATION)
+    for role_type, keywords in JOB_TYPE_KEYWORDS.items():
+        matcher.add_many(keywords, ROLE_CATEGORY_PREFIX + role_type)
+    return matcher.build()
+
+
+# Compiled once at import; shared by every extractor below
+LEXICON = build_lexicon()
+
+# Skill, technology and role words are never read as places, even when the
+# world gazetteer lists them ("Java" the island, "Spring", "Ruby")
+NON_PLACE_TERMS = frozenset(
+    normalize_place(term)
+    for term in [*TECHNOLOGIES, *SOFT_SKILLS, *SKILL_ALIASES,
+                 *(keyword for keywords in JOB_TYPE_KEYWORDS.values() for keyword in keywords)]
+)
+
+
+@lru_cache(maxsize=8192)
+def _find_keywords_in_line(line: str) -> Tuple[KeywordMatch, ...]:
+    return tuple(LEXICON.find_all(line))
+
+
+@lru_cache(maxsize=8192)
+def _keywords_in_line(line: str) -> Tuple[Tuple[str, FrozenSet[str]], ...]:
+    grouped: Dict[str, Set[str]] = {}
+    for match in _find_keywords_in_line(line):
+        grouped.setdefault(match.category, set()).add(match.term)
+    return tuple((category, frozenset(terms)) for category, terms in grouped.items())
+
+
+# No lexicon term contains a newline, so every text is scanned line by line
+# and each line's hits are cached on their own: after an edit, only the
+# changed lines are scanned again.
+
+@lru_cache(maxsize=256)
+def find_keywords(text: str) -> Tuple[KeywordMatch, ...]:
+    """
+    Scan text once for every vocabulary term.
+    Results are cached because the same resume and job description are
+    scanned by several analyzers in one analysis.
+    """
+    if '\n' not in text:
+        return _find_keywords_in_line(text)
+
+    matches = []
+    offset = 0
+    for line in text.split('\n'):
+        for term, category, start, end in _find_keywords_in_line(line):
+            matches.append(KeywordMatch(term, category, start + offset, end + offset))
+        # Offsets are against the lowered text (see KeywordMatcher.find_all)
+        offset += (len(line) if line.isascii() else len(line.lower())) + 1
+    return tuple(matches)
+
+
+@lru_cache(maxsize=256)
+def _grouped_keywords(text: str) -> Dict[str, FrozenSet[str]]:
+    grouped: Dict[str, Set[str]] = {}
+    for line in text.split('\n'):
+        for category, terms in _keywords_in_line(line):
+            grouped.setdefault(category, set()).update(terms)
+    return {category: frozenset(terms) for category, terms in grouped.items()}
+
+
+def match_keywords(text: str) -> Dict[str, Set[str]]:
+    """Group the terms found in text by lexicon category"""
+    return {category: set(terms) for category, terms in _grouped_keywords(text).items()}
+
+
+def clear_keyword_caches():
+    """Drop every cached keyword scan (whole texts and single lines)"""
+    for cached in (find_keywords, _grouped_keywords, _find_keywords_in_line, _keywords_in_line):
+        cached.cache_clear()
+
 
 def normalize_skill(skill: str) -> str:
     """Normalize skill name for comparison"""
     skill = skill.lower().strip()
     
     # Handle common variations
-    variations = {
-        'reactjs': 'react',
-        'react.js': 'react',
-        'nodejs': 'node.js',
-        'node': 'node.js',
-        'nextjs': 'next.js',
-        'next': 'next.js',
-        'vuejs': 'vue',
-        'vue.js': 'vue',
-        'postgres': 'postgresql',
-        'mongo': 'mongodb',
-        'k8s': 'kubernetes',
-        'js': 'javascript',
-        'ts': 'typescript',
-        'py': 'python',
-    }
-    
-    return variations.get(skill, skill)
+    return SKILL_ALIASES.get(skill, skill)
 
 
 def extract_skills(text: str) -> Set[str]:
     """Extract skills from text"""
-    text_lower = text.lower()
-    found_skills = set()
-    
-    # Extract technologies
-    for tech in TECHNOLOGIES:
-        if tech in text_lower:
-            found_skills.add(tech)
-    
-    # Extract soft skills
-    for skill in SOFT_SKILLS:
-        if skill in text_lower:
-            found_skills.add(skill)
-    
-    return found_skills
+    found = match_keywords(text)
+    return found.get(CATEGORY_TECHNOLOGY, set()) | found.get(CATEGORY_SOFT_SKILL, set())
 
 
 def extract_technologies(text: str) -> Set[str]:
     """Extract only technical skills/technologies from text"""
-    text_lower = text.lower()
-    found_tech = set()
-    
-    for tech in TECHNOLOGIES:
-        if tech in text_lower:
-            found_tech.add(tech)
-    
-    return found_tech
+    return set(match_keywords(text).get(CATEGORY_TECHNOLOGY, set()))
+
+
+def extract_important_keywords(text: str) -> Set[str]:
+    """Extract the IMPORTANT_KEYWORDS present in text"""
+    return set(match_keywords(text).get(CATEGORY_KEYWORD, set()))
+
+
+def extract_education_keywords(text: str) -> Set[str]:
+    """Extract the EDUCATION_KEYWORDS present in text"""
+    return set(match_keywords(text).get(CATEGORY_EDUCATION, set()))
+
+
+def detect_role_types(text: str) -> List[str]:
+    """Every JOB_TYPE_KEYWORDS role with a hit in text, in config order"""
+    found = match_keywords(text)
+    return [role_type for role_type in JOB_TYPE_KEYWORDS if ROLE_CATEGORY_PREFIX + role_type in found]
+
+
+def detect_job_type(text: str) -> Optional[str]:
+    """
+    Detect the role type of a text.
+    Returns the first JOB_TYPE_KEYWORDS role (in config order) with a hit.
+    """
+    role_types = detect_role_types(text)
+    return role_types[0] if role_types else None
 
 
 def extract_education(text: str) -> str:
     """Extract education information from text"""
     # Look for education section
-    education_pattern = r'(?:education|qualification|academic|degree)(.*?)(?:experience|skills|projects|$)'
-    match = re.search(education_pattern, text.lower(), re.DOTALL)
+    match = EDUCATION_SECTION_PATTERN.search(text.lower())
     
     if match:
         return match.group(1).strip()
@@ -112,23 +234,20 @@ def extract_experience_years(text: str) -> Optional[Tuple[int, int]]:
         pass
     
     # Pattern for "X-Y years" (including 0-1)
-    range_pattern = r'(\d+)\s*-\s*(\d+)\s*(?:years?|yrs?)'
-    range_match = re.search(range_pattern, text_lower)
+    range_match = EXPERIENCE_RANGE_PATTERN.search(text_lower)
     if range_match:
         min_years = int(range_match.group(1))
         max_years = int(range_match.group(2))
         return (min_years, max_years)
     
     # Pattern for "X+ years"
-    plus_pattern = r'(\d+)\s*\+\s*(?:years?|yrs?)'
-    plus_match = re.search(plus_pattern, text_lower)
+    plus_match = EXPERIENCE_PLUS_PATTERN.search(text_lower)
     if plus_match:
         years = int(plus_match.group(1))
         return (years, 999)
     
     # Pattern for just "X year(s)" without + or range
-    single_pattern = r'\b(\d+)\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)\b'
-    single_match = re.search(single_pattern, text_lower)
+    single_match = EXPERIENCE_SINGLE_PATTERN.search(text_lower)
     if single_match:
         years = int(single_match.group(1))
         return (years, years)
@@ -136,6 +255,24 @@ def extract_experience_years(text: str) -> Optional[Tuple[int, int]]:
     return None
 
 
+def _location_context(text: str) -> str:
+    """
+    The lines the world gazetteer may read: address or contact lines and
+    "City, Region" pairs. The first line is usually the candidate's name
+    (or a job title), so only the fields after its first separator are kept.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if not lines:
+        return ''
+    header = HEADER_FIELD_SEPARATOR_PATTERN.split(lines[0], maxsplit=1)
+    context = [header[1]] if len(header) > 1 else []
+    context.extend(
+        line for line in lines[1:]
+        if LOCATION_CONTEXT_PATTERN.search(line) or CITY_STATE_PATTERN.search(line)
+    )
+    return '\n'.join(context)
+
+
 def extract_location(text: str) -> Optional[str]:
     """
     Extract location from text with improved accuracy.
@@ -144,29 +281,21 @@ def extract_location(text: str) -> Optional[str]:
     text_lower = text.lower()
     
     # First, try explicit location markers
-    location_patterns = [
-        r'location\s*:\s*([a-z][a-z\s,]+?)(?:\n|$|\||•|based)',
-        r'based\s+(?:in|at)\s+([a-z][a-z\s,]+?)(?:\n|$|\.|\|)',
-        r'office(?:s)?\s+(?:in|at)\s+([a-z][a-z\s,]+?)(?:\n|$|\.|\|)',
-        r'work\s+(?:from|in)\s+([a-z][a-z\s,]+?)(?:\n|$|\.|\|)',
-    ]
-    
-    for pattern in location_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in LOCATION_MARKER_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             location = match.group(1).strip()
             # Clean up
-            location = re.sub(r'\s+', ' ', location)
+            location = WHITESPACE_PATTERN.sub(' ', location)
             # Remove common non-location words
-            location = re.sub(r'\b(the|a|an|in|at|of|for|to|and|or|is|are|with)\b', '', location).strip()
+            location = LOCATION_FILLER_PATTERN.sub('', location).strip()
             
             # Validate it's actually a location (not too long, no technical terms)
             if 2 < len(location) < 40 and not any(tech in location for tech in ['developer', 'engineer', 'software', 'quality', 'devops']):
                 return location.title()
     
     # Look for common city patterns: "City, State/Country" or "City, XX"
-    city_state_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2,}|[A-Z][a-z]+)\b'
-    for match in re.finditer(city_state_pattern, text):
+    for match in CITY_STATE_PATTERN.finditer(text):
         city = match.group(1)
         state_country = match.group(2)
         
@@ -175,36 +304,20 @@ def extract_location(text: str) -> Optional[str]:
         if not any(tech in combined for tech in ['ltd', 'inc', 'llc', 'pvt', 'private', 'limited', 'corporation', 'technologies', 'solutions', 'systems']):
             return f"{city}, {state_country}"
     
-    # Look for specific well-known cities and countries
-    # Indian cities
-    indian_cities = [
-        'bangalore', 'bengaluru', 'mumbai', 'delhi', 'hyderabad', 'pune', 'chennai',
-        'kolkata', 'ahmedabad', 'jaipur', 'surat', 'lucknow', 'kanpur', 'nagpur',
-        'indore', 'thane', 'bhopal', 'visakhapatnam', 'vadodara', 'kochi', 'trivandrum',
-        'thiruvananthapuram', 'noida', 'gurgaon', 'gurugram'
-    ]
-    
-    # Global cities
-    global_cities = [
-        'london', 'new york', 'san francisco', 'seattle', 'austin', 'boston',
-        'toronto', 'vancouver', 'sydney', 'melbourne', 'singapore', 'dubai',
-        'paris', 'berlin', 'amsterdam', 'tokyo', 'beijing', 'shanghai'
-    ]
-    
-    # Countries
-    countries = [
-        'india', 'usa', 'uk', 'united kingdom', 'united states', 'canada',
-        'australia', 'germany', 'france', 'singapore', 'uae', 'netherlands',
-        'japan', 'china', 'remote'
-    ]
-    
-    all_locations = indian_cities + global_cities + countries
-    
-    for location in all_locations:
-        # Use word boundary to match whole words
-        pattern = r'\b' + re.escape(location) + r'\b'
-        if re.search(pattern, text_lower):
-            return location.title()
+    # Look for well-known cities and countries: the lexicon finds every
+    # gazetteer entry in the same single pass as the other vocabularies
+    found = match_keywords(text).get(CATEGORY_LOCATION)
+    if found:
+        return min(found, key=LOCATION_PRIORITY.__getitem__).title()
+    
+    # Fall back to the world gazetteer index, if one is configured. Its
+    # millions of names include given names and common words ("Jackson",
+    # "Mobile"), so only lines that look like an address are probed
+    world_gazetteer = get_world_gazetteer()
+    if world_gazetteer is not None:
+        entry = world_gazetteer.first_location(_location_context(text), exclude=NON_PLACE_TERMS)
+        if entry is not None:
+            return entry.name
     
     return None
 
@@ -215,13 +328,8 @@ def extract_projects(text: str) -> str:
     Returns the full projects section text.
     """
     # Look for projects section with various header formats
-    project_patterns = [
-        r'(?:^|\n)\s*projects?\s*(?:\n|:)(.*?)(?=\n\s*(?:experience|education|skills|certifications?|achievements?|$))',
-        r'(?:^|\n)\s*(?:key\s+)?projects?\s*(?:\n|:)(.*?)(?=\n\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*(?:\n|$))',
-    ]
-    
-    for pattern in project_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+    for pattern in PROJECT_SECTION_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
     
@@ -256,8 +364,7 @@ def count_projects(project_section: str) -> int:
             count += 1
     
     # Method 2: Count date ranges (MM/YYYY - MM/YYYY pattern)
-    date_pattern = r'\d{2}/\d{4}\s*-\s*\d{2}/\d{4}'
-    date_matches = re.findall(date_pattern, project_section)
+    date_matches = DATE_RANGE_PATTERN.findall(project_section)
     if len(date_matches) > count:
         count = len(date_matches)
     
@@ -279,7 +386,7 @@ def count_projects(project_section: str) -> int:
         count = bullet_groups
     
     # Method 4: Count explicit "Project:" markers
-    explicit_projects = len(re.findall(r'(?:^|\n)\s*(?:project\s*:|\d+\.)', project_section, re.IGNORECASE))
+    explicit_projects = len(PROJECT_MARKER_PATTERN.findall(project_section))
     if explicit_projects > count:
         count = explicit_projects
     
@@ -0,0 +1,347 @@
+"""
+Persistent feature store
+Keeps parsed resumes and job postings in SQLite, so re-scoring a document
+against a new posting (or after a SCORE_WEIGHTS change) skips extraction
+
+Rows are keyed by a hash of the document text plus the extractor version.
+The version covers the extraction code and every vocabulary it matches
+against, so changing a keyword list or alias invalidates old rows instead
+of serving stale features. The text and its cleaned form are stored
+zlib-compressed; every other profile field is stored as JSON.
+
+The store holds personal data, so it is off unless ATS_FEATURE_STORE is set,
+and bounded when on: rows not used for FEATURE_STORE_MAX_AGE_DAYS are
+deleted, and the least recently used rows are evicted once the table holds
+more than FEATURE_STORE_MAX_ROWS.
+
+PDF parsing itself is cached by content hash in pdf_cache, so a re-run
+over the same PDFs skips both parsing and extraction.
+
+Usage:
+    python feature_store.py stats
+    python feature_store.py purge     # delete stale-version and expired rows
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import typing
+import zlib
+from dataclasses import fields
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from config import (
+    EDUCATION_KEYWORDS, FEATURE_STORE_MAX_AGE_DAYS, FEATURE_STORE_MAX_ROWS, FEATURE_STORE_PATH,
+    IMPORTANT_KEYWORDS, JOB_TYPE_KEYWORDS, SKILL_ALIASES, UNDETECTED_SKILL_ALIASES, WORLD_GAZETTEER_PATH
+)
+from instrumentation import stage
+
+logger = logging.getLogger('ats.feature_store')
+
+# Bump when the stored record layout or any feature extractor changes behavior
+FEATURES_VERSION = 4
+
+KIND_RESUME = 'resume'
+KIND_JOB = 'job'
+
+# Fields stored compressed rather than in the features JSON
+_TEXT_FIELDS = ('text', 'processed')
+
+# Evict down to this fraction of the row limit so eviction is not re-run on every write
+EVICTION_LOW_WATER = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    content_hash TEXT NOT NULL,
+    extractor_version TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    text BLOB NOT NULL,
+    processed BLOB NOT NULL,
+    features TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (content_hash, extractor_version, kind)
+);
+CREATE INDEX IF NOT EXISTS documents_last_used ON documents (last_used_at);
+"""
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of the document text"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def extractor_version() -> str:
+    """
+    Version tag for stored features: FEATURES_VERSION, the PDF extractor
+    version and a digest of every vocabulary the extractors use.
+    """
+    from feature_extractors import LOCATION_GAZETTEER, SOFT_SKILLS, TECHNOLOGIES
+    from skill_taxonomy import TAXONOMY
+    from text_extractors import EXTRACTOR_VERSION
+
+    gazetteer = None
+    if WORLD_GAZETTEER_PATH and os.path.exists(WORLD_GAZETTEER_PATH):
+        stat = os.stat(WORLD_GAZETTEER_PATH)
+        gazetteer = [stat.st_size, stat.st_mtime_ns]
+
+    vocabularies = json.dumps([
+        sorted(TECHNOLOGIES), sorted(SOFT_SKILLS), IMPORTANT_KEYWORDS, EDUCATION_KEYWORDS,
+        JOB_TYPE_KEYWORDS, SKILL_ALIASES, sorted(UNDETECTED_SKILL_ALIASES), LOCATION_GAZETTEER, TAXONOMY.skills,
+        gazetteer
+    ], sort_keys=True)
+    digest = hashlib.sha256(vocabularies.encode('utf-8')).hexdigest()[:16]
+    return f"{FEATURES_VERSION}:{EXTRACTOR_VERSION}:{digest}"
+
+
+def _frozenset_fields(profile_class):
+    return {f.name for f in fields(profile_class) if typing.get_origin(f.type) is frozenset}
+
+
+def profile_to_record(profile) -> Tuple[bytes, bytes, str]:
+    """
+    Serialize a JobProfile or ResumeProfile.
+
+    Returns:
+        tuple: (compressed text, compressed processed text, features JSON)
+    """
+    features = {}
+    for f in fields(profile):
+        if f.name in _TEXT_FIELDS:
+            continue
+        value = getattr(profile, f.name)
+        features[f.name] = sorted(value) if isinstance(value, frozenset) else value
+    return (
+        zlib.compress(profile.text.encode('utf-8')),
+        zlib.compress(profile.processed.encode('utf-8')),
+        json.dumps(features, ensure_ascii=False)
+    )
+
+
+def profile_from_record(profile_class, text: bytes, processed: bytes, features: str):
+    """Rebuild a profile written by profile_to_record()"""
+    values = json.loads(features)
+    for name in _frozenset_fields(profile_class):
+        values[name] = frozenset(values[name])
+    for name, value in values.items():
+        if isinstance(value, list):
+            values[name] = tuple(value)
+    return profile_class(
+        text=zlib.decompress(text).decode('utf-8'),
+        processed=zlib.decompress(processed).decode('utf-8'),
+        **values
+    )
+
+
+class FeatureStore:
+    """
+    Parsed documents stored in one SQLite database.
+
+    Safe to share between threads and processes: each thread (and each
+    forked worker) opens its own connection, and WAL mode lets readers run
+    alongside a writer.
+    """
+
+    def __init__(self, db_path=FEATURE_STORE_PATH, max_rows=FEATURE_STORE_MAX_ROWS,
+                 max_age_days=FEATURE_STORE_MAX_AGE_DAYS):
+        self.db_path = db_path
+        self.max_rows = max_rows
+        self.max_age_seconds = max_age_days * 86400
+        self._approx_rows = None
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connection()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(documents)")}
+        if columns and 'last_used_at' not in columns:
+            # Databases written before rows were aged out
+            with conn:
+                conn.execute("ALTER TABLE documents ADD COLUMN last_used_at REAL NOT NULL DEFAULT 0")
+                conn.execute("UPDATE documents SET last_used_at = created_at")
+        conn.executescript(_SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+    def get(self, profile_class, kind: str, text: str):
+        """Return the stored profile for a text (refreshing its last use), or None on a miss"""
+        conn = self._connection()
+        key = (content_hash(text), extractor_version(), kind)
+        row = conn.execute(
+            "SELECT text, processed, features, last_used_at FROM documents "
+            "WHERE content_hash = ? AND extractor_version = ? AND kind = ?",
+            key
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if self.max_age_seconds > 0 and row[3] < now - self.max_age_seconds:
+            return None  # Expired; extract again and overwrite it
+        try:
+            profile = profile_from_record(profile_class, *row[:3])
+        except (ValueError, TypeError, KeyError, zlib.error):
+            return None  # Unreadable row; extract again and overwrite it
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE documents SET last_used_at = ? "
+                    "WHERE content_hash = ? AND extractor_version = ? AND kind = ?",
+                    (now, *key)
+                )
+        except sqlite3.Error as e:
+            logger.warning("Feature store update failed: %s", e)
+        return profile
+
+    def put(self, kind: str, profile):
+        """Store a profile (replacing any row with the same key), evicting old rows if over budget"""
+        conn = self._connection()
+        now = time.time()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO documents "
+                "(content_hash, extractor_version, kind, text, processed, features, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (content_hash(profile.text), extractor_version(), kind, *profile_to_record(profile), now, now)
+            )
+
+        if self.max_rows <= 0:
+            return
+        if self._approx_rows is None:
+            self._approx_rows = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        else:
+            self._approx_rows += 1
+        if self._approx_rows > self.max_rows:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Delete expired rows, then the least recently used rows until the table
+        is under the low-water mark. Returns the number of rows deleted.
+        """
+        conn = self._connection()
+        deleted = 0
+        with conn:
+            if self.max_age_seconds > 0:
+                deleted += conn.execute(
+                    "DELETE FROM documents WHERE last_used_at < ?", (time.time() - self.max_age_seconds,)
+                ).rowcount
+            rows = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            if self.max_rows > 0 and rows > self.max_rows:
+                excess = rows - int(self.max_rows * EVICTION_LOW_WATER)
+                deleted += conn.execute(
+                    "DELETE FROM documents WHERE rowid IN "
+                    "(SELECT rowid FROM documents ORDER BY last_used_at LIMIT ?)",
+                    (excess,)
+                ).rowcount
+                rows -= excess
+        self._approx_rows = rows
+        return deleted
+
+    def _load_or_build(self, profile_class, kind, text):
+        with stage('feature_store.get'):
+            profile = self.get(profile_class, kind, text)
+        if profile is None:
+            profile = profile_class.from_text(text)
+            try:
+                with stage('feature_store.put'):
+                    self.put(kind, profile)
+            except sqlite3.Error as e:
+                logger.warning("Feature store write failed: %s", e)
+        return profile
+
+    def resume_profile(self, resume_text: str):
+        """Stored ResumeProfile for a resume, extracted and stored on a miss"""
+        from profiles import ResumeProfile
+        return self._load_or_build(ResumeProfile, KIND_RESUME, resume_text)
+
+    def job_profile(self, job_description: str):
+        """Stored JobProfile for a job description, extracted and stored on a miss"""
+        from profiles import JobProfile
+        return self._load_or_build(JobProfile, KIND_JOB, job_description)
+
+    def stats(self) -> Dict[str, object]:
+        """Row counts per kind for the current extractor version, plus stale rows and file size"""
+        conn = self._connection()
+        version = extractor_version()
+        counts = dict(conn.execute(
+            "SELECT kind, COUNT(*) FROM documents WHERE extractor_version = ? GROUP BY kind", (version,)
+        ).fetchall())
+        stale = conn.execute("SELECT COUNT(*) FROM documents WHERE extractor_version != ?", (version,)).fetchone()[0]
+        return {
+            'extractor_version': version,
+            'resumes': counts.get(KIND_RESUME, 0),
+            'jobs': counts.get(KIND_JOB, 0),
+            'stale': stale,
+            'bytes': os.path.getsize(self.db_path)
+        }
+
+    def purge_stale(self) -> int:
+        """Delete rows written by other extractor versions, plus expired rows; returns the number deleted"""
+        conn = self._connection()
+        with conn:
+            deleted = conn.execute(
+                "DELETE FROM documents WHERE extractor_version != ?", (extractor_version(),)
+            ).rowcount
+        deleted += self.evict()
+        conn.execute("VACUUM")
+        return deleted
+
+
+@lru_cache(maxsize=1)
+def get_feature_store() -> Optional[FeatureStore]:
+    """Return the process-wide feature store, or None when disabled"""
+    if not FEATURE_STORE_PATH:
+        return None
+    try:
+        return FeatureStore(FEATURE_STORE_PATH)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Feature store disabled: %s", e)
+        return None
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Inspect or clean the feature store.")
+    parser.add_argument('--db', default=FEATURE_STORE_PATH, help=f"Database file (default: {FEATURE_STORE_PATH})")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('stats', help="Show stored document counts")
+    commands.add_parser('purge', help="Delete rows from older extractor versions and expired rows")
+    args = parser.parse_args(argv)
+
+    if not args.db:
+        print("Feature store is disabled (set ATS_FEATURE_STORE or --db)", file=sys.stderr)
+        return 1
+
+    store = FeatureStore(args.db)
+    if args.command == 'stats':
+        print(json.dumps(store.stats(), indent=2))
+    else:
+        print(f"Deleted {store.purge_stale()} stale rows")
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Incremental re-analysis
+Re-runs only the parts of an analysis whose inputs changed, for users who
+edit a resume or job description and analyze again
+
+Two cache layers make the cost of a re-analysis follow the size of the edit:
+- feature_extractors caches the keyword scan per line, and
+  text_extractors.preprocess_text the cleaned text per line, so parsing an
+  edited document only reprocesses the lines that changed
+- IncrementalAnalyzer memoizes each section analyzer under the profile
+  fields it reads (SECTION_INPUTS): after an edit to the location line,
+  analyze_location_section is the only analyzer that runs again
+
+TF-IDF similarity depends on the whole cleaned text of both documents. It is
+memoized per text pair and re-runs after any text edit.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from instrumentation import timed
+from profiles import as_job_profile, as_resume_profile
+from section_analyzer import SECTION_ANALYZERS, build_section_profiles, fallback_sections, run_section_analyzer
+from similarity_calculator import calculate_expected_score, combine_similarity, tfidf_similarity
+
+# Profile fields each SECTION_ANALYZERS entry reads: (resume, job, willing_to_relocate) -> memo key
+SECTION_INPUTS = {
+    'skills': lambda resume, job, relocate: (
+        resume.skill_bits, resume.tech_bits, job.skill_bits, job.tech_bits
+    ),
+    'projects': lambda resume, job, relocate: (
+        resume.projects, resume.project_count, resume.project_tech_bits,
+        # The full text is only scanned for project indicators when no projects were found
+        resume.text if resume.project_count == 0 else None,
+        job.skill_bits, job.tech_bits, job.job_type
+    ),
+    'experience': lambda resume, job, relocate: (resume.experience_years, job.experience_years),
+    'education': lambda resume, job, relocate: (
+        resume.education, resume.education_keywords, job.education, job.education_requirements
+    ),
+    'location': lambda resume, job, relocate: (resume.location, job.location, relocate),
+    'keywords': lambda resume, job, relocate: (resume.important_keywords, job.important_keywords),
+}
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class IncrementalAnalyzer:
+    """
+    Section analysis and TF-IDF results memoized under their inputs.
+
+    One instance can serve many users and threads; the memo is a bounded
+    LRU shared by all of them.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._memo)
+
+    def clear(self):
+        with self._lock:
+            self._memo.clear()
+
+    def _memoized(self, key, compute):
+        """Return (value, computed) for a memo key, computing and storing it on a miss"""
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                self.hits += 1
+                return self._memo[key], False
+
+        value = compute()
+
+        with self._lock:
+            self.misses += 1
+            self._memo[key] = value
+            while len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
+        return value, True
+
+    @timed('analyze_sections')
+    def analyze_sections(self, resume_text, job_description, willing_to_relocate=None):
+        """
+        Same result as section_analyzer.analyze_sections(), re-running only
+        the analyzers whose inputs changed since an earlier call.
+
+        Args:
+            resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+            job_description (str or JobProfile): Job description text or its prebuilt profile
+            willing_to_relocate (bool or None): User's relocation preference
+
+        Returns:
+            tuple: (sections list, names of the SECTION_ANALYZERS that ran)
+        """
+        profiles = build_section_profiles(resume_text, job_description)
+        if profiles is None:
+            return fallback_sections(), list(SECTION_ANALYZERS)
+        resume, job = profiles
+
+        sections = []
+        recomputed = []
+        for name in SECTION_ANALYZERS:
+            key = (name, SECTION_INPUTS[name](resume, job, willing_to_relocate))
+            section, computed = self._memoized(
+                key, lambda: run_section_analyzer(name, resume, job, willing_to_relocate)
+            )
+            if computed:
+                recomputed.append(name)
+            # Copy so callers cannot alter the memoized result
+            sections.append(dict(section))
+        return sections, recomputed
+
+    def tfidf_similarity(self, resume_text, job_description):
+        """Raw TF-IDF similarity, memoized per pair of cleaned texts"""
+        resume = as_resume_profile(resume_text)
+        job = as_job_profile(job_description)
+        value, _ = self._memoized(
+            ('tfidf', resume.processed, job.processed),
+            lambda: float(tfidf_similarity(resume.processed, job.processed))
+        )
+        return value
+
+    def analyze(self, resume_text, job_description, willing_to_relocate=None):
+        """
+        Incremental counterpart of pipeline.analyze_resume().
+
+        Returns:
+            dict: score, expected_score, potential_gain, sections and
+                  'recomputed', the section analyzers that had to run
+        """
+        resume = as_resume_profile(resume_text)
+        job = as_job_profile(job_description)
+        sections, recomputed = self.analyze_sections(resume, job, willing_to_relocate)
+        score = combine_similarity(self.tfidf_similarity(resume, job), resume, job, sections)
+        expected_score, potential_gain = calculate_expected_score(score, sections)
+
+        return {
+            'score': score,
+            'expected_score': expected_score,
+            'potential_gain': potential_gain,
+            'sections': sections,
+            'recomputed': recomputed
+        }
+
+
+@lru_cache(maxsize=1)
+def get_incremental_analyzer() -> IncrementalAnalyzer:
+    """Return the process-wide analyzer"""
+    return IncrementalAnalyzer()
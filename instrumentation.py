@@ -0,0 +1,155 @@
+"""
+Per-stage latency instrumentation
+Timing hooks for the analysis pipeline, collected per request
+
+Hooks only record while a collector is active in the current context
+(collect_timings()); otherwise they cost one ContextVar lookup.
+
+    with collect_timings() as timings:
+        run_analysis(...)
+    timings.as_dict()   # {'pdf_extraction': 12.3, 'analyze_skills_section': 0.02, ...} in ms
+"""
+
+import json
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+logger = logging.getLogger('ats.timings')
+
+_active = ContextVar('ats_request_timings', default=None)
+
+
+class RequestTimings:
+    """Stage timings recorded during one request, in the order stages finished"""
+
+    def __init__(self, request_id=None):
+        self.request_id = request_id or uuid.uuid4().hex[:12]
+        self.records = []
+        self.started = time.perf_counter()
+        self.total = None
+
+    def record(self, name, seconds):
+        self.records.append((name, seconds))
+
+    def as_dict(self):
+        """Milliseconds per stage; repeated stages are summed"""
+        totals = {}
+        for name, seconds in self.records:
+            totals[name] = totals.get(name, 0.0) + seconds * 1000
+        return {name: round(ms, 3) for name, ms in totals.items()}
+
+    def to_record(self):
+        """Structured log payload"""
+        return {
+            'request_id': self.request_id,
+            'total_ms': round((self.total or 0.0) * 1000, 3),
+            'stages': self.as_dict()
+        }
+
+
+class _Stage:
+    __slots__ = ('timings', 'name', 'start')
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timings.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name):
+    """
+    Time a block of code as a named stage.
+
+    Args:
+        name (str): Stage name, e.g. 'similarity.tfidf'
+
+    Returns:
+        Context manager (a shared no-op when no collector is active)
+    """
+    timings = _active.get()
+    if timings is None:
+        return _NULL_STAGE
+    return _Stage(timings, name)
+
+
+def timed(name=None):
+    """
+    Decorator that times every call of a function as a stage.
+
+    Args:
+        name (str, optional): Stage name (defaults to the function name)
+    """
+    def decorator(func):
+        stage_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timings = _active.get()
+            if timings is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.record(stage_name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def collect_timings(request_id=None, log=True):
+    """
+    Collect stage timings for everything run inside the block.
+
+    Args:
+        request_id (str, optional): Identifier for the log record
+        log (bool): Emit a structured 'ats.timings' log record on exit
+
+    Yields:
+        RequestTimings: The collector (complete once the block exits)
+    """
+    timings = RequestTimings(request_id)
+    token = _active.set(timings)
+    try:
+        yield timings
+    finally:
+        _active.reset(token)
+        timings.total = time.perf_counter() - timings.started
+        if log:
+            record = timings.to_record()
+            logger.info(json.dumps(record), extra={'timings': record})
+
+
+def enable_timing_logs(level=logging.INFO):
+    """Print 'ats.timings' records to stderr (one JSON object per request)"""
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+    logger.setLevel(level)
@@ -0,0 +1,52 @@
+"""
+One-resume-versus-many-jobs matching
+Scores a single resume against a collection of job postings in one pass
+"""
+
+from profiles import as_job_profile, as_resume_profile
+from section_analyzer import analyze_sections
+from similarity_calculator import (
+    tfidf_similarities, combine_similarity, calculate_expected_score
+)
+
+
+def match_resume_to_jobs(resume_text, job_descriptions, willing_to_relocate=None):
+    """
+    Score one resume against many job postings.
+
+    The resume is parsed once, every posting is parsed once, and n-grams are
+    counted in one pass instead of refitting a vectorizer per posting. Each
+    posting scores the same as it would in a single-pair analysis.
+
+    Args:
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_descriptions (list): Job description texts or JobProfiles
+        willing_to_relocate (bool or None): User's relocation preference
+
+    Returns:
+        list: One dict per posting (index, score, expected_score,
+              potential_gain, tfidf, sections), sorted by score, best first
+    """
+    resume = as_resume_profile(resume_text)
+    jobs = [as_job_profile(job) for job in job_descriptions]
+    if not jobs:
+        return []
+
+    raw_scores = tfidf_similarities(resume.processed, [job.processed for job in jobs])
+
+    results = []
+    for index, (job, raw_tfidf) in enumerate(zip(jobs, raw_scores)):
+        sections = analyze_sections(resume, job, willing_to_relocate)
+        score = combine_similarity(float(raw_tfidf), resume, job, sections)
+        expected_score, potential_gain = calculate_expected_score(score, sections)
+        results.append({
+            'index': index,
+            'score': score,
+            'expected_score': expected_score,
+            'potential_gain': potential_gain,
+            'tfidf': round(float(raw_tfidf), 4),
+            'sections': sections
+        })
+
+    results.sort(key=lambda r: r['score'], reverse=True)
+    return results
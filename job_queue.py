@@ -0,0 +1,586 @@
+"""
+Durable job queue for bulk resume analysis
+SQLite-backed: submit a batch of resume PDFs, let workers analyze them and
+poll or follow progress and results, with no external broker
+
+Usage:
+    python job_queue.py submit job_description.txt resumes/ [--relocate yes|no]
+    python job_queue.py work --processes 4 [--exit-when-idle]
+    python job_queue.py status BATCH_ID [--follow]
+    python job_queue.py results BATCH_ID [--json]
+
+Job states:
+    queued   waiting for a worker (or for its retry delay to pass)
+    running  leased by a worker until lease_expires (renewed while it works)
+    done     analyzed; the result is stored as JSON
+    dead     dead-lettered: unparseable PDF, or out of attempts
+"""
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from multiprocessing import Process
+from typing import NamedTuple, Optional
+
+from config import (
+    PDF_MAX_UPLOAD_BYTES, QUEUE_DB_PATH, QUEUE_LEASE_SECONDS, QUEUE_MAX_ATTEMPTS, QUEUE_RETRY_DELAY_SECONDS,
+    QUEUE_POLL_SECONDS
+)
+from pipeline import analyze_pdf_bytes
+from text_extractors import PdfExtractionError
+from upload_spool import UploadTooLargeError
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_DEAD = 'dead'
+STATUSES = (STATUS_QUEUED, STATUS_RUNNING, STATUS_DONE, STATUS_DEAD)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    job_description TEXT NOT NULL,
+    willing_to_relocate INTEGER,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id TEXT NOT NULL REFERENCES batches(id),
+    name TEXT NOT NULL,
+    pdf BLOB,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs(status, available_at);
+CREATE INDEX IF NOT EXISTS jobs_by_batch ON jobs(batch_id, status);
+"""
+
+
+class Job(NamedTuple):
+    """A leased job as handed to a worker"""
+    id: int
+    batch_id: str
+    name: str
+    pdf: bytes
+    attempts: int
+    job_description: str
+    willing_to_relocate: Optional[bool]
+
+
+class JobQueue:
+    """
+    Job queue stored in one SQLite database.
+
+    Any number of worker processes can share the database file. A worker
+    claims a job by taking a lease and renews it while the analysis runs; if
+    the worker dies, the lease expires and the job goes back to the queue (or to the dead-letter state once it
+    has used up its attempts). Completing or failing a job only succeeds for
+    the worker that still holds the lease, so a job whose lease was taken
+    over is never recorded twice.
+
+    PDFs larger than max_upload_bytes (0 = no limit) are refused at submit time.
+    """
+
+    def __init__(self, db_path=QUEUE_DB_PATH, lease_seconds=QUEUE_LEASE_SECONDS,
+                 max_attempts=QUEUE_MAX_ATTEMPTS, retry_delay=QUEUE_RETRY_DELAY_SECONDS,
+                 max_upload_bytes=PDF_MAX_UPLOAD_BYTES):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_upload_bytes = max_upload_bytes
+
+        # Autocommit mode; write transactions are opened explicitly with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def _write(self):
+        """Serialize writers across processes and roll back on error"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def _check_size(self, name, size):
+        if self.max_upload_bytes > 0 and size > self.max_upload_bytes:
+            raise UploadTooLargeError(f"{name} is {size} bytes; the limit is {self.max_upload_bytes} bytes")
+
+    def submit_batch(self, job_description, resumes, willing_to_relocate=None):
+        """
+        Queue a batch of resumes for analysis against one job description.
+        The batch is stored all or nothing.
+
+        Args:
+            job_description (str): Job description text
+            resumes (iterable): (name, pdf_bytes) pairs
+            willing_to_relocate (bool or None): Relocation preference for every resume
+
+        Returns:
+            str: Batch ID
+
+        Raises:
+            UploadTooLargeError: If a PDF exceeds max_upload_bytes
+        """
+        batch_id = uuid.uuid4().hex
+        now = time.time()
+        relocate = None if willing_to_relocate is None else int(willing_to_relocate)
+
+        with self._write() as conn:
+            conn.execute(
+                "INSERT INTO batches (id, job_description, willing_to_relocate, created_at) VALUES (?, ?, ?, ?)",
+                (batch_id, job_description, relocate, now)
+            )
+            conn.executemany(
+                "INSERT INTO jobs (batch_id, name, pdf, available_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                ((batch_id, name, pdf_bytes, now, now) for name, pdf_bytes in self._sized(resumes))
+            )
+        return batch_id
+
+    def _sized(self, resumes):
+        for name, pdf_bytes in resumes:
+            self._check_size(name, len(pdf_bytes))
+            yield name, pdf_bytes
+
+    def submit_files(self, job_description, paths, willing_to_relocate=None):
+        """
+        Queue resume PDFs from disk; the bytes are copied into the queue.
+        Every file is size-checked before any of them is read.
+
+        Raises:
+            UploadTooLargeError: If a file exceeds max_upload_bytes
+        """
+        paths = list(paths)
+        for path in paths:
+            self._check_size(path, os.path.getsize(path))
+
+        def read_files():
+            for path in paths:
+                with open(path, 'rb') as f:
+                    yield path, f.read()
+
+        return self.submit_batch(job_description, read_files(), willing_to_relocate)
+
+    def claim(self, worker_id):
+        """
+        Lease the oldest available job.
+
+        Expired leases are reclaimed first, so jobs held by crashed workers
+        are retried (or dead-lettered once out of attempts).
+
+        Returns:
+            Job or None: The leased job, or None if nothing is available
+        """
+        now = time.time()
+        with self._write() as conn:
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = CASE WHEN attempts >= ? THEN 'dead' ELSE 'queued' END,
+                    error = 'Lease expired (worker stopped or timed out)',
+                    lease_owner = NULL, lease_expires = NULL, available_at = ?, updated_at = ?
+                WHERE status = 'running' AND lease_expires <= ?
+                """,
+                (self.max_attempts, now, now, now)
+            )
+            row = conn.execute(
+                """
+                SELECT jobs.id, jobs.batch_id, jobs.name, jobs.pdf, jobs.attempts,
+                       batches.job_description, batches.willing_to_relocate
+                FROM jobs JOIN batches ON batches.id = jobs.batch_id
+                WHERE jobs.status = 'queued' AND jobs.available_at <= ?
+                ORDER BY jobs.id
+                LIMIT 1
+                """,
+                (now,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'running', attempts = attempts + 1,
+                    lease_owner = ?, lease_expires = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (worker_id, now + self.lease_seconds, now, row['id'])
+            )
+
+        relocate = row['willing_to_relocate']
+        return Job(
+            row['id'], row['batch_id'], row['name'], row['pdf'], row['attempts'] + 1,
+            row['job_description'], None if relocate is None else bool(relocate)
+        )
+
+    def complete(self, job, worker_id, result):
+        """
+        Store a job's result. The PDF bytes are dropped once analyzed.
+
+        Returns:
+            bool: False if the worker no longer held the lease
+        """
+        now = time.time()
+        with self._write() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'done', result = ?, error = NULL, pdf = NULL,
+                    lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE id = ? AND status = 'running' AND lease_owner = ?
+                """,
+                (json.dumps(result, ensure_ascii=False), now, job.id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def renew(self, job, worker_id):
+        """
+        Extend a running job's lease by lease_seconds from now.
+
+        Returns:
+            bool: False if the worker no longer held the lease
+        """
+        now = time.time()
+        with self._write() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET lease_expires = ?, updated_at = ?
+                WHERE id = ? AND status = 'running' AND lease_owner = ?
+                """,
+                (now + self.lease_seconds, now, job.id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job, worker_id, error, permanent=False):
+        """
+        Record a failed attempt.
+
+        Permanent failures and jobs out of attempts are dead-lettered; other
+        jobs are requeued after an exponential retry delay.
+
+        Returns:
+            bool: False if the worker no longer held the lease
+        """
+        now = time.time()
+        dead = permanent or job.attempts >= self.max_attempts
+        retry_at = now + self.retry_delay * (2 ** (job.attempts - 1))
+
+        with self._write() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs
+                SET status = ?, error = ?, available_at = ?,
+                    lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE id = ? AND status = 'running' AND lease_owner = ?
+                """,
+                (STATUS_DEAD if dead else STATUS_QUEUED, str(error), retry_at, now, job.id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def requeue_dead(self, batch_id):
+        """Give dead-lettered jobs of a batch a fresh set of attempts"""
+        now = time.time()
+        with self._write() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET status = 'queued', attempts = 0, available_at = ?, updated_at = ?
+                WHERE batch_id = ? AND status = 'dead' AND pdf IS NOT NULL
+                """,
+                (now, now, batch_id)
+            )
+        return cursor.rowcount
+
+    def batch_status(self, batch_id):
+        """
+        Progress of a batch.
+
+        Returns:
+            dict or None: Job counts per status, total and finished flag
+                (None if the batch does not exist)
+        """
+        if self.conn.execute("SELECT 1 FROM batches WHERE id = ?", (batch_id,)).fetchone() is None:
+            return None
+
+        counts = dict.fromkeys(STATUSES, 0)
+        for row in self.conn.execute(
+            "SELECT status, COUNT(*) AS n FROM jobs WHERE batch_id = ? GROUP BY status", (batch_id,)
+        ):
+            counts[row['status']] = row['n']
+
+        total = sum(counts.values())
+        return {
+            'batch_id': batch_id,
+            'total': total,
+            **counts,
+            'finished': counts[STATUS_DONE] + counts[STATUS_DEAD] == total
+        }
+
+    def follow_batch(self, batch_id, poll_seconds=QUEUE_POLL_SECONDS):
+        """Yield batch_status() every time it changes, until the batch is finished"""
+        last = None
+        while True:
+            status = self.batch_status(batch_id)
+            if status is None:
+                return
+            if status != last:
+                yield status
+                last = status
+            if status['finished']:
+                return
+            time.sleep(poll_seconds)
+
+    def batch_results(self, batch_id):
+        """
+        Per-job outcome of a batch, in submission order.
+
+        Returns:
+            list: dicts with id, name, status, attempts, result and error
+        """
+        rows = self.conn.execute(
+            "SELECT id, name, status, attempts, result, error FROM jobs WHERE batch_id = ? ORDER BY id",
+            (batch_id,)
+        )
+        return [
+            {
+                'id': row['id'],
+                'name': row['name'],
+                'status': row['status'],
+                'attempts': row['attempts'],
+                'result': json.loads(row['result']) if row['result'] else None,
+                'error': row['error']
+            }
+            for row in rows
+        ]
+
+
+@contextmanager
+def lease_heartbeat(queue, job, worker_id, interval=None):
+    """
+    Renew a job's lease from a background thread while the block runs,
+    so analyses that take longer than lease_seconds are not reclaimed.
+
+    Args:
+        queue (JobQueue): Queue the job was claimed from
+        job (Job): The leased job
+        worker_id (str): Lease owner
+        interval (float, optional): Seconds between renewals (defaults to a third of the lease)
+    """
+    interval = queue.lease_seconds / 3 if interval is None else interval
+    stop = threading.Event()
+
+    def beat():
+        # SQLite connections cannot be shared across threads
+        renewer = JobQueue(queue.db_path, lease_seconds=queue.lease_seconds)
+        try:
+            while not stop.wait(interval):
+                try:
+                    if not renewer.renew(job, worker_id):
+                        return
+                except sqlite3.Error:
+                    # Busy database: try again on the next beat
+                    continue
+        finally:
+            renewer.close()
+
+    thread = threading.Thread(target=beat, name=f"lease-{job.id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def process_job(queue, job, worker_id):
+    """
+    Analyze one leased job and record the outcome.
+    PDFs that cannot be parsed or exceed the upload size limit are
+    dead-lettered right away; any other error is retried.
+    """
+    try:
+        # Workers are already separate processes: extract pages serially
+        with lease_heartbeat(queue, job, worker_id):
+            result = analyze_pdf_bytes(job.pdf, job.job_description, job.willing_to_relocate,
+                                       extract_workers=1)
+    except (PdfExtractionError, UploadTooLargeError) as e:
+        queue.fail(job, worker_id, e, permanent=True)
+        return False
+    except Exception as e:
+        queue.fail(job, worker_id, f"{type(e).__name__}: {e}")
+        return False
+
+    return queue.complete(job, worker_id, result)
+
+
+def run_worker(db_path=QUEUE_DB_PATH, worker_id=None, poll_seconds=QUEUE_POLL_SECONDS,
+               exit_when_idle=False, max_jobs=None):
+    """
+    Pull and process jobs until stopped.
+
+    Args:
+        db_path (str): Queue database
+        worker_id (str, optional): Lease owner name (defaults to host:pid)
+        poll_seconds (float): Sleep between polls when the queue is empty
+        exit_when_idle (bool): Return once no job is available
+        max_jobs (int, optional): Return after this many jobs
+
+    Returns:
+        int: Number of jobs processed
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    queue = JobQueue(db_path)
+    processed = 0
+
+    try:
+        while max_jobs is None or processed < max_jobs:
+            job = queue.claim(worker_id)
+            if job is None:
+                if exit_when_idle:
+                    break
+                time.sleep(poll_seconds)
+                continue
+            process_job(queue, job, worker_id)
+            processed += 1
+    finally:
+        queue.close()
+
+    return processed
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Durable job queue for bulk resume analysis.")
+    parser.add_argument('--db', default=QUEUE_DB_PATH, help=f"Queue database (default: {QUEUE_DB_PATH})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    submit = commands.add_parser('submit', help="Queue resume PDFs against a job description")
+    submit.add_argument('job_file', help="Text file with the job description")
+    submit.add_argument('resumes', nargs='+', help="Resume PDFs or directories containing them")
+    submit.add_argument('--relocate', choices=['yes', 'no'], default=None, help="Relocation preference for every candidate")
+    submit.add_argument('--recursive', action='store_true', help="Include PDFs in subdirectories")
+
+    work = commands.add_parser('work', help="Run worker processes")
+    work.add_argument('--processes', type=int, default=1, help="Worker processes (default: 1)")
+    work.add_argument('--exit-when-idle', action='store_true', help="Stop once the queue is empty")
+
+    status = commands.add_parser('status', help="Show batch progress")
+    status.add_argument('batch_id')
+    status.add_argument('--follow', action='store_true', help="Keep printing progress until the batch finishes")
+
+    results = commands.add_parser('results', help="Show batch results")
+    results.add_argument('batch_id')
+    results.add_argument('--json', action='store_true', help="Print results as JSON instead of a table")
+
+    retry = commands.add_parser('retry', help="Requeue the dead-lettered jobs of a batch")
+    retry.add_argument('batch_id')
+
+    return parser.parse_args(argv)
+
+
+def _format_progress(status):
+    return (f"{status['done'] + status['dead']}/{status['total']} finished "
+            f"(queued {status['queued']}, running {status['running']}, "
+            f"done {status['done']}, dead {status['dead']})")
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    from batch_rank import find_resumes
+
+    args = parse_args(argv)
+
+    if args.command == 'work':
+        if args.processes <= 1:
+            run_worker(args.db, exit_when_idle=args.exit_when_idle)
+            return 0
+        workers = [
+            Process(target=run_worker, args=(args.db,), kwargs={'exit_when_idle': args.exit_when_idle})
+            for _ in range(args.processes)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return 0
+
+    queue = JobQueue(args.db)
+    try:
+        if args.command == 'submit':
+            with open(args.job_file, encoding='utf-8') as f:
+                job_description = f.read()
+
+            paths = []
+            for path in args.resumes:
+                paths.extend(find_resumes(path, args.recursive) if os.path.isdir(path) else [path])
+            if not paths:
+                print("No PDF files to submit", file=sys.stderr)
+                return 1
+
+            relocate = {'yes': True, 'no': False}.get(args.relocate)
+            try:
+                batch_id = queue.submit_files(job_description, paths, relocate)
+            except UploadTooLargeError as e:
+                print(f"Not submitted: {e}", file=sys.stderr)
+                return 1
+            print(batch_id)
+            return 0
+
+        if queue.batch_status(args.batch_id) is None:
+            print(f"Unknown batch: {args.batch_id}", file=sys.stderr)
+            return 1
+
+        if args.command == 'status':
+            if args.follow:
+                for status in queue.follow_batch(args.batch_id):
+                    print(_format_progress(status), flush=True)
+            else:
+                print(_format_progress(queue.batch_status(args.batch_id)))
+            return 0
+
+        if args.command == 'retry':
+            print(f"Requeued {queue.requeue_dead(args.batch_id)} jobs")
+            return 0
+
+        results = queue.batch_results(args.batch_id)
+        if args.json:
+            print(json.dumps(results, ensure_ascii=False, indent=2))
+            return 0
+
+        ranked = sorted((r for r in results if r['status'] == STATUS_DONE),
+                        key=lambda r: r['result']['score'], reverse=True)
+        print(f"{'Rank':>4}  {'Score':>6}  {'Expected':>8}  File")
+        for rank, entry in enumerate(ranked, start=1):
+            print(f"{rank:>4}  {entry['result']['score']:>6.1f}  "
+                  f"{entry['result']['expected_score']:>8.1f}  {entry['name']}")
+        for entry in results:
+            if entry['status'] != STATUS_DONE:
+                print(f"{entry['status'].capitalize()}: {entry['name']}: {entry['error'] or ''}", file=sys.stderr)
+        return 0
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Multi-pattern keyword matching
+Aho-Corasick automaton that finds every vocabulary term in a single pass
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class KeywordMatch(NamedTuple):
+    """A single vocabulary hit in a text"""
+    term: str
+    category: str
+    start: int
+    end: int
+
+
+def _is_word_char(ch: str) -> bool:
+    """Characters that glue a term to its neighbours (same rule as regex \\w)"""
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordMatcher:
+    """
+    Word-boundary aware Aho-Corasick matcher.
+
+    Terms are added with a category, the automaton is compiled once with
+    build(), and find_all() then reports every hit in one linear pass over
+    the text. A term may belong to several categories; each category is
+    reported as its own hit. Matching is case-insensitive. A term added
+    with a canonical form (a synonym such as "k8s") is reported under that
+    form, with the offsets of the text that actually matched.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._terms: List[Tuple[str, str, Tuple[str, ...]]] = []
+        self._term_index: Dict[str, int] = {}
+        self._categories: Dict[str, List[str]] = {}
+        self._canonical: Dict[str, str] = {}
+        self._built = False
+
+    def add(self, term: str, category: str, canonical: Optional[str] = None) -> None:
+        """Register a term under a category, optionally reported as its canonical form"""
+        term = term.lower().strip()
+        if not term:
+            return
+        categories = self._categories.setdefault(term, [])
+        if category not in categories:
+            categories.append(category)
+        if canonical:
+            self._canonical[term] = canonical.lower().strip()
+        self._built = False
+
+    def add_many(self, terms: Iterable[str], category: str) -> None:
+        """Register several terms under the same category"""
+        for term in terms:
+            self.add(term, category)
+
+    def build(self) -> 'KeywordMatcher':
+        """Compile the trie and failure links"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._terms = []
+        self._term_index = {}
+
+        for term, categories in self._categories.items():
+            node = 0
+            for ch in term:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = nxt
+            self._term_index[term] = len(self._terms)
+            self._output[node].append(len(self._terms))
+            self._terms.append((term, self._canonical.get(term, term), tuple(categories)))
+
+        # Breadth-first pass to wire failure links and merge outputs
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+        self._built = True
+        return self
+
+    def categories_of(self, term: str) -> Tuple[str, ...]:
+        """Return the categories a term was registered under"""
+        return tuple(self._categories.get(term.lower().strip(), ()))
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        Find every term occurrence in text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            list: KeywordMatch tuples ordered by end offset
+        """
+        if not self._built:
+            self.build()
+        if not text:
+            return []
+
+        text_lower = text.lower()
+        # lower() can change string length for a few non-ASCII characters;
+        # offsets are only meaningful against the lowered text in that case
+        length = len(text_lower)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        terms = self._terms
+        root = goto[0]
+
+        matches = []
+        node = 0
+        for i, ch in enumerate(text_lower):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0) if node else root.get(ch, 0)
+            if not output[node]:
+                continue
+
+            for term_id in output[node]:
+                term, reported, categories = terms[term_id]
+                end = i + 1
+                start = end - len(term)
+                if _is_word_char(term[0]) and start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if _is_word_char(term[-1]) and end < length and _is_word_char(text_lower[end]):
+                    continue
+                for category in categories:
+                    matches.append(KeywordMatch(reported, category, start, end))
+
+        return matches
@@ -1,64 +1,80 @@
 """
 NLTK Setup and Initialization
-Downloads required NLTK data packages
+Locates (and optionally downloads) NLTK data packages on demand
+
+Nothing here runs at import time and NLTK itself is only imported when a
+resource is requested. Downloads are opt-in (ATS_NLTK_ALLOW_DOWNLOAD=1 or
+running this module as a script) and always use verified HTTPS.
 """
 
-import nltk
 import os
-import ssl
 
-# Handle SSL certificate issues
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
+from config import NLTK_ALLOW_DOWNLOAD
+
+# NLTK packages and the data path each one is found under
+REQUIRED_PACKAGES = {
+    'punkt': 'tokenizers/punkt',                  # Tokenizer (old version)
+    'punkt_tab': 'tokenizers/punkt_tab',          # Tokenizer (new version for NLTK 3.9+)
+    'stopwords': 'corpora/stopwords',             # Stopwords
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',  # POS tagger
+    'maxent_ne_chunker': 'chunkers/maxent_ne_chunker',  # Named entity chunker
+    'words': 'corpora/words'                      # Word list
+}
 
 
-def setup_nltk():
+def ensure_nltk_resource(package, download=None):
     """
-    Download required NLTK data packages if not already present.
-    This function ensures all necessary NLTK resources are available.
+    Make sure one NLTK data package is available, importing NLTK lazily.
+
+    Args:
+        package (str): NLTK package name, e.g. 'stopwords'
+        download (bool, optional): Allow a network download if missing
+            (defaults to NLTK_ALLOW_DOWNLOAD)
+
+    Returns:
+        bool: True if the package is available
     """
-    # Set NLTK data path
+    import nltk
+
+    download = NLTK_ALLOW_DOWNLOAD if download is None else download
+    resource_path = REQUIRED_PACKAGES.get(package, package)
+
+    try:
+        nltk.data.find(resource_path)
+        return True
+    except LookupError:
+        pass
+
+    if not download:
+        return False
+
     nltk_data_dir = os.path.join(os.path.expanduser('~'), 'nltk_data')
-    
-    # Create directory if it doesn't exist
-    if not os.path.exists(nltk_data_dir):
-        os.makedirs(nltk_data_dir)
-    
-    # List of required NLTK packages
-    required_packages = [
-        'punkt',           # Tokenizer (old version)
-        'punkt_tab',       # Tokenizer (new version for NLTK 3.9+)
-        'stopwords',       # Stopwords
-        'averaged_perceptron_tagger',  # POS tagger
-        'maxent_ne_chunker',  # Named entity chunker
-        'words'            # Word list
+    os.makedirs(nltk_data_dir, exist_ok=True)
+    print(f"Downloading NLTK package: {package}")
+    try:
+        return bool(nltk.download(package, download_dir=nltk_data_dir, quiet=True))
+    except Exception as e:
+        print(f"Warning: Could not download NLTK package '{package}': {e}")
+        return False
+
+
+def setup_nltk(download=None):
+    """
+    Check (and optionally download) every NLTK package the project knows about.
+
+    Args:
+        download (bool, optional): Allow network downloads (defaults to NLTK_ALLOW_DOWNLOAD)
+
+    Returns:
+        list: Packages that are still unavailable
+    """
+    return [
+        package for package in REQUIRED_PACKAGES
+        if not ensure_nltk_resource(package, download)
     ]
-    
-    # Download each package if not present
-    for package in required_packages:
-        try:
-            # Try to find the package first
-            try:
-                nltk.data.find(f'tokenizers/{package}')
-            except LookupError:
-                try:
-                    nltk.data.find(f'corpora/{package}')
-                except LookupError:
-                    # Package not found, download it
-                    print(f"Downloading NLTK package: {package}")
-                    nltk.download(package, quiet=True)
-        except Exception as e:
-            print(f"Warning: Could not download NLTK package '{package}': {e}")
-            # Continue anyway - some packages might not be critical
-
-
-# Run setup when module is imported
-setup_nltk()
 
 
 if __name__ == "__main__":
-    setup_nltk()
\ No newline at end of file
+    missing = setup_nltk(download=True)
+    if missing:
+        print(f"Unavailable NLTK packages: {', '.join(missing)}")
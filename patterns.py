@@ -0,0 +1,107 @@
+"""
+Precompiled regular expressions
+Every pattern the extractors and analyzers use, compiled once at import time
+"""
+
+import re
+
+# ---------- Text normalization (text_extractors.clean_text) ----------
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Keep: letters, numbers, spaces, @, +, -, ., #, /
+NON_TEXT_CHAR_PATTERN = re.compile(r'[^\w\s@+\-\.#/]')
+
+# ---------- Contact details (text_extractors) ----------
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+GITHUB_PATTERN = re.compile(r'github\.com/([a-zA-Z0-9-]+)', re.IGNORECASE)
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/([a-zA-Z0-9-]+)', re.IGNORECASE)
+
+# Phone formats in priority order: the first format found anywhere in the
+# text wins over later formats, whatever their position
+PHONE_FORMATS = ('phone_digits', 'phone_grouped', 'phone_paren', 'phone_intl')
+
+# Every contact field in one alternation, so a single pass over the text
+# finds them all (see text_extractors.scan_contacts)
+CONTACT_PATTERN = re.compile(
+    r'(?P<url>' + URL_PATTERN.pattern + r')'
+    r'|(?P<email>' + EMAIL_PATTERN.pattern + r')'
+    r'|(?i:github\.com/)(?P<github>[a-zA-Z0-9-]+)'
+    r'|(?i:linkedin\.com/in/)(?P<linkedin>[a-zA-Z0-9-]+)'
+    r'|(?P<phone_digits>\b\d{10}\b)'                               # 10 digits
+    r'|(?P<phone_grouped>\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b)'       # XXX-XXX-XXXX
+    r'|(?P<phone_paren>\(\d{3}\)\s*\d{3}[-.\s]?\d{4}\b)'           # (XXX) XXX-XXXX
+    r'|(?P<phone_intl>\+\d{1,3}[-.\s]?(?P<phone_intl_number>\d{10})\b)'  # +XX XXXXXXXXXX
+)
+
+# ---------- Feature extraction (feature_extractors) ----------
+# Applied to lowercased text
+EDUCATION_SECTION_PATTERN = re.compile(
+    r'(?:education|qualification|academic|degree)(.*?)(?:experience|skills|projects|$)', re.DOTALL
+)
+EXPERIENCE_RANGE_PATTERN = re.compile(r'(\d+)\s*-\s*(\d+)\s*(?:years?|yrs?)')
+EXPERIENCE_PLUS_PATTERN = re.compile(r'(\d+)\s*\+\s*(?:years?|yrs?)')
+EXPERIENCE_SINGLE_PATTERN = re.compile(r'\b(\d+)\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)\b')
+
+# Projects section with various header formats, tried in order
+PROJECT_SECTION_PATTERNS = [
+    re.compile(
+        r'(?:^|\n)\s*projects?\s*(?:\n|:)(.*?)(?=\n\s*(?:experience|education|skills|certifications?|achievements?|$))',
+        re.IGNORECASE | re.DOTALL
+    ),
+    re.compile(
+        r'(?:^|\n)\s*(?:key\s+)?projects?\s*(?:\n|:)(.*?)(?=\n\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*(?:\n|$))',
+        re.IGNORECASE | re.DOTALL
+    ),
+]
+# MM/YYYY - MM/YYYY
+DATE_RANGE_PATTERN = re.compile(r'\d{2}/\d{4}\s*-\s*\d{2}/\d{4}')
+PROJECT_MARKER_PATTERN = re.compile(r'(?:^|\n)\s*(?:project\s*:|\d+\.)', re.IGNORECASE)
+
+# Explicit location markers, tried in order before the gazetteer (lowercased text)
+LOCATION_MARKER_PATTERNS = [
+    re.compile(r'location\s*:\s*([a-z][a-z\s,]+?)(?:\n|$|\||•|based)'),
+    re.compile(r'based\s+(?:in|at)\s+([a-z][a-z\s,]+?)(?:\n|$|\.|\|)'),
+    re.compile(r'office(?:s)?\s+(?:in|at)\s+([a-z][a-z\s,]+?)(?:\n|$|\.|\|)'),
+    re.compile(r'work\s+(?:from|in)\s+([a-z][a-z\s,]+?)(?:\n|$|\.|\|)'),
+]
+# "City, State/Country" or "City, XX" (original case)
+CITY_STATE_PATTERN = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2,}|[A-Z][a-z]+)\b')
+LOCATION_FILLER_PATTERN = re.compile(r'\b(the|a|an|in|at|of|for|to|and|or|is|are|with)\b')
+# Address or contact cues that let the world gazetteer read a line (any case)
+LOCATION_CONTEXT_PATTERN = re.compile(
+    r'\b(?:location|address|based\s+(?:in|at)|lives?\s+in|residing\s+in|relocat\w*|hometown)\b'
+    r'|@|\+?\d[\d\s().-]{6,}\d',
+    re.IGNORECASE
+)
+# Separators between the fields of a one-line resume header ("Name | email | City")
+HEADER_FIELD_SEPARATOR_PATTERN = re.compile(r'\s*[|•·–—\t]\s*')
+
+# ---------- Place names (world_gazetteer) ----------
+PLACE_PUNCTUATION_PATTERN = re.compile(r"[\s.\-'’,/()]+")
+PLACE_TOKEN_PATTERN = re.compile(r"[^\W\d_][\w.'’\-]*")
+
+# ---------- Job descriptions (profiles) ----------
+REQUIRED_SKILLS_PATTERN = re.compile(r'required skills.*?(?=\n\n|\Z)', re.DOTALL)
+
+# ---------- Candidate queries (skill_index) ----------
+# One token of a boolean query: parenthesis, experience comparison or term
+QUERY_TOKEN_PATTERN = re.compile(
+    r'\s*(?:(?P<paren>[()])'
+    r'|(?P<exp_field>exp)\s*(?P<exp_op>>=|<=|>|<|=)\s*(?P<exp_years>\d+)'
+    r'|(?:(?P<field>[a-z]+):)?(?:"(?P<quoted>[^"]*)"|(?P<word>[^\s()"]+)))',
+    re.IGNORECASE
+)
+
+# ---------- Section analysis (section_analyzer) ----------
+# Project-like content anywhere in a resume without a projects section
+PROJECT_INDICATOR_PATTERNS = [
+    re.compile(
+        r'(?:developed|built|created|engineered|designed)\s+(?:a|an)\s+\w+\s+(?:website|application|app|platform|system)',
+        re.IGNORECASE
+    ),
+    re.compile(r'(?:project|portfolio)\s*:', re.IGNORECASE),
+    re.compile(r'\d{2}/\d{4}\s*-\s*\d{2}/\d{4}', re.IGNORECASE),  # Date ranges
+]
+
+# ---------- UI (ui_components) ----------
+BOLD_MARKDOWN_PATTERN = re.compile(r'\*\*(.+?)\*\*')
@@ -0,0 +1,134 @@
+"""
+Content-addressed disk cache for PDF text extraction
+Keyed by a hash of the PDF bytes plus the extractor version
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from typing import Optional
+
+from config import PDF_CACHE_DIR, PDF_CACHE_MAX_BYTES
+
+logger = logging.getLogger('ats.pdf_cache')
+
+# Evict down to this fraction of the size limit so eviction is not re-run on every write
+EVICTION_LOW_WATER = 0.9
+
+
+def cache_key(content_sha256: str, extractor_version: str) -> str:
+    """Combine the PDF's SHA-256 (computed while spooling the upload) with the extractor version"""
+    digest = hashlib.sha256()
+    digest.update(extractor_version.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(content_sha256.encode('ascii'))
+    return digest.hexdigest()
+
+
+class PdfTextCache:
+    """
+    Size-bounded LRU cache of extracted text on local disk.
+
+    Entries are written to a temporary file and renamed into place, so
+    concurrent writers (threads or processes) never expose a partial entry;
+    two writers racing on one key store identical content and the last
+    rename wins. Reads refresh the entry's mtime, and eviction removes the
+    least recently used entries once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._approx_size = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + '.txt')
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached text, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store text under key, evicting old entries if over budget"""
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self._approx_size is None:
+            self._approx_size = self._scan_size()
+        else:
+            self._approx_size += os.path.getsize(path)
+
+        if self._approx_size > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """(mtime, size, path) for every entry currently on disk"""
+        entries = []
+        for root, dirs, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.txt'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under the low-water mark"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICTION_LOW_WATER
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Another process evicted it first
+            total -= size
+
+        self._approx_size = total
+
+
+@lru_cache(maxsize=1)
+def get_pdf_cache() -> Optional[PdfTextCache]:
+    """Return the process-wide PDF text cache, or None when disabled"""
+    if not PDF_CACHE_DIR or PDF_CACHE_MAX_BYTES <= 0:
+        return None
+    try:
+        return PdfTextCache(PDF_CACHE_DIR, PDF_CACHE_MAX_BYTES)
+    except OSError as e:
+        logger.warning("PDF cache disabled: %s", e)
+        return None
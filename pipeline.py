@@ -0,0 +1,87 @@
+"""
+Headless analysis pipeline
+Runs PDF extraction, section analysis and scoring without the Streamlit UI
+"""
+
+from io import BytesIO
+
+from section_analyzer import analyze_sections
+from similarity_calculator import calculate_similarity, calculate_expected_score
+from text_extractors import extract_pdf_document, PdfExtractionError
+from profiles import as_job_profile, as_resume_profile
+
+
+def analyze_resume(resume_text, job_description, willing_to_relocate=None):
+    """
+    Score a resume's text against a job description.
+
+    Args:
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
+        willing_to_relocate (bool or None): User's relocation preference
+
+    Returns:
+        dict: score, expected_score, potential_gain and sections
+    """
+    resume = as_resume_profile(resume_text)
+    job = as_job_profile(job_description)
+    sections = analyze_sections(resume, job, willing_to_relocate)
+    score, _, _ = calculate_similarity(resume, job, sections)
+    expected_score, potential_gain = calculate_expected_score(score, sections)
+
+    return {
+        'score': score,
+        'expected_score': expected_score,
+        'potential_gain': potential_gain,
+        'sections': sections
+    }
+
+
+def analyze_pdf_file(path, job_description, willing_to_relocate=None, extract_workers=None):
+    """
+    Extract a resume PDF from disk and score it against a job description.
+
+    Args:
+        path (str): Path to the resume PDF
+        job_description (str or JobProfile): Job description text or its prebuilt profile
+        willing_to_relocate (bool or None): User's relocation preference
+        extract_workers (int, optional): PDF extraction processes (1 inside pool workers)
+
+    Returns:
+        dict: Same as analyze_resume(), plus 'truncated'
+
+    Raises:
+        PdfExtractionError: If the PDF cannot be parsed or has no text
+    """
+    with open(path, 'rb') as pdf_file:
+        return _analyze_pdf(pdf_file, job_description, willing_to_relocate, extract_workers)
+
+
+def analyze_pdf_bytes(pdf_bytes, job_description, willing_to_relocate=None, extract_workers=None):
+    """
+    Score an in-memory resume PDF against a job description.
+
+    Args:
+        pdf_bytes (bytes): Resume PDF content
+        job_description (str or JobProfile): Job description text or its prebuilt profile
+        willing_to_relocate (bool or None): User's relocation preference
+        extract_workers (int, optional): PDF extraction processes (1 inside pool workers)
+
+    Returns:
+        dict: Same as analyze_resume(), plus 'truncated'
+
+    Raises:
+        PdfExtractionError: If the PDF cannot be parsed or has no text
+    """
+    return _analyze_pdf(BytesIO(pdf_bytes), job_description, willing_to_relocate, extract_workers)
+
+
+def _analyze_pdf(pdf_file, job_description, willing_to_relocate, extract_workers):
+    extraction = extract_pdf_document(pdf_file, workers=extract_workers)
+
+    if not extraction.text:
+        raise PdfExtractionError("Could not extract text from PDF")
+
+    result = analyze_resume(extraction.text, job_description, willing_to_relocate)
+    result['truncated'] = extraction.truncated
+    return result
@@ -0,0 +1,179 @@
+"""
+Precompiled document profiles
+Parses a job description or resume once so it can be scored many times
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple, Union
+
+from config import EDUCATION_KEYWORDS
+from feature_store import get_feature_store
+from feature_extractors import (
+    extract_skills, extract_technologies, extract_education,
+    extract_experience_years, extract_location, normalize_skill,
+    extract_important_keywords, extract_education_keywords, detect_job_type,
+    extract_projects, count_projects
+)
+from instrumentation import timed
+from patterns import REQUIRED_SKILLS_PATTERN
+from skill_taxonomy import TAXONOMY
+from text_extractors import preprocess_text
+
+@dataclass(frozen=True)
+class JobProfile:
+    """
+    Everything the analyzers derive from a job description.
+
+    Equality and hashing use only the raw text, so two profiles built from
+    the same posting are interchangeable (and usable as cache keys).
+    """
+    text: str
+    text_lower: str = field(compare=False, repr=False)
+    processed: str = field(compare=False, repr=False)
+    word_count: int = field(compare=False)
+    skills: FrozenSet[str] = field(compare=False)
+    technologies: FrozenSet[str] = field(compare=False)
+    normalized_skills: FrozenSet[str] = field(compare=False)
+    normalized_technologies: FrozenSet[str] = field(compare=False)
+    required_technologies: FrozenSet[str] = field(compare=False)
+    # skill_taxonomy bitsets of normalized_skills, normalized_technologies, required_technologies
+    skill_bits: int = field(compare=False, repr=False)
+    tech_bits: int = field(compare=False, repr=False)
+    required_bits: int = field(compare=False, repr=False)
+    important_keywords: FrozenSet[str] = field(compare=False)
+    education: str = field(compare=False, repr=False)
+    education_requirements: Tuple[str, ...] = field(compare=False)
+    experience_years: Optional[Tuple[int, int]] = field(compare=False)
+    location: Optional[str] = field(compare=False)
+    job_type: Optional[str] = field(compare=False)
+
+    @classmethod
+    @timed('build_job_profile')
+    def from_text(cls, job_description: str) -> 'JobProfile':
+        """Parse a job description into a profile"""
+        text_lower = job_description.lower()
+        skills = frozenset(s.lower() for s in extract_skills(job_description))
+        technologies = frozenset(extract_technologies(job_description))
+
+        required_technologies = frozenset()
+        required_match = REQUIRED_SKILLS_PATTERN.search(text_lower)
+        if required_match:
+            required_technologies = frozenset(extract_technologies(required_match.group(0)))
+
+        education = extract_education(job_description)
+        education_found = extract_education_keywords(education) if education else set()
+        normalized_skills = frozenset(normalize_skill(s) for s in skills)
+        normalized_technologies = frozenset(normalize_skill(t) for t in technologies)
+
+        return cls(
+            text=job_description,
+            text_lower=text_lower,
+            processed=preprocess_text(job_description),
+            word_count=len(job_description.split()),
+            skills=skills,
+            technologies=technologies,
+            normalized_skills=normalized_skills,
+            normalized_technologies=normalized_technologies,
+            required_technologies=required_technologies,
+            skill_bits=TAXONOMY.encode(normalized_skills),
+            tech_bits=TAXONOMY.encode(normalized_technologies),
+            required_bits=TAXONOMY.encode(required_technologies),
+            important_keywords=frozenset(extract_important_keywords(job_description)),
+            education=education,
+            education_requirements=tuple(k for k in EDUCATION_KEYWORDS if k in education_found),
+            experience_years=extract_experience_years(job_description),
+            location=extract_location(job_description),
+            job_type=detect_job_type(job_description),
+        )
+
+
+@dataclass(frozen=True)
+class ResumeProfile:
+    """
+    Everything the analyzers derive from a resume.
+
+    Like JobProfile, equality and hashing use only the raw text.
+    """
+    text: str
+    processed: str = field(compare=False, repr=False)
+    skills: FrozenSet[str] = field(compare=False)
+    technologies: FrozenSet[str] = field(compare=False)
+    normalized_skills: FrozenSet[str] = field(compare=False)
+    normalized_technologies: FrozenSet[str] = field(compare=False)
+    important_keywords: FrozenSet[str] = field(compare=False)
+    education: str = field(compare=False, repr=False)
+    education_keywords: FrozenSet[str] = field(compare=False)
+    experience_years: Optional[Tuple[int, int]] = field(compare=False)
+    location: Optional[str] = field(compare=False)
+    projects: str = field(compare=False, repr=False)
+    project_count: int = field(compare=False)
+    project_technologies: FrozenSet[str] = field(compare=False)
+    # skill_taxonomy bitsets of normalized_skills, normalized_technologies, project_technologies
+    skill_bits: int = field(compare=False, repr=False)
+    tech_bits: int = field(compare=False, repr=False)
+    project_tech_bits: int = field(compare=False, repr=False)
+
+    @classmethod
+    @timed('build_resume_profile')
+    def from_text(cls, resume_text: str) -> 'ResumeProfile':
+        """Parse a resume into a profile"""
+        skills = frozenset(s.lower() for s in extract_skills(resume_text))
+        technologies = frozenset(extract_technologies(resume_text))
+        education = extract_education(resume_text)
+        projects = extract_projects(resume_text)
+        normalized_skills = frozenset(normalize_skill(s) for s in skills)
+        normalized_technologies = frozenset(normalize_skill(t) for t in technologies)
+        project_technologies = frozenset(extract_technologies(projects)) if projects else frozenset()
+
+        return cls(
+            text=resume_text,
+            processed=preprocess_text(resume_text),
+            skills=skills,
+            technologies=technologies,
+            normalized_skills=normalized_skills,
+            normalized_technologies=normalized_technologies,
+            important_keywords=frozenset(extract_important_keywords(resume_text)),
+            education=education,
+            education_keywords=frozenset(extract_education_keywords(education)) if education else frozenset(),
+            experience_years=extract_experience_years(resume_text),
+            location=extract_location(resume_text),
+            projects=projects,
+            project_count=count_projects(projects),
+            project_technologies=project_technologies,
+            skill_bits=TAXONOMY.encode(normalized_skills),
+            tech_bits=TAXONOMY.encode(normalized_technologies),
+            project_tech_bits=TAXONOMY.encode(project_technologies),
+        )
+
+
+@lru_cache(maxsize=64)
+def build_job_profile(job_description: str) -> JobProfile:
+    """Build (or reuse) the profile for a job description, via the feature store when enabled"""
+    store = get_feature_store()
+    if store is None:
+        return JobProfile.from_text(job_description)
+    return store.job_profile(job_description)
+
+
+def as_job_profile(job: Union[str, JobProfile]) -> JobProfile:
+    """Accept either a raw job description or a prebuilt JobProfile"""
+    if isinstance(job, JobProfile):
+        return job
+    return build_job_profile(job or "")
+
+
+@lru_cache(maxsize=64)
+def build_resume_profile(resume_text: str) -> ResumeProfile:
+    """Build (or reuse) the profile for a resume, via the feature store when enabled"""
+    store = get_feature_store()
+    if store is None:
+        return ResumeProfile.from_text(resume_text)
+    return store.resume_profile(resume_text)
+
+
+def as_resume_profile(resume: Union[str, ResumeProfile]) -> ResumeProfile:
+    """Accept either raw resume text or a prebuilt ResumeProfile"""
+    if isinstance(resume, ResumeProfile):
+        return resume
+    return build_resume_profile(resume or "")
@@ -4,7 +4,7 @@ Generates improvement suggestions and rewrite examples
 """
 
 import random
-from config import SKILL_CATEGORIES
+from skill_taxonomy import TAXONOMY
 
 
 def generate_keyword_rewrites(missing_keywords):
@@ -130,17 +130,16 @@ def generate_skills_section_rewrite(missing_items, existing_tech):
     if not missing_items:
         return None
     
-    # Organize missing and existing items by category
+    # Organize missing and existing items by category (unknown items are skipped)
+    missing_bits = TAXONOMY.encode(missing_items)
+    all_bits = missing_bits | TAXONOMY.encode(existing_tech)
+
     organized = {}
-    all_items = set(missing_items + existing_tech)
-    
-    for category, keywords in SKILL_CATEGORIES.items():
-        items_in_category = [item for item in all_items if item.lower() in [k.lower() for k in keywords]]
-        if items_in_category:
-            # Mark which are missing
-            organized[category] = {
-                'items': items_in_category,
-                'missing': [item for item in items_in_category if item in missing_items]
-            }
+    for category, items_in_category in TAXONOMY.group_by_category(all_bits).items():
+        # Mark which are missing
+        organized[category] = {
+            'items': items_in_category,
+            'missing': TAXONOMY.decode(all_bits & missing_bits & TAXONOMY.category_masks[category])
+        }
     
     return organized
@@ -0,0 +1,168 @@
+"""
+Top-k resume ranking over large resume pools
+Keeps resume TF-IDF vectors in a float32 CSR matrix and scores a posting
+against all of them with one sparse matrix-vector product
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import scipy.sparse as sp
+
+from pipeline import analyze_resume
+from profiles import as_job_profile
+from similarity_calculator import get_corpus_model
+from tfidf_model import preprocess
+
+
+class ResumeRanker:
+    """
+    Ranking engine for stored resumes.
+
+    Vectors come from the corpus TF-IDF model, so every resume shares one
+    vocabulary and rows are L2-normalized: a row dot the job vector is the
+    cosine similarity. Only the top-k survivors get the full analysis.
+    """
+
+    def __init__(self, model=None):
+        self.model = model if model is not None else get_corpus_model()
+        if self.model is None:
+            raise ValueError(
+                "ResumeRanker needs a corpus TF-IDF model. "
+                "Fit one with `python tfidf_model.py fit` and set ATS_TFIDF_MODEL."
+            )
+        self.ids = []
+        self._matrix = sp.csr_matrix((0, len(self.model.vocabulary)), dtype=np.float32)
+        self._pending = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, resume_ids, resume_texts):
+        """
+        Vectorize and store resumes.
+
+        Args:
+            resume_ids (list): Caller-side identifiers, one per resume
+            resume_texts (list): Raw resume texts
+        """
+        resume_ids = list(resume_ids)
+        resume_texts = list(resume_texts)
+        if len(resume_ids) != len(resume_texts):
+            raise ValueError("resume_ids and resume_texts must have the same length")
+        if not resume_ids:
+            return
+
+        vectors = self.model.transform([preprocess(text) for text in resume_texts], dtype=np.float32)
+        self._pending.append(vectors)
+        self.ids.extend(resume_ids)
+
+    @property
+    def matrix(self):
+        """All stored resume vectors as one CSR matrix"""
+        if self._pending:
+            self._matrix = sp.vstack([self._matrix] + self._pending, format='csr', dtype=np.float32)
+            self._pending = []
+        return self._matrix
+
+    def scores(self, job_description):
+        """
+        Cosine similarity of every stored resume to a job description.
+
+        Args:
+            job_description (str or JobProfile): Job description text or its prebuilt profile
+
+        Returns:
+            numpy.ndarray: float32 score per stored resume, in insertion order
+        """
+        job = as_job_profile(job_description)
+        job_vector = self.model.transform([job.processed], dtype=np.float32).toarray().ravel()
+        return self.matrix @ job_vector
+
+    def top_k(self, job_description, k=50):
+        """
+        Select the k most similar resumes.
+
+        Returns:
+            list: (resume_id, score) tuples, best first
+        """
+        scores = self.scores(job_description)
+        if len(scores) == 0 or k <= 0:
+            return []
+
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(len(scores))
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(self.ids[i], float(scores[i])) for i in order]
+
+    def shortlist(self, job_description, fetch_text, k=50, willing_to_relocate=None):
+        """
+        Run the full analysis only on the top-k resumes.
+
+        Args:
+            job_description (str or JobProfile): Job description text or its prebuilt profile
+            fetch_text (callable): Returns the raw resume text for a resume_id
+            k (int): Number of candidates to analyze
+            willing_to_relocate (bool or None): Relocation preference applied to every resume
+
+        Returns:
+            list: analyze_resume() results with 'resume_id' and 'tfidf',
+                  sorted by final score, best first
+        """
+        job = as_job_profile(job_description)
+        results = []
+        for resume_id, cosine in self.top_k(job, k):
+            result = analyze_resume(fetch_text(resume_id), job, willing_to_relocate)
+            result['resume_id'] = resume_id
+            result['tfidf'] = round(cosine, 4)
+            results.append(result)
+
+        results.sort(key=lambda r: r['score'], reverse=True)
+        return results
+
+    def save(self, path):
+        """Write ids and vectors atomically to an .npz file"""
+        matrix = self.matrix
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(
+                    f,
+                    ids=np.array([str(i) for i in self.ids]),
+                    data=matrix.data,
+                    indices=matrix.indices,
+                    indptr=matrix.indptr,
+                    shape=np.array(matrix.shape),
+                    vocabulary_digest=np.array(self.model.vocabulary_digest())
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path, model=None):
+        """
+        Load a ranker written by save(); ids come back as strings.
+
+        Raises:
+            ValueError: If the vectors were built with a different TF-IDF
+                vocabulary (or before vocabularies were recorded); rebuild them
+        """
+        ranker = cls(model)
+        with np.load(path, allow_pickle=False) as data:
+            shape = tuple(int(n) for n in data['shape'])
+            stored_digest = str(data['vocabulary_digest']) if 'vocabulary_digest' in data.files else None
+            if stored_digest != ranker.model.vocabulary_digest() or shape[1] != len(ranker.model.vocabulary):
+                raise ValueError(f"{path} was built with a different TF-IDF vocabulary; rebuild it")
+            ranker._matrix = sp.csr_matrix(
+                (data['data'].astype(np.float32), data['indices'], data['indptr']),
+                shape=shape
+            )
+            ranker.ids = data['ids'].tolist()
+        return ranker
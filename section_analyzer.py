@@ -3,142 +3,95 @@ Section-by-section resume analysis
 Analyzes different sections of resume against job requirements
 """
 
-import re
-from config import (
-    EDUCATION_KEYWORDS, JOB_TYPE_KEYWORDS, IMPORTANT_KEYWORDS
-)
-from feature_extractors import (
-    extract_skills, extract_technologies, extract_education,
-    extract_experience_years, extract_location, extract_projects,
-    count_projects, normalize_skill
-)
+from config import IMPORTANT_KEYWORDS
+from instrumentation import timed
+from patterns import PROJECT_INDICATOR_PATTERNS
+from profiles import as_job_profile, as_resume_profile
+from skill_taxonomy import TAXONOMY, popcount
 
 
+@timed()
 def analyze_sections(resume_text, job_description, willing_to_relocate=None):
     """
     Main function to analyze all resume sections against job requirements.
     
     Args:
-        resume_text (str): Resume text
-        job_description (str): Job description text
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
         willing_to_relocate (bool or None): User's relocation preference
         
     Returns:
         list: List of section analysis dictionaries
     """
-    sections = []
-    
-    # Analyze Skills & Technologies
-    try:
-        sections.append(analyze_skills_section(resume_text, job_description))
-    except Exception as e:
-        print(f"Error analyzing skills: {e}")
-        sections.append({
-            'icon': '⚙️',
-            'title': 'Skills & Technologies',
-            'status': 'missing',
-            'missing': [],
-            'recommendation': 'Unable to analyze skills section.'
-        })
-    
-    # Analyze Projects
-    try:
-        sections.append(analyze_projects_section(resume_text, job_description))
-    except Exception as e:
-        print(f"Error analyzing projects: {e}")
-        sections.append({
-            'icon': '🚀',
-            'title': 'Projects',
-            'status': 'missing',
-            'missing': [],
-            'recommendation': 'Unable to analyze projects section.'
-        })
-    
-    # Analyze Experience
-    try:
-        sections.append(analyze_experience_section(resume_text, job_description))
-    except Exception as e:
-        print(f"Error analyzing experience: {e}")
-        sections.append({
-            'icon': '💼',
-            'title': 'Experience Level',
-            'status': 'missing',
-            'missing': [],
-            'recommendation': 'Unable to analyze experience section.'
-        })
-    
-    # Analyze Education
-    try:
-        sections.append(analyze_education_section(resume_text, job_description))
-    except Exception as e:
-        print(f"Error analyzing education: {e}")
-        sections.append({
-            'icon': '🎓',
-            'title': 'Education',
-            'status': 'good',
-            'missing': [],
-            'recommendation': 'Unable to analyze education section.'
-        })
+    profiles = build_section_profiles(resume_text, job_description)
+    if profiles is None:
+        return fallback_sections()
+    resume, job = profiles
+    return [run_section_analyzer(name, resume, job, willing_to_relocate) for name in SECTION_ANALYZERS]
+
+
+def build_section_profiles(resume_text, job_description):
+    """
+    Parse both documents for the section analyzers.
     
-    # Analyze Location
+    Returns:
+        tuple or None: (ResumeProfile, JobProfile), or None if extraction
+            raised (every section then falls back, as if its analyzer had failed)
+    """
     try:
-        sections.append(analyze_location_section(resume_text, job_description, willing_to_relocate))
+        return as_resume_profile(resume_text), as_job_profile(job_description)
     except Exception as e:
-        print(f"Error analyzing location: {e}")
-        sections.append({
-            'icon': '📍',
-            'title': 'Location',
-            'status': 'good',
-            'missing': [],
-            'recommendation': 'Unable to analyze location section.'
-        })
+        print(f"Error extracting resume features: {e}")
+        return None
+
+
+def fallback_sections():
+    """Placeholder results for every section, used when the documents cannot be parsed"""
+    return [dict(fallback, missing=[]) for _, fallback in SECTION_ANALYZERS.values()]
+
+
+def run_section_analyzer(name, resume, job, willing_to_relocate=None):
+    """
+    Run one SECTION_ANALYZERS entry, falling back to a placeholder result
+    if the analyzer raises.
     
-    # Analyze Keywords
+    Args:
+        name (str): Key in SECTION_ANALYZERS
+        resume (ResumeProfile): Resume profile
+        job (JobProfile): Job description profile
+        willing_to_relocate (bool or None): User's relocation preference
+        
+    Returns:
+        dict: Section analysis
+    """
+    analyzer, fallback = SECTION_ANALYZERS[name]
     try:
-        sections.append(analyze_keywords_section(resume_text, job_description))
+        if analyzer is analyze_location_section:
+            return analyzer(resume, job, willing_to_relocate)
+        return analyzer(resume, job)
     except Exception as e:
-        print(f"Error analyzing keywords: {e}")
-        sections.append({
-            'icon': '🔑',
-            'title': 'Important Keywords',
-            'status': 'good',
-            'missing': [],
-            'recommendation': 'Unable to analyze keywords.'
-        })
-    
-    return sections
+        print(f"Error analyzing {name}: {e}")
+        return dict(fallback, missing=[])
 
 
+@timed()
 def analyze_skills_section(resume_text, job_description):
     """
     Analyze skills and technologies section
     
     Args:
-        resume_text (str): Resume text
-        job_description (str): Job description text
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
         
     Returns:
         dict: Analysis results for skills section
     """
-    resume_skills = set([
-        normalize_skill(s) for s in extract_skills(resume_text)
-    ])
-
-    job_skills = set([
-        normalize_skill(s) for s in extract_skills(job_description)
-    ])
-    resume_tech = set(extract_technologies(resume_text))
-    job_tech = set(extract_technologies(job_description))
+    resume = as_resume_profile(resume_text)
+    job = as_job_profile(job_description)
 
-    # Normalize before comparing
-    resume_tech_normalized = set([normalize_skill(t) for t in resume_tech])
-    job_tech_normalized = set([normalize_skill(t) for t in job_tech])
-
-    missing_tech = job_tech_normalized - resume_tech_normalized
-    missing_skills = job_skills - resume_skills
-    
-    # Combine and deduplicate missing items
-    all_missing = list(set(list(missing_skills) + list(missing_tech)))
+    # Missing skills and technologies, combined and deduplicated (in taxonomy ID order)
+    missing_bits = (job.skill_bits & ~resume.skill_bits) | (job.tech_bits & ~resume.tech_bits)
+    all_missing = TAXONOMY.decode(missing_bits)
     missing_count = len(all_missing)
     
     if missing_count == 0:
@@ -171,59 +124,44 @@ def analyze_skills_section(resume_text, job_description):
         'missing': [],  # Empty - all info is in recommendation
         'recommendation': recommendation,
         'match_ratio': (
-            len(resume_tech_normalized & job_tech_normalized) /
-            len(job_tech_normalized)
-            if job_tech_normalized else 1
+            popcount(resume.tech_bits & job.tech_bits) / popcount(job.tech_bits)
+            if job.tech_bits else 1
         )
     }
 
 
+@timed()
 def analyze_projects_section(resume_text, job_description):
     """
     Analyze projects section
     
     Args:
-        resume_text (str): Resume text
-        job_description (str): Job description text
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
         
     Returns:
         dict: Analysis results for projects section
     """
-    project_section = extract_projects(resume_text)
-    job_tech = set(extract_technologies(job_description))
-    job_skills = set([s.lower() for s in extract_skills(job_description)])
-    
-    # Extract technologies mentioned in projects
-    project_tech = set()
-    if project_section:
-        project_tech = set(extract_technologies(project_section))
-    
+    resume = as_resume_profile(resume_text)
+    job = as_job_profile(job_description)
+    project_section = resume.projects
+
     # Check if projects use relevant technologies
-    relevant_project_tech = project_tech & (job_tech | job_skills)
+    relevant_project_tech = popcount(resume.project_tech_bits & (job.tech_bits | job.skill_bits))
     
     # Count number of projects - improved detection
-    project_count = count_projects(project_section)
+    project_count = resume.project_count
     
     # If project section is empty but we see project-like content in resume
     if project_count == 0:
         # Check for project indicators in the full resume
-        project_indicators = [
-            r'(?:developed|built|created|engineered|designed)\s+(?:a|an)\s+\w+\s+(?:website|application|app|platform|system)',
-            r'(?:project|portfolio)\s*:',
-            r'\d{2}/\d{4}\s*-\s*\d{2}/\d{4}',  # Date ranges
-        ]
-        
-        for pattern in project_indicators:
-            matches = re.findall(pattern, resume_text, re.IGNORECASE)
+        for pattern in PROJECT_INDICATOR_PATTERNS:
+            matches = pattern.findall(resume.text)
             if matches:
                 project_count = max(project_count, len(matches))
     
     # Determine project type alignment
-    job_type = None
-    for role_type, keywords in JOB_TYPE_KEYWORDS.items():
-        if any(kw in job_description.lower() for kw in keywords):
-            job_type = role_type
-            break
+    job_type = job.job_type
     
     resume_has_relevant_projects = False
     if project_section and job_type:
@@ -247,7 +185,7 @@ def analyze_projects_section(resume_text, job_description):
         )
         projects_missing = ["Projects section"]
 
-    elif project_count >= 3 and len(relevant_project_tech) >= 2:
+    elif project_count >= 3 and relevant_project_tech >= 2:
         # Has 3+ projects with relevant tech
         projects_status = "good"
         projects_recommendation = (
@@ -255,7 +193,7 @@ def analyze_projects_section(resume_text, job_description):
         )
         projects_missing = []
 
-    elif project_count >= 2 and len(relevant_project_tech) >= 2:
+    elif project_count >= 2 and relevant_project_tech >= 2:
         # Has 2+ projects with relevant tech
         projects_status = "good"
         projects_recommendation = (
@@ -266,7 +204,7 @@ def analyze_projects_section(resume_text, job_description):
     elif project_count >= 2:
         # Has 2+ projects but not enough relevant tech
         projects_status = "weak"
-        missing_techs = list(job_tech - project_tech)[:5]
+        missing_techs = TAXONOMY.decode(job.tech_bits & ~resume.project_tech_bits)[:5]
         if missing_techs:
             # Make each tech bold
             bold_techs = ', '.join([f"**{tech}**" for tech in missing_techs])
@@ -284,7 +222,7 @@ def analyze_projects_section(resume_text, job_description):
     else:
         # Has only 1 project
         projects_status = "weak"
-        top_tech = list(job_tech)[:5]
+        top_tech = TAXONOMY.decode(job.tech_bits)[:5]
         if top_tech:
             # Make each tech bold
             bold_techs = ', '.join([f"**{tech}**" for tech in top_tech])
@@ -308,30 +246,33 @@ def analyze_projects_section(resume_text, job_description):
         'recommendation': projects_recommendation,
         'project_count': project_count,
         'relevant_project_ratio': (
-            len(relevant_project_tech) / len(job_tech)
-            if job_tech else 1
+            relevant_project_tech / popcount(job.tech_bits)
+            if job.tech_bits else 1
         )
     }
 
 
+@timed()
 def analyze_education_section(resume_text, job_description):
     """
     Analyze education section
     
     Args:
-        resume_text (str): Resume text
-        job_description (str): Job description text
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
         
     Returns:
         dict: Analysis results for education section
     """
-    resume_education = extract_education(resume_text)
-    job_education = extract_education(job_description)
+    resume = as_resume_profile(resume_text)
+    job = as_job_profile(job_description)
+    resume_education = resume.education
+    job_education = job.education
     
     if job_education:
-        job_edu_reqs = [k for k in EDUCATION_KEYWORDS if k in job_education.lower()]
+        job_edu_reqs = list(job.education_requirements)
         resume_has_edu = (
-            any(k in resume_education.lower() for k in EDUCATION_KEYWORDS) 
+            bool(resume.education_keywords)
             if resume_education else False
         )
         
@@ -362,19 +303,20 @@ def analyze_education_section(resume_text, job_description):
     }
 
 
+@timed()
 def analyze_experience_section(resume_text, job_description):
     """
     Analyze experience section
     
     Args:
-        resume_text (str): Resume text
-        job_description (str): Job description text
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
         
     Returns:
         dict: Analysis results for experience section
     """
-    resume_exp_years = extract_experience_years(resume_text)
-    job_exp_years = extract_experience_years(job_description)
+    resume_exp_years = as_resume_profile(resume_text).experience_years
+    job_exp_years = as_job_profile(job_description).experience_years
     
     if resume_exp_years and job_exp_years:
         resume_min, resume_max = resume_exp_years if isinstance(resume_exp_years, tuple) else (resume_exp_years, resume_exp_years)
@@ -460,20 +402,21 @@ def analyze_experience_section(resume_text, job_description):
     }
 
 
+@timed()
 def analyze_location_section(resume_text, job_description, willing_to_relocate=None):
     """
     Analyze location section with relocation preference
     
     Args:
-        resume_text (str): Resume text
-        job_description (str): Job description text
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
         willing_to_relocate (bool or None): User's relocation preference
         
     Returns:
         dict: Analysis results for location section
     """
-    resume_location = extract_location(resume_text)
-    job_location = extract_location(job_description)
+    resume_location = as_resume_profile(resume_text).location
+    job_location = as_job_profile(job_description).location
     
     if job_location:
         if resume_location:
@@ -540,21 +483,22 @@ def analyze_location_section(resume_text, job_description, willing_to_relocate=N
     }
 
 
+@timed()
 def analyze_keywords_section(resume_text, job_description):
     """
     Analyze important keywords section
     
     Args:
-        resume_text (str): Resume text
-        job_description (str): Job description text
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
         
     Returns:
         dict: Analysis results for keywords section
     """
-    job_words = set(job_description.lower().split())
-    resume_words = set(resume_text.lower().split())
+    job_keywords = as_job_profile(job_description).important_keywords
+    resume_keywords = as_resume_profile(resume_text).important_keywords
     
-    missing_important = [kw for kw in IMPORTANT_KEYWORDS if kw in job_words and kw not in resume_words]
+    missing_important = [kw for kw in IMPORTANT_KEYWORDS if kw in job_keywords and kw not in resume_keywords]
     
     if len(missing_important) > 5:
         status = "weak"
@@ -584,4 +528,51 @@ def analyze_keywords_section(resume_text, job_description):
         'status': status,
         'missing': [],  # Empty - all info is in recommendation
         'recommendation': recommendation
-    }
\ No newline at end of file
+    }
+
+
+# Section analyzers in report order, each with the result used if it raises
+SECTION_ANALYZERS = {
+    'skills': (analyze_skills_section, {
+        'icon': '⚙️',
+        'title': 'Skills & Technologies',
+        'status': 'missing',
+        'missing': [],
+        'recommendation': 'Unable to analyze skills section.'
+    }),
+    'projects': (analyze_projects_section, {
+        'icon': '🚀',
+        'title': 'Projects',
+        'status': 'missing',
+        'missing': [],
+        'recommendation': 'Unable to analyze projects section.'
+    }),
+    'experience': (analyze_experience_section, {
+        'icon': '💼',
+        'title': 'Experience Level',
+        'status': 'missing',
+        'missing': [],
+        'recommendation': 'Unable to analyze experience section.'
+    }),
+    'education': (analyze_education_section, {
+        'icon': '🎓',
+        'title': 'Education',
+        'status': 'good',
+        'missing': [],
+        'recommendation': 'Unable to analyze education section.'
+    }),
+    'location': (analyze_location_section, {
+        'icon': '📍',
+        'title': 'Location',
+        'status': 'good',
+        'missing': [],
+        'recommendation': 'Unable to analyze location section.'
+    }),
+    'keywords': (analyze_keywords_section, {
+        'icon': '🔑',
+        'title': 'Important Keywords',
+        'status': 'good',
+        'missing': [],
+        'recommendation': 'Unable to analyze keywords.'
+    }),
+}
@@ -1,31 +1,22 @@
 """
 Similarity calculation and scoring utilities
 NO NLTK DEPENDENCIES - uses pure Python for tokenization
+scikit-learn is imported on first use to keep application start-up fast
 """
 
-import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
-from config import IMPORTANT_KEYWORDS, SCORE_WEIGHTS, JOB_TYPE_KEYWORDS
-from feature_extractors import extract_skills, extract_technologies, normalize_skill
-from text_extractors import clean_text
-
-# Basic English stopwords (no NLTK dependency)
-STOPWORDS = {
-    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-    'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
-    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-    'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each',
-    'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
-    'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just',
-    'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our',
-    'their', 'am', 'into', 'through', 'during', 'before', 'after', 'above',
-    'below', 'up', 'down', 'out', 'off', 'over', 'under', 'again', 'further',
-    'then', 'once', 'here', 'there', 'all', 'any', 'both', 'each', 'few'
-}
+import os
+from functools import lru_cache
+
+from config import SCORE_WEIGHTS, TFIDF_MODEL_PATH
+from instrumentation import stage, timed
+from profiles import as_job_profile, as_resume_profile
+from skill_taxonomy import popcount
+from text_extractors import clean_text, remove_stopwords, STOPWORDS  # noqa: F401 (re-exported)
+
+# TF-IDF vectorizer settings
+TFIDF_NGRAM_RANGE = (1, 2)
+TFIDF_MAX_FEATURES = 500
+
 
 def calculate_expected_score(current_score, sections_analysis):
     """
@@ -54,112 +45,181 @@ def calculate_expected_score(current_score, sections_analysis):
     return round(expected, 2), total_gain
 
 
-def remove_stopwords(text):
+@lru_cache(maxsize=1)
+def get_corpus_model():
     """
-    Remove stopwords from text using simple word splitting.
-    No NLTK dependency - uses basic string operations.
+    Load the corpus TF-IDF model once per process.
+    
+    Returns:
+        CorpusTfidfModel or None: None when no model is configured
     """
-    # Simple word splitting - split on whitespace
-    words = text.split()
+    if not TFIDF_MODEL_PATH or not os.path.exists(TFIDF_MODEL_PATH):
+        return None
+
+    from tfidf_model import CorpusTfidfModel
+    return CorpusTfidfModel.load(TFIDF_MODEL_PATH)
+
+
+@timed('similarity.tfidf')
+def tfidf_similarity(resume_processed, job_processed):
+    """
+    TF-IDF cosine similarity between one resume and one job description.
+    Uses the corpus model when one is configured, otherwise fits a
+    vectorizer on the two documents.
     
-    # Remove stopwords (case-insensitive)
-    filtered_words = [word for word in words if word.lower() not in STOPWORDS]
+    Args:
+        resume_processed (str): Cleaned, stopword-free resume text
+        job_processed (str): Cleaned, stopword-free job description text
+        
+    Returns:
+        float: Raw cosine similarity
+    """
+    model = get_corpus_model()
+    if model is not None:
+        return model.similarity(resume_processed, job_processed)
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    vectorizer = TfidfVectorizer(ngram_range=TFIDF_NGRAM_RANGE, max_features=TFIDF_MAX_FEATURES)
+    tfidf_matrix = vectorizer.fit_transform([resume_processed, job_processed])
+    return cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+
+
+def tfidf_similarities(resume_processed, jobs_processed):
+    """
+    TF-IDF cosine similarity between one resume and many job descriptions.
+    Each score equals tfidf_similarity() for that pair. With a corpus model
+    every document is transformed in one call. Without one, n-grams are
+    counted once for all documents. Each pair then gets the weighting a
+    vectorizer fitted on just those two documents would give it (the same
+    max_features cut and two-document IDF), so batch and single scores
+    agree without refitting per posting.
     
-    return " ".join(filtered_words)
+    Args:
+        resume_processed (str): Cleaned, stopword-free resume text
+        jobs_processed (list): Cleaned, stopword-free job description texts
+        
+    Returns:
+        numpy.ndarray: Raw cosine similarity per job description
+    """
+    documents = [resume_processed] + list(jobs_processed)
+    model = get_corpus_model()
+    if model is not None:
+        # Fixed corpus IDF: rows are L2-normalized, so dot product = cosine
+        tfidf_matrix = model.transform(documents)
+        return (tfidf_matrix[1:] @ tfidf_matrix[0].T).toarray().ravel()
 
+    import numpy as np
+    from sklearn.feature_extraction.text import CountVectorizer
 
-def calculate_similarity(resume_text, job_description, sections=None):
+    try:
+        counts = CountVectorizer(ngram_range=TFIDF_NGRAM_RANGE).fit_transform(documents).tocsr()
+    except ValueError:
+        # No document has a single token
+        return np.zeros(len(documents) - 1)
+    return _pairwise_tfidf_cosines(counts, TFIDF_MAX_FEATURES)
+
+
+def _pairwise_tfidf_cosines(counts, max_features):
     """
-    Calculate similarity score between resume and job description.
+    Cosine of row 0 of a count matrix against every other row, each pair
+    weighted like TfidfVectorizer(max_features=max_features) fitted on the two rows
+    """
+    import numpy as np
+
+    resume = counts[0].toarray().ravel()
+    resume_columns = counts[0].indices
+    scores = np.zeros(counts.shape[0] - 1)
+    for row in range(1, counts.shape[0]):
+        job_row = counts[row]
+        # Columns are in alphabetical n-gram order, as in a fitted vectorizer
+        columns = np.union1d(resume_columns, job_row.indices)
+        a = resume[columns]
+        b = np.zeros(len(columns), dtype=counts.dtype)
+        b[np.searchsorted(columns, job_row.indices)] = job_row.data
+        if len(columns) > max_features:
+            # Same selection as TfidfVectorizer: the most frequent n-grams of the pair
+            keep = np.sort((-(a + b)).argsort()[:max_features])
+            a, b = a[keep], b[keep]
+
+        # Smoothed IDF over two documents: ln((1 + 2) / (1 + df)) + 1
+        idf = np.log(3.0 / (1 + (a > 0) + (b > 0))) + 1
+        weighted_a, weighted_b = a * idf, b * idf
+        norm = np.linalg.norm(weighted_a) * np.linalg.norm(weighted_b)
+        scores[row - 1] = weighted_a @ weighted_b / norm if norm else 0.0
+    return scores
+
+
+def combine_similarity(raw_tfidf, resume_text, job_description, sections=None):
+    """
+    Combine a raw TF-IDF similarity with the skills, keywords and section
+    sub-scores into the final weighted match score.
     
     Args:
-        resume_text (str): Resume text
-        job_description (str): Job description text
+        raw_tfidf (float): Raw TF-IDF cosine similarity
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
         sections (list, optional): Pre-analyzed sections
         
     Returns:
-        tuple: (similarity_score, resume_processed, job_processed)
+        float: Final score (0-100)
     """
-    resume_processed = remove_stopwords(clean_text(resume_text))
-    job_processed = remove_stopwords(clean_text(job_description))
-
-    # ---------- TF-IDF ----------
-    vectorizer = TfidfVectorizer(ngram_range=(1, 2), max_features=500)
-    tfidf_matrix = vectorizer.fit_transform([resume_processed, job_processed])
-    raw_tfidf = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+    resume = as_resume_profile(resume_text)
+    job = as_job_profile(job_description)
 
-    if len(job_description.split()) < 150:
+    if job.word_count < 150:
         tfidf_score = min(1.0, raw_tfidf * 1.2)
     else:
         tfidf_score = raw_tfidf
 
     # ---------- Skills ----------
-    resume_skills = set([s.lower() for s in extract_skills(resume_text)])
-    job_skills = set([s.lower() for s in extract_skills(job_description)])
-    resume_tech = set(normalize_skill(t) for t in extract_technologies(resume_text))
-    job_tech = set(normalize_skill(t) for t in extract_technologies(job_description))
-    all_resume = resume_skills | resume_tech
-    all_job = job_skills | job_tech
-
-    if all_job:
-        skills_score = len(all_resume & all_job) / len(all_job)
-    else:
-        skills_score = 0.5
+    with stage('similarity.skills'):
+        all_resume = resume.skill_bits | resume.tech_bits
+        all_job = job.skill_bits | job.tech_bits
 
-    # Required skills boost
-    required_match = re.search(
-        r'required skills.*?(?=\n\n|\Z)',
-        job_description.lower(),
-        re.DOTALL
-    )
-
-    if required_match:
-        required_text = required_match.group(0)
-        required_tech = set(extract_technologies(required_text))
+        if all_job:
+            skills_score = popcount(all_resume & all_job) / popcount(all_job)
+        else:
+            skills_score = 0.5
 
+        # Required skills boost
+        required_tech = job.required_bits
         if required_tech:
-            matched_required = required_tech & all_resume
-            ratio = len(matched_required) / len(required_tech)
+            ratio = popcount(required_tech & all_resume) / popcount(required_tech)
             skills_score *= (1 + ratio * 0.3)
 
-    skills_score = min(skills_score, 1.0)
+        skills_score = min(skills_score, 1.0)
 
     # ---------- Important Keywords ----------
-    job_words = set(job_description.lower().split())
-    resume_words = set(resume_text.lower().split())
+    with stage('similarity.keywords'):
+        job_imp = job.important_keywords
+        resume_imp = resume.important_keywords
 
-    job_imp = set([kw for kw in IMPORTANT_KEYWORDS if kw in job_words])
-    resume_imp = set([kw for kw in IMPORTANT_KEYWORDS if kw in resume_words])
-
-    if job_imp:
-        keywords_score = len(resume_imp & job_imp) / len(job_imp)
-    else:
-        keywords_score = 0.5
+        if job_imp:
+            keywords_score = len(resume_imp & job_imp) / len(job_imp)
+        else:
+            keywords_score = 0.5
 
     # ---------- Section Score ----------
     # Use sections if provided, otherwise create basic score
-    if sections:
-        section_scores = []
-        for s in sections:
-            if s['status'] == "missing":
-                section_scores.append(0.4)
-            elif s['status'] == "weak":
-                section_scores.append(0.7)
-            else:
-                section_scores.append(0.95)
-
-        sections_score = sum(section_scores) / len(section_scores) if section_scores else 0.8
-    else:
-        sections_score = 0.8
+    with stage('similarity.sections'):
+        if sections:
+            section_scores = []
+            for s in sections:
+                if s['status'] == "missing":
+                    section_scores.append(0.4)
+                elif s['status'] == "weak":
+                    section_scores.append(0.7)
+                else:
+                    section_scores.append(0.95)
 
-    # ---------- Dynamic Role Weight ----------
-    job_type = None
-    job_lower = job_description.lower()
+            sections_score = sum(section_scores) / len(section_scores) if section_scores else 0.8
+        else:
+            sections_score = 0.8
 
-    for role, keywords in JOB_TYPE_KEYWORDS.items():
-        if any(kw in job_lower for kw in keywords):
-            job_type = role
-            break
+    # ---------- Dynamic Role Weight ----------
+    job_type = job.job_type
 
     if job_type == "frontend":
         weights = {'tfidf': 0.25, 'skills': 0.45, 'keywords': 0.20, 'sections': 0.10}
@@ -175,4 +235,26 @@ def calculate_similarity(resume_text, job_description, sections=None):
         sections_score * weights['sections']
     ) * 100
 
-    return round(final_score, 2), resume_processed, job_processed
\ No newline at end of file
+    return round(final_score, 2)
+
+
+@timed()
+def calculate_similarity(resume_text, job_description, sections=None):
+    """
+    Calculate similarity score between resume and job description.
+    
+    Args:
+        resume_text (str or ResumeProfile): Resume text or its prebuilt profile
+        job_description (str or JobProfile): Job description text or its prebuilt profile
+        sections (list, optional): Pre-analyzed sections
+        
+    Returns:
+        tuple: (similarity_score, resume_processed, job_processed)
+    """
+    resume = as_resume_profile(resume_text)
+    job = as_job_profile(job_description)
+
+    raw_tfidf = tfidf_similarity(resume.processed, job.processed)
+    final_score = combine_similarity(raw_tfidf, resume, job, sections)
+
+    return final_score, resume.processed, job.processed
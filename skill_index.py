@@ -0,0 +1,666 @@
+"""
+Inverted skill index
+Maps canonical skills, role tags, locations and experience to compressed
+posting lists of resume IDs, so candidate queries need no re-extraction
+
+Indexed terms ('field:value'):
+    skill:kubernetes   canonical skill or technology (aliases resolve via skill_taxonomy)
+    role:backend       every JOB_TYPE_KEYWORDS role the resume mentions
+    loc:bangalore      extracted location (each comma-separated part)
+    exp:3              years of experience, the top of the stated range (EXPERIENCE_BUCKET_MAX means "or more")
+
+Query syntax (NOT binds tightest, then AND, then OR; adjacent terms are ANDed):
+    kubernetes AND docker AND exp>=3
+    (react OR vue) role:frontend NOT loc:remote
+    loc:"new york" OR loc:remote
+Bare words are skills. exp supports >=, >, <=, < and =.
+
+Posting lists are sorted document numbers stored as delta-encoded varints.
+Document numbers only grow, so adding a resume appends to the end of its
+terms' lists. Re-adding or removing a resume ID tombstones its old number,
+and compact() rewrites the lists without tombstones. Commands that change
+the index hold an exclusive lock on '<index>.lock', so concurrent runs
+apply their changes one after another instead of overwriting each other.
+
+Usage:
+    python skill_index.py add resumes/ [--workers 8]
+    python skill_index.py query "kubernetes AND docker AND exp>=3"
+    python skill_index.py remove resumes/old.pdf
+    python skill_index.py stats
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import tempfile
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import JOB_TYPE_KEYWORDS, SKILL_INDEX_PATH
+from feature_extractors import detect_role_types
+from patterns import QUERY_TOKEN_PATTERN, WHITESPACE_PATTERN
+from profiles import ResumeProfile, as_resume_profile
+from skill_taxonomy import TAXONOMY
+
+MAGIC = b'ATSIDX01'
+# magic, header JSON length
+_HEADER = struct.Struct('<8sI')
+
+FIELDS = ('skill', 'role', 'loc', 'exp')
+DEFAULT_FIELD = 'skill'
+OPERATORS = ('AND', 'OR', 'NOT')
+
+# Experience is bucketed by whole years; this bucket holds everything above it
+EXPERIENCE_BUCKET_MAX = 20
+# Upper bound extract_experience_years() reports for open-ended "X+ years"
+EXPERIENCE_OPEN_ENDED = 999
+
+
+# ---------- Posting list encoding ----------
+
+def encode_varint(value: int, out: bytearray):
+    """Append an unsigned LEB128 varint"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def encode_postings(doc_ids: Iterable[int]) -> bytes:
+    """Delta + varint encode sorted, distinct document numbers"""
+    out = bytearray()
+    previous = 0
+    for doc_id in doc_ids:
+        encode_varint(doc_id - previous, out)
+        previous = doc_id
+    return bytes(out)
+
+
+def decode_postings(data) -> List[int]:
+    """Decode a posting list written by encode_postings()"""
+    doc_ids = []
+    doc_id = 0
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        doc_id += value
+        doc_ids.append(doc_id)
+        value = 0
+        shift = 0
+    return doc_ids
+
+
+# ---------- Posting list algebra (sorted lists of document numbers) ----------
+
+def intersect(a: List[int], b: List[int]) -> List[int]:
+    """Intersection of two sorted lists"""
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return []
+
+    if len(b) > 8 * len(a):
+        # Much shorter list: binary-search each of its entries in the longer one
+        result = []
+        lo = 0
+        for doc_id in a:
+            lo = bisect_left(b, doc_id, lo)
+            if lo == len(b):
+                break
+            if b[lo] == doc_id:
+                result.append(doc_id)
+        return result
+
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            result.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def union(lists: List[List[int]]) -> List[int]:
+    """Union of sorted lists"""
+    if len(lists) == 1:
+        return lists[0]
+    merged = set()
+    for doc_ids in lists:
+        merged.update(doc_ids)
+    return sorted(merged)
+
+
+def difference(a: List[int], b: List[int]) -> List[int]:
+    """Entries of sorted list a that are not in b"""
+    if not b:
+        return a
+    excluded = set(b)
+    return [doc_id for doc_id in a if doc_id not in excluded]
+
+
+# ---------- Terms ----------
+
+def normalize_value(field: str, value: str) -> str:
+    """Canonical form of a term value (skill aliases resolved, locations case-folded)"""
+    value = WHITESPACE_PATTERN.sub(' ', value).strip().lower()
+    if field == 'skill':
+        return TAXONOMY.canonical(value) or value
+    return value
+
+
+def resume_terms(resume) -> List[str]:
+    """
+    Index terms for a resume.
+
+    Args:
+        resume (str or ResumeProfile): Resume text or its prebuilt profile
+
+    Returns:
+        list: 'field:value' terms
+    """
+    resume = as_resume_profile(resume)
+    terms = [f'skill:{skill}' for skill in TAXONOMY.decode(resume.skill_bits | resume.tech_bits)]
+    terms.extend(f'role:{role_type}' for role_type in detect_role_types(resume.text))
+    if resume.location:
+        # "San Francisco, CA" is findable as loc:"san francisco" and loc:ca
+        terms.extend(f"loc:{normalize_value('loc', part)}" for part in resume.location.split(',') if part.strip())
+    if resume.experience_years:
+        terms.append(f'exp:{experience_bucket(resume.experience_years)}')
+    return terms
+
+
+def experience_bucket(experience_years: Tuple[int, int]) -> int:
+    """
+    Bucket for a (min, max) experience range: its top, since a resume stating
+    "3-5 years" has five, except for open-ended "X+ years" where only X is known
+    """
+    low, high = experience_years
+    years = low if high >= EXPERIENCE_OPEN_ENDED else max(low, high)
+    return min(years, EXPERIENCE_BUCKET_MAX)
+
+
+def experience_terms(op: str, years: int) -> List[str]:
+    """exp:N terms satisfying 'exp <op> years'"""
+    if op == '>':
+        op, years = '>=', years + 1
+    elif op == '<':
+        op, years = '<=', years - 1
+
+    if op == '>=':
+        buckets = range(min(years, EXPERIENCE_BUCKET_MAX), EXPERIENCE_BUCKET_MAX + 1)
+    elif op == '<=':
+        buckets = range(0, min(years, EXPERIENCE_BUCKET_MAX) + 1)
+    else:
+        buckets = [min(years, EXPERIENCE_BUCKET_MAX)]
+    return [f'exp:{bucket}' for bucket in buckets]
+
+
+# ---------- Query parsing ----------
+
+def tokenize_query(query: str) -> List[Tuple[str, object]]:
+    """
+    Split a query into ('(' | ')' | 'AND' | 'OR' | 'NOT' | 'terms', value) tokens.
+
+    Raises:
+        ValueError: On syntax errors, unknown fields, and skills or roles that
+            are not in the indexed vocabulary
+    """
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = QUERY_TOKEN_PATTERN.match(query, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Cannot parse query at: {query[position:]!r}")
+        position = match.end()
+
+        if match.group('paren'):
+            tokens.append((match.group('paren'), None))
+        elif match.group('exp_field'):
+            tokens.append(('terms', experience_terms(match.group('exp_op'), int(match.group('exp_years')))))
+        else:
+            field = (match.group('field') or '').lower()
+            value = match.group('quoted') if match.group('quoted') is not None else match.group('word')
+            if not field and match.group('quoted') is None and value.upper() in OPERATORS:
+                tokens.append((value.upper(), None))
+                continue
+            field = field or DEFAULT_FIELD
+            if field not in FIELDS:
+                raise ValueError(f"Unknown field {field!r} (expected one of {FIELDS})")
+            value = normalize_value(field, value)
+            # Only vocabulary skills and roles are indexed; any other value could never match
+            if field == 'skill' and TAXONOMY.skill_id(value) is None:
+                roles = [role for role, keywords in JOB_TYPE_KEYWORDS.items() if value in keywords]
+                hint = f"; it is a keyword of role:{roles[0]}" if roles else ""
+                raise ValueError(f"Unknown skill {value!r}: it is not in the skill taxonomy, so it is never indexed{hint}")
+            if field == 'role' and value not in JOB_TYPE_KEYWORDS:
+                raise ValueError(f"Unknown role {value!r} (expected one of {tuple(JOB_TYPE_KEYWORDS)})")
+            tokens.append(('terms', [f'{field}:{value}']))
+    return tokens
+
+
+class _QueryParser:
+    """Recursive-descent parser producing ('or' | 'and', [nodes]), ('not', node) or ('terms', [terms])"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def take(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Empty query")
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected {self.peek()!r} in query")
+        return node
+
+    def parse_or(self):
+        nodes = [self.parse_and()]
+        while self.peek() == 'OR':
+            self.take()
+            nodes.append(self.parse_and())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def parse_and(self):
+        nodes = [self.parse_not()]
+        while self.peek() in ('AND', 'NOT', 'terms', '('):
+            if self.peek() == 'AND':
+                self.take()
+            nodes.append(self.parse_not())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def parse_not(self):
+        if self.peek() == 'NOT':
+            self.take()
+            return ('not', self.parse_not())
+        return self.parse_atom()
+
+    def parse_atom(self):
+        kind = self.peek()
+        if kind == '(':
+            self.take()
+            node = self.parse_or()
+            if self.peek() != ')':
+                raise ValueError("Missing ')' in query")
+            self.take()
+            return node
+        if kind == 'terms':
+            return self.take()
+        raise ValueError(f"Expected a term, got {kind or 'end of query'!r}")
+
+
+def parse_query(query: str):
+    """Parse a boolean candidate query into a syntax tree"""
+    return _QueryParser(tokenize_query(query)).parse()
+
+
+# ---------- Index ----------
+
+class SkillIndex:
+    """
+    Inverted index from terms to resume IDs.
+
+    Resumes are identified by caller-side string IDs (e.g. file paths) and
+    stored under internal document numbers assigned in insertion order.
+    """
+
+    def __init__(self):
+        self.resume_ids: List[Optional[str]] = []   # document number -> resume ID (None = tombstone)
+        self._doc_of: Dict[str, int] = {}
+        self._postings: Dict[str, bytearray] = {}
+        self._last: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        self.tombstones = 0
+
+    def __len__(self):
+        return len(self._doc_of)
+
+    def __contains__(self, resume_id):
+        return resume_id in self._doc_of
+
+    def add(self, resume_id: str, resume) -> List[str]:
+        """
+        Index a resume, replacing any earlier version with the same ID.
+
+        Args:
+            resume_id (str): Caller-side identifier
+            resume (str or ResumeProfile): Resume text or its prebuilt profile
+
+        Returns:
+            list: The terms indexed for the resume
+        """
+        terms = resume_terms(resume)
+        self.add_terms(resume_id, terms)
+        return terms
+
+    def add_terms(self, resume_id: str, terms: Iterable[str]):
+        """Index precomputed resume_terms() for a resume ID"""
+        self.remove(resume_id)
+        doc_id = len(self.resume_ids)
+        self.resume_ids.append(resume_id)
+        self._doc_of[resume_id] = doc_id
+
+        for term in set(terms):
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = bytearray()
+                previous = 0
+            else:
+                previous = self._last[term]
+            encode_varint(doc_id - previous, postings)
+            self._last[term] = doc_id
+            self._counts[term] = self._counts.get(term, 0) + 1
+
+    def remove(self, resume_id: str) -> bool:
+        """Tombstone a resume; returns False when the ID is not indexed"""
+        doc_id = self._doc_of.pop(resume_id, None)
+        if doc_id is None:
+            return False
+        self.resume_ids[doc_id] = None
+        self.tombstones += 1
+        return True
+
+    def postings(self, term: str) -> List[int]:
+        """Document numbers for a term, tombstones included"""
+        data = self._postings.get(term)
+        return decode_postings(data) if data else []
+
+    def document_frequency(self, term: str) -> int:
+        """Number of postings for a term, tombstones included"""
+        return self._counts.get(term, 0)
+
+    def terms(self, field: Optional[str] = None) -> List[str]:
+        """Indexed terms, optionally limited to one field"""
+        prefix = f'{field}:' if field else ''
+        return sorted(term for term in self._postings if term.startswith(prefix))
+
+    def _evaluate(self, node) -> List[int]:
+        kind, value = node
+        if kind == 'terms':
+            return union([self.postings(term) for term in value])
+        if kind == 'or':
+            return union([self._evaluate(child) for child in value])
+        if kind == 'not':
+            return difference(self._all_documents(), self._evaluate(value))
+
+        # AND: intersect the positive lists, shortest first, then subtract the negated ones
+        positive = [child for child in value if child[0] != 'not']
+        negative = [child[1] for child in value if child[0] == 'not']
+        lists = sorted((self._evaluate(child) for child in positive), key=len)
+        result = lists[0] if lists else self._all_documents()
+        for doc_ids in lists[1:]:
+            if not result:
+                break
+            result = intersect(result, doc_ids)
+        for child in negative:
+            if not result:
+                break
+            result = difference(result, self._evaluate(child))
+        return result
+
+    def _all_documents(self) -> List[int]:
+        return [doc_id for doc_id, resume_id in enumerate(self.resume_ids) if resume_id is not None]
+
+    def search(self, query) -> List[str]:
+        """
+        Run a boolean query.
+
+        Args:
+            query (str or tuple): Query string, or a tree from parse_query()
+
+        Returns:
+            list: Matching resume IDs, in insertion order
+
+        Raises:
+            ValueError: If the query cannot be parsed
+        """
+        tree = parse_query(query) if isinstance(query, str) else query
+        resume_ids = self.resume_ids
+        return [resume_ids[doc_id] for doc_id in self._evaluate(tree) if resume_ids[doc_id] is not None]
+
+    def compact(self):
+        """Renumber live documents and rewrite the posting lists without tombstones"""
+        if not self.tombstones:
+            return
+        renumber = {}
+        live_ids = []
+        for doc_id, resume_id in enumerate(self.resume_ids):
+            if resume_id is not None:
+                renumber[doc_id] = len(live_ids)
+                live_ids.append(resume_id)
+
+        postings, last, counts = {}, {}, {}
+        for term, data in self._postings.items():
+            doc_ids = [renumber[doc_id] for doc_id in decode_postings(data) if doc_id in renumber]
+            if doc_ids:
+                postings[term] = bytearray(encode_postings(doc_ids))
+                last[term] = doc_ids[-1]
+                counts[term] = len(doc_ids)
+
+        self.resume_ids = live_ids
+        self._doc_of = {resume_id: doc_id for doc_id, resume_id in enumerate(live_ids)}
+        self._postings, self._last, self._counts = postings, last, counts
+        self.tombstones = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Document, tombstone, term and posting byte counts"""
+        return {
+            'resumes': len(self),
+            'tombstones': self.tombstones,
+            'terms': len(self._postings),
+            'posting_bytes': sum(len(data) for data in self._postings.values())
+        }
+
+    def save(self, path: str):
+        """Write the index atomically"""
+        terms = sorted(self._postings)
+        header = json.dumps({
+            'resume_ids': self.resume_ids,
+            'terms': [[term, self._counts[term], self._last[term], len(self._postings[term])] for term in terms]
+        }).encode('utf-8')
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER.pack(MAGIC, len(header)))
+                f.write(header)
+                for term in terms:
+                    f.write(self._postings[term])
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> 'SkillIndex':
+        """Read an index written by save()"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is not a skill index")
+        magic, header_length = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a skill index")
+        offset = _HEADER.size + header_length
+        header = json.loads(data[_HEADER.size:offset].decode('utf-8'))
+
+        index = cls()
+        index.resume_ids = header['resume_ids']
+        index._doc_of = {resume_id: doc_id for doc_id, resume_id in enumerate(index.resume_ids) if resume_id is not None}
+        index.tombstones = len(index.resume_ids) - len(index._doc_of)
+        for term, count, last, length in header['terms']:
+            index._postings[term] = bytearray(data[offset:offset + length])
+            index._last[term] = last
+            index._counts[term] = count
+            offset += length
+        return index
+
+    @classmethod
+    def open(cls, path: str) -> 'SkillIndex':
+        """Load an index, or start an empty one if the file does not exist"""
+        return cls.load(path) if os.path.exists(path) else cls()
+
+
+@contextmanager
+def index_lock(path: str):
+    """Hold an exclusive lock on '<path>.lock' while updating the index at path"""
+    with open(path + '.lock', 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# ---------- Ingestion ----------
+
+def pdf_resume_terms(path):
+    """
+    Extract and analyze one resume PDF inside a worker.
+    Never raises: returns (path, terms, error).
+    """
+    from text_extractors import extract_pdf_document
+
+    try:
+        with open(path, 'rb') as pdf_file:
+            # Already inside a pool worker: extract pages serially
+            text = extract_pdf_document(pdf_file, workers=1).text
+        if not text:
+            return path, None, "Could not extract text from PDF"
+        return path, resume_terms(ResumeProfile.from_text(text)), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def index_pdf_files(index: SkillIndex, paths, workers=None, chunk_size=8):
+    """
+    Add resume PDFs to an index, extracting them in a process pool.
+    Each resume is indexed under its path.
+
+    Returns:
+        list: (path, error) for the files that could not be indexed
+    """
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, terms, error in pool.map(pdf_resume_terms, paths, chunksize=chunk_size):
+            if error:
+                failed.append((path, error))
+            else:
+                index.add_terms(path, terms)
+    return failed
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Build and query the inverted skill index.")
+    parser.add_argument('--index', default=SKILL_INDEX_PATH, help=f"Index file (default: {SKILL_INDEX_PATH})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="Index resume PDFs (re-adding a path replaces it)")
+    add.add_argument('resumes', nargs='+', help="Resume PDFs or directories")
+    add.add_argument('--recursive', action='store_true', help="Include PDFs in subdirectories")
+    add.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+
+    query = commands.add_parser('query', help="List the resumes matching a boolean query")
+    query.add_argument('query', help='e.g. "kubernetes AND docker AND exp>=3"')
+    query.add_argument('--json', action='store_true', help="Print matches as a JSON list")
+
+    remove = commands.add_parser('remove', help="Remove resumes from the index")
+    remove.add_argument('resume_ids', nargs='+')
+
+    commands.add_parser('compact', help="Drop tombstoned resumes from the posting lists")
+    commands.add_parser('stats', help="Show index size")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    args = parse_args(argv)
+    if args.command in ('add', 'remove', 'compact'):
+        # Load, change and save under the lock so concurrent runs do not lose updates
+        with index_lock(args.index):
+            return _update_index(args, SkillIndex.open(args.index))
+
+    index = SkillIndex.open(args.index)
+    if args.command == 'query':
+        try:
+            matches = index.search(args.query)
+        except ValueError as e:
+            print(f"Invalid query: {e}", file=sys.stderr)
+            return 2
+        if args.json:
+            print(json.dumps(matches, ensure_ascii=False))
+        else:
+            for resume_id in matches:
+                print(resume_id)
+            print(f"{len(matches)} of {len(index)} resumes match", file=sys.stderr)
+        return 0
+
+    print(json.dumps(index.stats(), indent=2))
+    return 0
+
+
+def _update_index(args, index):
+    """Run an add, remove or compact command and save the index"""
+    from batch_rank import find_resumes
+
+    if args.command == 'add':
+        paths = []
+        for path in args.resumes:
+            paths.extend(find_resumes(path, args.recursive) if os.path.isdir(path) else [path])
+        if not paths:
+            print("No PDF files to index", file=sys.stderr)
+            return 1
+        failed = index_pdf_files(index, paths, args.workers)
+        for path, error in failed:
+            print(f"Failed: {path}: {error}", file=sys.stderr)
+        print(f"Indexed {len(paths) - len(failed)} resumes ({len(index)} total)")
+    elif args.command == 'remove':
+        removed = sum(index.remove(resume_id) for resume_id in args.resume_ids)
+        print(f"Removed {removed} resumes")
+    else:
+        index.compact()
+
+    index.save(args.index)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Skill taxonomy index
+Maps every skill surface form and synonym to a canonical integer ID with a
+category, and represents skill sets as fixed-width bitsets
+
+A skill set is a Python int whose bit i is set when skill ID i is present,
+so intersection, difference and category filtering are single bitwise
+operations. For batch work, bitsets are packed into a NumPy uint64 matrix
+(one row per document) and matched against a job in one vectorized step.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from config import SKILL_ALIASES, SKILL_CATEGORIES
+from feature_extractors import SOFT_SKILLS, TECHNOLOGIES
+
+# Category for skills not listed in SKILL_CATEGORIES
+OTHER_CATEGORY = 'Other'
+
+
+def popcount(bits: int) -> int:
+    """Number of skills in a bitset"""
+    return bin(bits).count('1')
+
+
+class SkillTaxonomy:
+    """
+    Compiled skill vocabulary.
+
+    IDs are assigned in sorted order of canonical names, so they are stable
+    across processes and runs for the same vocabulary.
+    """
+
+    def __init__(self, skills: Iterable[str], categories: Dict[str, List[str]], aliases: Dict[str, str]):
+        canonical = {skill.lower().strip() for skill in skills}
+        canonical.update(skill.lower() for members in categories.values() for skill in members)
+        canonical.update(target.lower() for target in aliases.values())
+
+        self.skills: List[str] = sorted(canonical)
+        self.width = len(self.skills)
+        self.words = (self.width + 63) // 64
+        self._ids: Dict[str, int] = {skill: skill_id for skill_id, skill in enumerate(self.skills)}
+        for alias, target in aliases.items():
+            self._ids.setdefault(alias.lower(), self._ids[target.lower()])
+
+        self.categories: List[str] = list(categories)
+        self.category_masks: Dict[str, int] = {}
+        self._category_of: List[str] = [OTHER_CATEGORY] * self.width
+        for category, members in categories.items():
+            mask = 0
+            for skill in members:
+                skill_id = self._ids[skill.lower()]
+                if self._category_of[skill_id] == OTHER_CATEGORY:
+                    self._category_of[skill_id] = category
+                    mask |= 1 << skill_id
+            self.category_masks[category] = mask
+
+        other_mask = ((1 << self.width) - 1) & ~self.encode_ids(
+            skill_id for skill_id, category in enumerate(self._category_of) if category != OTHER_CATEGORY
+        )
+        if other_mask:
+            self.categories.append(OTHER_CATEGORY)
+            self.category_masks[OTHER_CATEGORY] = other_mask
+
+    def __len__(self):
+        return self.width
+
+    def skill_id(self, name: str) -> Optional[int]:
+        """ID of a skill name or alias (case-insensitive), or None if unknown"""
+        return self._ids.get(name.lower().strip())
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Canonical name for a skill name or alias, or None if unknown"""
+        skill_id = self.skill_id(name)
+        return None if skill_id is None else self.skills[skill_id]
+
+    def category_of(self, name: str) -> Optional[str]:
+        """Category of a skill name or alias, or None if unknown"""
+        skill_id = self.skill_id(name)
+        return None if skill_id is None else self._category_of[skill_id]
+
+    @staticmethod
+    def encode_ids(skill_ids: Iterable[int]) -> int:
+        bits = 0
+        for skill_id in skill_ids:
+            bits |= 1 << skill_id
+        return bits
+
+    def encode(self, names: Iterable[str]) -> int:
+        """Bitset of the known skills among names; unknown names are ignored"""
+        bits = 0
+        for name in names:
+            skill_id = self._ids.get(name.lower().strip())
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def decode(self, bits: int) -> List[str]:
+        """Canonical skill names in a bitset, in ID order"""
+        names = []
+        skill_id = 0
+        while bits:
+            if bits & 1:
+                names.append(self.skills[skill_id])
+            bits >>= 1
+            skill_id += 1
+        return names
+
+    def group_by_category(self, bits: int) -> Dict[str, List[str]]:
+        """Skills in a bitset grouped by category (categories in taxonomy order)"""
+        grouped = {}
+        for category in self.categories:
+            in_category = bits & self.category_masks[category]
+            if in_category:
+                grouped[category] = self.decode(in_category)
+        return grouped
+
+    def to_words(self, bits: int) -> List[int]:
+        """Split a bitset into little-endian 64-bit words"""
+        return [(bits >> (64 * word)) & 0xFFFFFFFFFFFFFFFF for word in range(self.words)]
+
+    def pack(self, bitsets: Iterable[int]):
+        """
+        Pack bitsets into a matrix for vectorized matching.
+
+        Returns:
+            numpy.ndarray: uint64 array of shape (n, words)
+        """
+        import numpy as np
+
+        rows = [self.to_words(bits) for bits in bitsets]
+        return np.array(rows, dtype=np.uint64).reshape(len(rows), self.words)
+
+    def batch_match(self, matrix, job_bits: int) -> Dict[str, object]:
+        """
+        Match many skill sets against one job's skills at once.
+
+        Args:
+            matrix (numpy.ndarray): Packed skill sets from pack()
+            job_bits (int): The job's skill bitset
+
+        Returns:
+            dict: 'matched' and 'missing' skill counts per row (int arrays) and
+                'coverage', the matched fraction of the job's skills (float array)
+        """
+        import numpy as np
+
+        job_row = np.array(self.to_words(job_bits), dtype=np.uint64)
+        matched = _bit_count(matrix & job_row).sum(axis=1)
+        job_total = popcount(job_bits)
+        coverage = matched / job_total if job_total else np.ones(len(matrix))
+        return {'matched': matched, 'missing': job_total - matched, 'coverage': coverage}
+
+    def batch_contains(self, matrix, skill_name: str):
+        """Boolean array: which rows of a packed matrix contain a skill"""
+        skill_id = self.skill_id(skill_name)
+        if skill_id is None:
+            raise KeyError(f"Unknown skill: {skill_name}")
+        import numpy as np
+
+        word, bit = divmod(skill_id, 64)
+        return (matrix[:, word] >> np.uint64(bit)) & np.uint64(1) == 1
+
+
+def _bit_count(array):
+    """Per-element popcount of a uint64 array"""
+    import numpy as np
+
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(array).astype(np.int64)
+    as_bytes = array.view(np.uint8).reshape(array.shape + (8,))
+    return np.unpackbits(as_bytes, axis=-1).sum(axis=-1).astype(np.int64)
+
+
+# Compiled once at import from the project vocabularies
+TAXONOMY = SkillTaxonomy(TECHNOLOGIES | SOFT_SKILLS, SKILL_CATEGORIES, SKILL_ALIASES)
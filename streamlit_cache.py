@@ -0,0 +1,70 @@
+"""
+Streamlit caching for the analysis pipeline
+Re-clicking Analyze or toggling an option reuses earlier results instead of
+re-parsing the PDF and re-scoring
+
+Cache keys are content hashes passed explicitly; the underscore-prefixed
+arguments carry the data itself and are excluded from Streamlit's hashing.
+"""
+
+import hashlib
+
+import streamlit as st
+
+from config import CACHE_TTL_SECONDS, CACHE_MAX_ENTRIES
+from incremental import get_incremental_analyzer
+from profiles import build_job_profile, build_resume_profile
+from similarity_calculator import tfidf_similarity
+from text_extractors import extract_pdf_document
+
+
+def content_hash(data):
+    """SHA-256 hex digest of bytes, a buffer or a str"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def uploaded_file_hash(uploaded_file):
+    """Hash a Streamlit upload without copying its bytes"""
+    return content_hash(uploaded_file.getbuffer())
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_pdf_extraction(file_hash, _uploaded_file):
+    """PdfExtraction for an upload, keyed by its content hash"""
+    _uploaded_file.seek(0)
+    return extract_pdf_document(_uploaded_file)
+
+
+# Profiles are immutable, so they are shared across sessions without copying
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_resume_profile(resume_hash, _resume_text):
+    """ResumeProfile for a resume text, keyed by its content hash"""
+    return build_resume_profile(_resume_text)
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_job_profile(job_hash, _job_description):
+    """JobProfile for a job description, keyed by its content hash"""
+    return build_job_profile(_job_description)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_sections(resume_hash, job_hash, willing_to_relocate, _resume_profile, _job_profile):
+    """
+    Section analysis keyed by resume hash, job hash and relocation preference.
+    After an edit, only the analyzers whose inputs changed run again.
+    """
+    sections, _ = get_incremental_analyzer().analyze_sections(_resume_profile, _job_profile, willing_to_relocate)
+    return sections
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_tfidf_similarity(resume_hash, job_hash, _resume_profile, _job_profile):
+    """
+    Raw TF-IDF similarity keyed by resume and job hash. It does not depend on
+    the relocation preference, so it survives relocation changes; the final
+    score is recombined from it with combine_similarity().
+    """
+    return float(tfidf_similarity(_resume_profile.processed, _job_profile.processed))
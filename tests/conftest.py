@@ -0,0 +1,14 @@
+"""
+Shared test setup
+The modules live at the repository root, so it is put on sys.path; the
+optional on-disk caches are disabled before config is first imported
+"""
+
+import os
+import sys
+
+os.environ.setdefault('ATS_PDF_CACHE_DIR', '')
+os.environ.setdefault('ATS_FEATURE_STORE', '')
+os.environ.setdefault('ATS_WORLD_GAZETTEER', '')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
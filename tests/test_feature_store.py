@@ -0,0 +1,71 @@
+"""Storing and reloading parsed profiles in feature_store"""
+
+import dataclasses
+
+import pytest
+
+from feature_store import FeatureStore
+from profiles import JobProfile, ResumeProfile
+
+RESUME = """Jane Doe
+Location: Pune
+Skills: Python, Django, PostgreSQL, Docker, k8s, leadership
+Experience: 4 years of experience building backend APIs
+Education: B.Tech in Computer Science
+Projects:
+1. Inventory service in Django and Redis
+2. Kubernetes deployment tooling in Go
+"""
+
+JOB = """Backend Engineer
+Required skills: Python, Django, Docker, Kubernetes
+3-5 years of experience. Location: Bangalore
+"""
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FeatureStore(str(tmp_path / 'features.sqlite3'), max_rows=100, max_age_days=30)
+    yield store
+    store.close()
+
+
+def all_fields(profile):
+    return {field.name: getattr(profile, field.name) for field in dataclasses.fields(profile)}
+
+
+def test_resume_profile_round_trip(store):
+    built = ResumeProfile.from_text(RESUME)
+    store.put('resume', built)
+    loaded = store.get(ResumeProfile, 'resume', RESUME)
+    assert loaded is not None
+    assert all_fields(loaded) == all_fields(built)
+
+
+def test_job_profile_round_trip(store):
+    built = JobProfile.from_text(JOB)
+    store.put('job', built)
+    assert all_fields(store.get(JobProfile, 'job', JOB)) == all_fields(built)
+
+
+def test_miss_builds_and_stores(store):
+    assert store.get(ResumeProfile, 'resume', RESUME) is None
+    profile = store.resume_profile(RESUME)
+    assert all_fields(profile) == all_fields(ResumeProfile.from_text(RESUME))
+    assert store.stats()['resumes'] == 1
+    assert store.get(ResumeProfile, 'resume', RESUME) is not None
+
+
+def test_kinds_are_kept_apart(store):
+    store.put('resume', ResumeProfile.from_text(RESUME))
+    assert store.get(JobProfile, 'job', RESUME) is None
+
+
+def test_eviction_keeps_the_table_under_budget(tmp_path):
+    store = FeatureStore(str(tmp_path / 'small.sqlite3'), max_rows=10, max_age_days=0)
+    try:
+        for index in range(25):
+            store.put('job', JobProfile.from_text(f"{JOB}\nPosting {index}"))
+        assert store.stats()['jobs'] <= 10
+    finally:
+        store.close()
@@ -0,0 +1,144 @@
+"""Leasing, retries and dead-lettering in job_queue"""
+
+import time
+
+import pytest
+
+import job_queue
+from job_queue import JobQueue, STATUS_DEAD, STATUS_DONE, STATUS_QUEUED, lease_heartbeat, process_job
+from text_extractors import PdfExtractionError
+from upload_spool import UploadTooLargeError
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), lease_seconds=60, max_attempts=3,
+                     retry_delay=0, max_upload_bytes=1000)
+    yield queue
+    queue.close()
+
+
+def job_status(queue, job_id):
+    return queue.conn.execute("SELECT status, attempts, error FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+
+def test_claim_complete(queue):
+    batch_id = queue.submit_batch('python developer', [('a.pdf', b'%PDF')])
+    job = queue.claim('w1')
+    assert job.name == 'a.pdf' and job.attempts == 1
+    assert queue.claim('w2') is None
+    assert queue.complete(job, 'w1', {'score': 50})
+    status = queue.batch_status(batch_id)
+    assert status['done'] == 1 and status['finished']
+    assert queue.batch_results(batch_id)[0]['result'] == {'score': 50}
+
+
+def test_failed_job_is_retried_then_dead_lettered(queue):
+    queue.submit_batch('jd', [('a.pdf', b'%PDF')])
+    for attempt in range(1, 4):
+        job = queue.claim('w1')
+        assert job is not None and job.attempts == attempt
+        assert queue.fail(job, 'w1', 'boom')
+        expected = STATUS_DEAD if attempt == 3 else STATUS_QUEUED
+        assert job_status(queue, job.id)['status'] == expected
+    assert queue.claim('w1') is None
+
+
+def test_retry_waits_for_the_backoff(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), retry_delay=60)
+    try:
+        queue.submit_batch('jd', [('a.pdf', b'%PDF')])
+        queue.fail(queue.claim('w1'), 'w1', 'boom')
+        assert queue.claim('w1') is None
+    finally:
+        queue.close()
+
+
+def test_permanent_failure_is_dead_lettered_at_once(queue):
+    queue.submit_batch('jd', [('a.pdf', b'%PDF')])
+    job = queue.claim('w1')
+    queue.fail(job, 'w1', 'unreadable', permanent=True)
+    assert job_status(queue, job.id)['status'] == STATUS_DEAD
+
+
+def test_requeue_dead_gives_fresh_attempts(queue):
+    batch_id = queue.submit_batch('jd', [('a.pdf', b'%PDF')])
+    job = queue.claim('w1')
+    queue.fail(job, 'w1', 'unreadable', permanent=True)
+    assert queue.requeue_dead(batch_id) == 1
+    assert queue.claim('w1').attempts == 1
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), lease_seconds=0.01)
+    try:
+        queue.submit_batch('jd', [('a.pdf', b'%PDF')])
+        job = queue.claim('w1')
+        time.sleep(0.05)
+        retried = queue.claim('w2')
+        assert retried.id == job.id and retried.attempts == 2
+        # The first worker lost its lease and cannot record a result
+        assert not queue.complete(job, 'w1', {})
+    finally:
+        queue.close()
+
+
+def test_heartbeat_keeps_the_lease(tmp_path):
+    db_path = str(tmp_path / 'jobs.sqlite3')
+    queue = JobQueue(db_path, lease_seconds=0.3)
+    other = JobQueue(db_path, lease_seconds=0.3)
+    try:
+        queue.submit_batch('jd', [('a.pdf', b'%PDF')])
+        job = queue.claim('w1')
+        with lease_heartbeat(queue, job, 'w1', interval=0.05):
+            time.sleep(0.8)
+            assert other.claim('w2') is None
+        assert queue.complete(job, 'w1', {})
+    finally:
+        other.close()
+        queue.close()
+
+
+def test_unparseable_pdf_is_dead_lettered(queue, monkeypatch):
+    def broken(*args, **kwargs):
+        raise PdfExtractionError("not a PDF")
+
+    monkeypatch.setattr(job_queue, 'analyze_pdf_bytes', broken)
+    queue.submit_batch('jd', [('a.pdf', b'not a pdf')])
+    job = queue.claim('w1')
+    assert not process_job(queue, job, 'w1')
+    assert job_status(queue, job.id)['status'] == STATUS_DEAD
+
+
+def test_transient_error_is_retried(queue, monkeypatch):
+    def flaky(*args, **kwargs):
+        raise RuntimeError("worker hiccup")
+
+    monkeypatch.setattr(job_queue, 'analyze_pdf_bytes', flaky)
+    queue.submit_batch('jd', [('a.pdf', b'%PDF')])
+    job = queue.claim('w1')
+    process_job(queue, job, 'w1')
+    row = job_status(queue, job.id)
+    assert row['status'] == STATUS_QUEUED
+    assert 'RuntimeError' in row['error']
+
+
+def test_process_job_stores_the_result(queue, monkeypatch):
+    monkeypatch.setattr(job_queue, 'analyze_pdf_bytes', lambda *args, **kwargs: {'score': 72.5})
+    queue.submit_batch('jd', [('a.pdf', b'%PDF')])
+    job = queue.claim('w1')
+    assert process_job(queue, job, 'w1')
+    assert job_status(queue, job.id)['status'] == STATUS_DONE
+
+
+def test_oversize_pdf_is_refused_at_submit(queue, tmp_path):
+    small = tmp_path / 'small.pdf'
+    small.write_bytes(b'x' * 10)
+    big = tmp_path / 'big.pdf'
+    big.write_bytes(b'x' * 2000)
+    with pytest.raises(UploadTooLargeError):
+        queue.submit_files('jd', [str(small), str(big)])
+    with pytest.raises(UploadTooLargeError):
+        queue.submit_batch('jd', [('small.pdf', b'x'), ('big.pdf', b'x' * 2000)])
+    # Nothing of a refused batch is stored
+    assert queue.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
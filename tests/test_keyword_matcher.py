@@ -0,0 +1,64 @@
+"""Word-boundary matching in KeywordMatcher and the shared lexicon"""
+
+import pytest
+
+from feature_extractors import extract_technologies
+from keyword_matcher import KeywordMatcher
+
+
+@pytest.fixture
+def matcher():
+    matcher = KeywordMatcher()
+    matcher.add_many(['r', 'go', 'java', 'javascript', 'c++'], 'technology')
+    return matcher.build()
+
+
+def terms(matcher, text):
+    return [match.term for match in matcher.find_all(text)]
+
+
+@pytest.mark.parametrize('text', ['react', 'for', 'programmer', 'r2d2', 'r_lang'])
+def test_single_letter_r_needs_word_boundaries(matcher, text):
+    assert 'r' not in terms(matcher, text)
+
+
+@pytest.mark.parametrize('text', ['Python, R and SQL', 'R', '(R)', 'stats in R.'])
+def test_single_letter_r_matches_as_a_word(matcher, text):
+    assert terms(matcher, text) == ['r']
+
+
+@pytest.mark.parametrize('text', ['google', 'good', 'going', 'cargo', 'django'])
+def test_go_does_not_match_inside_words(matcher, text):
+    assert 'go' not in terms(matcher, text)
+
+
+def test_go_matches_as_a_word(matcher):
+    assert terms(matcher, 'Services written in Go and Python') == ['go']
+
+
+def test_java_is_not_found_inside_javascript(matcher):
+    assert terms(matcher, 'JavaScript developer') == ['javascript']
+
+
+def test_java_and_javascript_both_found(matcher):
+    assert sorted(terms(matcher, 'Java / JavaScript')) == ['java', 'javascript']
+
+
+def test_offsets_point_at_the_matched_text(matcher):
+    text = 'Used C++ and Go'
+    assert [text[m.start:m.end] for m in matcher.find_all(text)] == ['C++', 'Go']
+
+
+def test_alias_is_reported_under_its_canonical_form():
+    matcher = KeywordMatcher()
+    matcher.add('kubernetes', 'technology')
+    matcher.add('k8s', 'technology', canonical='kubernetes')
+    matcher.build()
+    assert [m.term for m in matcher.find_all('k8s and Kubernetes')] == ['kubernetes', 'kubernetes']
+
+
+def test_lexicon_word_boundaries():
+    found = extract_technologies('Built React apps with Google APIs, wrote JavaScript and some R')
+    assert {'react', 'javascript', 'r'} <= found
+    assert 'go' not in found
+    assert 'java' not in found
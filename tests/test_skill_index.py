@@ -0,0 +1,102 @@
+"""Posting lists, query parsing and persistence in skill_index"""
+
+import pytest
+
+from skill_index import (
+    SkillIndex, decode_postings, encode_postings, experience_bucket, intersect, parse_query
+)
+
+RESUMES = {
+    'alice': ['skill:kubernetes', 'skill:docker', 'skill:terraform', 'role:devops', 'loc:pune', 'exp:5'],
+    'bob': ['skill:react', 'skill:javascript', 'role:frontend', 'loc:remote', 'exp:2'],
+    'carol': ['skill:kubernetes', 'skill:python', 'role:backend', 'loc:new york', 'exp:8'],
+    'dave': ['skill:vue', 'role:frontend', 'loc:pune', 'exp:1'],
+}
+
+
+@pytest.fixture
+def index():
+    index = SkillIndex()
+    for resume_id, terms in RESUMES.items():
+        index.add_terms(resume_id, terms)
+    return index
+
+
+def test_postings_round_trip():
+    doc_ids = [0, 1, 5, 200, 70000]
+    assert decode_postings(encode_postings(doc_ids)) == doc_ids
+
+
+def test_intersect_galloping_path():
+    assert intersect([3, 900], list(range(1000))) == [3, 900]
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('kubernetes', ['alice', 'carol']),
+    ('k8s', ['alice', 'carol']),
+    ('kubernetes AND terraform AND exp>=3', ['alice']),
+    ('kubernetes docker', ['alice']),
+    ('react OR vue', ['bob', 'dave']),
+    ('(react OR vue) role:frontend NOT loc:remote', ['dave']),
+    ('loc:"new york" OR loc:remote', ['bob', 'carol']),
+    ('NOT role:frontend', ['alice', 'carol']),
+    ('exp>5', ['carol']),
+    ('exp<=2', ['bob', 'dave']),
+    ('exp=5', ['alice']),
+])
+def test_queries(index, query, expected):
+    assert index.search(query) == expected
+
+
+@pytest.mark.parametrize('query', [
+    'cobol', 'microservices', 'role:astronaut', 'salary:high', 'kubernetes AND', '(react', '',
+])
+def test_invalid_queries_raise(query):
+    with pytest.raises(ValueError):
+        parse_query(query)
+
+
+def test_readding_replaces_the_old_terms(index):
+    index.add_terms('bob', ['skill:python', 'exp:3'])
+    assert index.search('react') == []
+    assert 'bob' in index.search('python')
+    assert index.tombstones == 1
+
+
+def test_remove_and_compact(index):
+    assert index.remove('alice')
+    assert not index.remove('alice')
+    index.compact()
+    assert index.tombstones == 0
+    assert index.search('kubernetes') == ['carol']
+    assert index.search('loc:pune') == ['dave']
+
+
+def test_save_and_load(index, tmp_path):
+    index.remove('bob')
+    path = str(tmp_path / 'skills.idx')
+    index.save(path)
+    loaded = SkillIndex.load(path)
+    assert len(loaded) == 3
+    assert loaded.search('(react OR vue) OR kubernetes') == ['alice', 'carol', 'dave']
+    loaded.add_terms('erin', ['skill:react'])
+    assert loaded.search('react') == ['erin']
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'not-an-index'
+    path.write_bytes(b'hello world, definitely not an index')
+    with pytest.raises(ValueError):
+        SkillIndex.load(str(path))
+
+
+def test_resume_text_is_indexed(index):
+    resume = "Senior engineer, 3-6 years of experience with Terraform, Ansible and k8s. Location: Pune"
+    terms = index.add('erin', resume)
+    assert {'skill:terraform', 'skill:ansible', 'skill:kubernetes', 'exp:6', 'loc:pune'} <= set(terms)
+    assert index.search('kubernetes AND terraform AND exp>=6') == ['erin']
+
+
+@pytest.mark.parametrize('years, bucket', [((3, 5), 5), ((4, 4), 4), ((5, 999), 5), ((2, 40), 20)])
+def test_experience_bucket(years, bucket):
+    assert experience_bucket(years) == bucket
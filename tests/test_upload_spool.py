@@ -0,0 +1,63 @@
+"""Size limits and spilling in upload_spool"""
+
+import hashlib
+from io import BytesIO
+
+import pytest
+
+from upload_spool import UploadTooLargeError, spool_upload
+
+
+class UnsizedStream:
+    """A source that cannot report its size up front"""
+
+    def __init__(self, data):
+        self._data = BytesIO(data)
+
+    def read(self, size=-1):
+        return self._data.read(size)
+
+
+def test_small_upload_stays_in_memory():
+    data = b'%PDF-1.4 small'
+    with spool_upload(BytesIO(data), max_bytes=1000, spool_bytes=100) as upload:
+        assert not upload.on_disk
+        assert upload.size == len(data)
+        assert upload.sha256 == hashlib.sha256(data).hexdigest()
+        assert upload.rewind().read() == data
+
+
+def test_large_upload_spills_to_disk():
+    data = bytes(range(256)) * 40
+    with spool_upload(UnsizedStream(data), max_bytes=0, spool_bytes=1024) as upload:
+        assert upload.on_disk
+        with open(upload.path, 'rb') as f:
+            assert f.read() == data
+
+
+def test_reported_size_over_the_limit_is_rejected_before_reading(tmp_path):
+    path = tmp_path / 'big.pdf'
+    path.write_bytes(b'x' * 2000)
+    with open(path, 'rb') as source:
+        with pytest.raises(UploadTooLargeError):
+            spool_upload(source, max_bytes=1000)
+        assert source.tell() == 0
+
+
+def test_unsized_stream_is_stopped_once_it_passes_the_limit():
+    with pytest.raises(UploadTooLargeError):
+        spool_upload(UnsizedStream(b'x' * 2000), max_bytes=1000)
+
+
+def test_upload_at_the_limit_is_accepted():
+    with spool_upload(UnsizedStream(b'x' * 1000), max_bytes=1000) as upload:
+        assert upload.size == 1000
+
+
+def test_zero_means_no_limit():
+    with spool_upload(UnsizedStream(b'x' * 5000), max_bytes=0, spool_bytes=100) as upload:
+        assert upload.size == 5000
+
+
+def test_too_large_is_a_value_error():
+    assert issubclass(UploadTooLargeError, ValueError)
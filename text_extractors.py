@@ -3,15 +3,78 @@ Text extraction utilities for ATS Resume Analyzer
 Handles PDF text extraction and text cleaning
 """
 
-import re
+import atexit
+import json
+import logging
+import multiprocessing
+import struct
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from io import BytesIO
+from typing import List, NamedTuple
 try:
     from PyPDF2 import PdfReader
+    from PyPDF2.errors import PyPdfError
 except ImportError:
     try:
         from pypdf import PdfReader
+        from pypdf.errors import PyPdfError
     except ImportError:
         PdfReader = None
+        PyPdfError = None
+
+from config import PDF_MAX_PAGES, PDF_MAX_CHARS, PDF_EXTRACT_WORKERS, PDF_PARALLEL_MIN_PAGES
+from instrumentation import timed
+from patterns import (
+    WHITESPACE_PATTERN, NON_TEXT_CHAR_PATTERN, CONTACT_PATTERN, GITHUB_PATTERN, LINKEDIN_PATTERN,
+    PHONE_FORMATS
+)
+from pdf_cache import cache_key, get_pdf_cache
+from upload_spool import SpooledUpload, spool_upload
+
+logger = logging.getLogger('ats.text_extractors')
+
+# Bump when extraction output changes so cached text is not reused
+EXTRACTOR_VERSION = "2"
+
+# Basic English stopwords (no NLTK dependency)
+STOPWORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each',
+    'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
+    'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just',
+    'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our',
+    'their', 'am', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'up', 'down', 'out', 'off', 'over', 'under', 'again', 'further',
+    'then', 'once', 'here', 'there', 'all', 'any', 'both', 'each', 'few'
+}
+
+
+class PdfExtractionError(ValueError):
+    """The PDF could not be parsed (corrupt, encrypted or not a PDF)"""
+
+
+# What the PDF library raises on a malformed document. Anything else (OSError,
+# MemoryError, BrokenProcessPool, ...) is an infrastructure failure and
+# propagates unchanged so callers such as job_queue can retry it.
+PDF_PARSE_ERRORS = tuple(error for error in (
+    PyPdfError, ValueError, TypeError, KeyError, IndexError, AttributeError,
+    AssertionError, NotImplementedError, RecursionError, struct.error, zlib.error
+) if error is not None)
+
+
+class PdfExtraction(NamedTuple):
+    """Result of extracting text from a PDF"""
+    text: str
+    page_count: int
+    pages_extracted: int
+    truncated: bool
 
 
 def extract_text_from_pdf(uploaded_file):
@@ -25,27 +88,174 @@ def extract_text_from_pdf(uploaded_file):
         str: Extracted text from PDF
         
     Raises:
-        Exception: If PDF reading fails
+        PdfExtractionError: If PDF reading fails
     """
+    return extract_pdf_document(uploaded_file).text
+
+
+@timed('pdf_extraction')
+def extract_pdf_document(uploaded_file, max_pages=None, max_chars=None, workers=None):
+    """
+    Extract text from an uploaded PDF, capped by page and character count.
+    The upload is spooled (in memory, or on disk above PDF_SPOOL_MAX_BYTES)
+    and hashed in one pass; uploads over PDF_MAX_UPLOAD_BYTES are rejected
+    before parsing. Text is cached on disk by content hash, so re-uploads of
+    the same file skip PDF parsing entirely. Long documents are split into
+    page ranges that are extracted in parallel worker processes.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object (anything with read()),
+            or a SpooledUpload from upload_spool.spool_upload()
+        max_pages (int, optional): Pages to read (defaults to PDF_MAX_PAGES)
+        max_chars (int, optional): Characters to keep (defaults to PDF_MAX_CHARS)
+        workers (int, optional): Extraction processes (defaults to PDF_EXTRACT_WORKERS)
+        
+    Returns:
+        PdfExtraction: Text plus page counts and a truncation flag
+        
+    Raises:
+        PdfExtractionError: If PDF reading fails
+        UploadTooLargeError: If the upload exceeds PDF_MAX_UPLOAD_BYTES
+    """
+    if isinstance(uploaded_file, SpooledUpload):
+        return _extract_spooled(uploaded_file, max_pages, max_chars, workers)
+    with spool_upload(uploaded_file) as upload:
+        return _extract_spooled(upload, max_pages, max_chars, workers)
+
+
+def _extract_spooled(upload, max_pages, max_chars, workers):
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    max_chars = PDF_MAX_CHARS if max_chars is None else max_chars
+    workers = PDF_EXTRACT_WORKERS if workers is None else workers
+
+    cache = get_pdf_cache()
+    key = None
+    if cache is not None:
+        key = cache_key(upload.sha256, f"{_extractor_version()}:{max_pages}:{max_chars}")
+        cached = cache.get(key)
+        if cached is not None:
+            try:
+                return PdfExtraction(**json.loads(cached))
+            except (ValueError, TypeError):
+                pass  # Unreadable entry; extract again and overwrite it
+
     if PdfReader is None:
         raise ImportError("PyPDF2 or pypdf is required. Install with: pip install PyPDF2")
     
     try:
-        # Read the uploaded file
-        pdf_file = BytesIO(uploaded_file.read())
-        
-        # Create PDF reader
-        pdf_reader = PdfReader(pdf_file)
-        
-        # Extract text from all pages
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        
-        return text.strip()
+        # Read the spooled file in place
+        pdf_reader = PdfReader(upload.rewind())
+        page_count = len(pdf_reader.pages)
+        pages_to_read = min(page_count, max_pages) if max_pages > 0 else page_count
+
+        if workers > 1 and pages_to_read >= PDF_PARALLEL_MIN_PAGES:
+            page_texts = _extract_pages_parallel(_worker_source(upload), pages_to_read, workers, max_chars)
+        else:
+            page_texts = _extract_pages(pdf_reader, 0, pages_to_read, max_chars)
+
+        text = "\n".join(page_texts).strip()
         
-    except Exception as e:
-        raise Exception(f"Failed to extract text from PDF: {str(e)}")
+    except PDF_PARSE_ERRORS as e:
+        raise PdfExtractionError(f"Failed to extract text from PDF: {str(e)}")
+
+    truncated = len(page_texts) < page_count
+    if max_chars > 0 and len(text) > max_chars:
+        text = text[:max_chars]
+        truncated = True
+
+    result = PdfExtraction(text, page_count, len(page_texts), truncated)
+
+    if cache is not None:
+        try:
+            cache.put(key, json.dumps(result._asdict()))
+        except OSError as e:
+            logger.warning("Could not cache PDF text: %s", e)
+
+    return result
+
+
+def _extract_pages(pdf_reader, start, stop, max_chars=0):
+    """Extract pages [start, stop) in order, stopping early once max_chars is reached"""
+    page_texts = []
+    total = 0
+    for index in range(start, stop):
+        page_text = pdf_reader.pages[index].extract_text() or ""
+        page_texts.append(page_text)
+        total += len(page_text) + 1
+        if max_chars > 0 and total >= max_chars:
+            break
+    return page_texts
+
+
+def _worker_source(upload):
+    """What worker processes open: the spilled file's path, or the bytes of a small in-memory upload"""
+    return upload.path if upload.on_disk else upload.file.getvalue()
+
+
+def _extract_page_range(source, start, stop, max_chars=0):
+    """Worker entry point: open the PDF (a path or bytes) and extract one page range"""
+    if isinstance(source, str):
+        with open(source, 'rb') as pdf_file:
+            return _extract_pages(PdfReader(pdf_file), start, stop, max_chars)
+    return _extract_pages(PdfReader(BytesIO(source)), start, stop, max_chars)
+
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+
+def _get_page_pool():
+    """
+    Process pool shared by all parallel extractions in this process.
+    Workers are started with forkserver (spawn where unavailable): forking
+    the multithreaded Streamlit or API server process is unsafe.
+    """
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _page_pool = ProcessPoolExecutor(max_workers=max(1, PDF_EXTRACT_WORKERS), mp_context=context)
+            atexit.register(_shutdown_page_pool)
+        return _page_pool
+
+
+def _shutdown_page_pool():
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is not None:
+            _page_pool.shutdown(wait=False, cancel_futures=True)
+            _page_pool = None
+
+
+def _extract_pages_parallel(source, page_count, workers, max_chars=0):
+    """
+    Split the pages into contiguous ranges and extract them concurrently.
+    Each range stops at the max_chars budget, and ranges are joined up to
+    that budget, so the pages returned match the serial _extract_pages().
+    """
+    chunk = -(-page_count // workers)
+    ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    pool = _get_page_pool()
+    futures = [pool.submit(_extract_page_range, source, start, stop, max_chars) for start, stop in ranges]
+
+    page_texts = []
+    total = 0
+    for position, future in enumerate(futures):
+        for page_text in future.result():
+            page_texts.append(page_text)
+            total += len(page_text) + 1
+            if max_chars > 0 and total >= max_chars:
+                for pending in futures[position + 1:]:
+                    pending.cancel()
+                return page_texts
+    return page_texts
+
+
+def _extractor_version():
+    """Cache version tag: our extractor version plus the PDF library in use"""
+    library = PdfReader.__module__.split('.')[0] if PdfReader is not None else 'none'
+    return f"{EXTRACTOR_VERSION}:{library}"
 
 
 def clean_text(text):
@@ -65,18 +275,109 @@ def clean_text(text):
     text = text.lower()
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_PATTERN.sub(' ', text)
     
     # Remove special characters but keep important ones
     # Keep: letters, numbers, spaces, @, +, -, ., #, /
-    text = re.sub(r'[^\w\s@+\-\.#/]', ' ', text)
+    text = NON_TEXT_CHAR_PATTERN.sub(' ', text)
     
     # Remove extra spaces again
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_PATTERN.sub(' ', text)
     
     return text.strip()
 
 
+def remove_stopwords(text):
+    """
+    Remove stopwords from text using simple word splitting.
+    No NLTK dependency - uses basic string operations.
+    """
+    # Simple word splitting - split on whitespace
+    words = text.split()
+    
+    # Remove stopwords (case-insensitive)
+    filtered_words = [word for word in words if word.lower() not in STOPWORDS]
+    
+    return " ".join(filtered_words)
+
+
+@lru_cache(maxsize=8192)
+def _preprocess_line(line):
+    return remove_stopwords(clean_text(line))
+
+
+def clear_preprocess_cache():
+    """Drop the cached per-line results of preprocess_text()"""
+    _preprocess_line.cache_clear()
+
+
+def preprocess_text(text):
+    """
+    Cleaned, stopword-free text: same result as remove_stopwords(clean_text(text)).
+    Both steps work word by word, so each line is processed (and cached) on
+    its own and an edited document only reprocesses the lines that changed.
+    """
+    return " ".join(filter(None, map(_preprocess_line, text.split('\n'))))
+
+
+class ContactScan(NamedTuple):
+    """Every contact detail found in a text, in order of appearance"""
+    emails: List[str]
+    phones: List[str]
+    urls: List[str]
+    github: List[str]
+    linkedin: List[str]
+
+
+def scan_contacts(text):
+    """
+    Find emails, phone numbers, URLs and GitHub/LinkedIn handles in one pass.
+
+    Phone numbers are ordered by format priority (see patterns.PHONE_FORMATS),
+    then by position. Handles inside URLs are picked up from the URL itself.
+    Digits inside an email address or URL are not reported as phone numbers.
+
+    Args:
+        text (str): Text to search
+
+    Returns:
+        ContactScan: Lists of matches per field
+    """
+    emails, urls = [], []
+    phones, github, linkedin = [], [], []
+
+    for match in CONTACT_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == 'url':
+            url = match.group()
+            urls.append(url)
+            for handle_pattern, found in ((GITHUB_PATTERN, github), (LINKEDIN_PATTERN, linkedin)):
+                for handle in handle_pattern.finditer(url):
+                    found.append((match.start() + handle.start(), handle.group(1).lower()))
+        elif kind == 'email':
+            emails.append(match.group())
+        elif kind == 'github':
+            github.append((match.start(), match.group('github').lower()))
+        elif kind == 'linkedin':
+            linkedin.append((match.start(), match.group('linkedin').lower()))
+        else:
+            phones.append((PHONE_FORMATS.index(kind), match.start(), match.group(kind)))
+            if kind == 'phone_intl':
+                # The bare 10-digit number inside "+CC NNNNNNNNNN" also counts as
+                # the higher-priority digits-only format, as when formats are searched separately
+                start = match.start('phone_intl_number')
+                if start == 0 or not (text[start - 1].isalnum() or text[start - 1] == '_'):
+                    phones.append((0, start, match.group('phone_intl_number')))
+
+    return ContactScan(
+        emails,
+        [phone for _, _, phone in sorted(phones)],
+        urls,
+        [handle for _, handle in sorted(github)],
+        [handle for _, handle in sorted(linkedin)]
+    )
+
+
 def extract_email(text):
     """
     Extract email address from text.
@@ -87,9 +388,8 @@ def extract_email(text):
     Returns:
         str or None: Email address if found
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
-    return match.group(0) if match else None
+    emails = scan_contacts(text).emails
+    return emails[0] if emails else None
 
 
 def extract_phone(text):
@@ -102,20 +402,8 @@ def extract_phone(text):
     Returns:
         str or None: Phone number if found
     """
-    # Pattern for various phone formats
-    phone_patterns = [
-        r'\b\d{10}\b',  # 10 digits
-        r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # XXX-XXX-XXXX
-        r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}\b',  # (XXX) XXX-XXXX
-        r'\+\d{1,3}[-.\s]?\d{10}\b',  # +XX XXXXXXXXXX
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
-    
-    return None
+    phones = scan_contacts(text).phones
+    return phones[0] if phones else None
 
 
 def extract_urls(text):
@@ -128,9 +416,7 @@ def extract_urls(text):
     Returns:
         list: List of URLs found
     """
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    urls = re.findall(url_pattern, text)
-    return urls
+    return scan_contacts(text).urls
 
 
 def extract_github_username(text):
@@ -143,10 +429,8 @@ def extract_github_username(text):
     Returns:
         str or None: GitHub username if found
     """
-    # Pattern for github.com/username
-    github_pattern = r'github\.com/([a-zA-Z0-9-]+)'
-    match = re.search(github_pattern, text.lower())
-    return match.group(1) if match else None
+    github = scan_contacts(text).github
+    return github[0] if github else None
 
 
 def extract_linkedin_username(text):
@@ -159,7 +443,5 @@ def extract_linkedin_username(text):
     Returns:
         str or None: LinkedIn username if found
     """
-    # Pattern for linkedin.com/in/username
-    linkedin_pattern = r'linkedin\.com/in/([a-zA-Z0-9-]+)'
-    match = re.search(linkedin_pattern, text.lower())
-    return match.group(1) if match else None
\ No newline at end of file
+    linkedin = scan_contacts(text).linkedin
+    return linkedin[0] if linkedin else None
@@ -0,0 +1,211 @@
+"""
+Corpus-level TF-IDF model
+Fitted offline on stored resumes and postings, saved to disk and loaded once
+so request-time scoring only runs transform()
+
+Usage:
+    python tfidf_model.py fit model.npz corpus_dir/ [more files or dirs ...]
+    python tfidf_model.py update model.npz new_docs_dir/
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+from text_extractors import preprocess_text
+
+MODEL_FORMAT_VERSION = 1
+DEFAULT_NGRAM_RANGE = (1, 2)
+DEFAULT_MAX_FEATURES = 20000
+
+
+class CorpusTfidfModel:
+    """
+    TF-IDF model with a fixed vocabulary and running document frequencies.
+
+    IDF uses the same smoothed formula as sklearn's TfidfVectorizer,
+    idf = ln((1 + n) / (1 + df)) + 1, and transformed rows are L2-normalized
+    so a dot product between two rows is their cosine similarity.
+    partial_fit() folds new documents into the frequencies without a refit;
+    terms outside the fitted vocabulary are ignored until the next full fit.
+    """
+
+    def __init__(self, vocabulary, document_frequency, n_documents, ngram_range=DEFAULT_NGRAM_RANGE):
+        self.vocabulary = dict(vocabulary)
+        self.document_frequency = np.asarray(document_frequency, dtype=np.float64)
+        self.n_documents = int(n_documents)
+        self.ngram_range = tuple(ngram_range)
+        self._counter = CountVectorizer(ngram_range=self.ngram_range, vocabulary=self.vocabulary)
+        self._idf = None
+
+    @classmethod
+    def fit(cls, documents, ngram_range=DEFAULT_NGRAM_RANGE, max_features=DEFAULT_MAX_FEATURES):
+        """
+        Fit vocabulary and document frequencies on a corpus.
+
+        Args:
+            documents (list): Preprocessed document texts
+            ngram_range (tuple): Word n-gram range
+            max_features (int): Vocabulary size cap (most frequent terms kept)
+
+        Returns:
+            CorpusTfidfModel: Fitted model
+        """
+        counter = CountVectorizer(ngram_range=ngram_range, max_features=max_features, binary=True)
+        counts = counter.fit_transform(documents)
+        document_frequency = np.asarray(counts.sum(axis=0)).ravel()
+        return cls(counter.vocabulary_, document_frequency, counts.shape[0], ngram_range)
+
+    def partial_fit(self, documents):
+        """Fold new documents into the document frequencies"""
+        counts = self._counter.transform(documents)
+        counts.data[:] = 1
+        self.document_frequency += np.asarray(counts.sum(axis=0)).ravel()
+        self.n_documents += counts.shape[0]
+        self._idf = None
+        return self
+
+    @property
+    def idf(self):
+        """Smoothed inverse document frequency per vocabulary term"""
+        if self._idf is None:
+            self._idf = np.log((1.0 + self.n_documents) / (1.0 + self.document_frequency)) + 1.0
+        return self._idf
+
+    def transform(self, documents, dtype=np.float64):
+        """
+        Vectorize preprocessed documents.
+
+        Returns:
+            scipy.sparse.csr_matrix: L2-normalized TF-IDF rows
+        """
+        counts = self._counter.transform(documents).astype(dtype)
+        tfidf = counts.multiply(self.idf.astype(dtype)).tocsr()
+        return normalize(tfidf, norm='l2', copy=False)
+
+    def vocabulary_digest(self) -> str:
+        """SHA-256 of the term -> column mapping and n-gram range; equal digests mean compatible vectors"""
+        digest = hashlib.sha256(repr(self.ngram_range).encode('utf-8'))
+        for term, index in sorted(self.vocabulary.items(), key=lambda item: item[1]):
+            digest.update(f"{index}\t{term}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def similarity(self, document_a, document_b):
+        """Cosine similarity between two preprocessed documents"""
+        vectors = self.transform([document_a, document_b])
+        return float(vectors[0].multiply(vectors[1]).sum())
+
+    def save(self, path):
+        """Write the model atomically (readers never see a partial file)"""
+        terms = np.empty(len(self.vocabulary), dtype=object)
+        for term, index in self.vocabulary.items():
+            terms[index] = term
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez_compressed(
+                    f,
+                    format_version=np.array(MODEL_FORMAT_VERSION),
+                    terms=terms.astype(str),
+                    document_frequency=self.document_frequency,
+                    n_documents=np.array(self.n_documents),
+                    ngram_range=np.array(self.ngram_range)
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """Load a model written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['format_version']) != MODEL_FORMAT_VERSION:
+                raise ValueError(f"Unsupported TF-IDF model format in {path}")
+            vocabulary = {term: index for index, term in enumerate(data['terms'].tolist())}
+            return cls(
+                vocabulary,
+                data['document_frequency'],
+                int(data['n_documents']),
+                tuple(int(n) for n in data['ngram_range'])
+            )
+
+
+def preprocess(text):
+    """Apply the same cleaning the scorer applies before vectorizing"""
+    return preprocess_text(text)
+
+
+def read_corpus(paths):
+    """Read .txt and .pdf documents from files and directories"""
+    from text_extractors import extract_text_from_pdf
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names))
+        else:
+            files.append(path)
+
+    documents = []
+    for file_path in files:
+        lower = file_path.lower()
+        try:
+            if lower.endswith('.pdf'):
+                with open(file_path, 'rb') as f:
+                    text = extract_text_from_pdf(f)
+            elif lower.endswith('.txt'):
+                with open(file_path, encoding='utf-8', errors='ignore') as f:
+                    text = f.read()
+            else:
+                continue
+        except Exception as e:
+            print(f"Skipping {file_path}: {e}", file=sys.stderr)
+            continue
+        if text:
+            documents.append(preprocess(text))
+    return documents
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Fit or update the corpus TF-IDF model.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    fit_parser = subparsers.add_parser('fit', help="Fit a new model on a corpus")
+    fit_parser.add_argument('model', help="Output model path (.npz)")
+    fit_parser.add_argument('inputs', nargs='+', help="Text/PDF files or directories")
+    fit_parser.add_argument('--max-features', type=int, default=DEFAULT_MAX_FEATURES)
+
+    update_parser = subparsers.add_parser('update', help="Fold new documents into an existing model")
+    update_parser.add_argument('model', help="Model path (.npz), updated in place")
+    update_parser.add_argument('inputs', nargs='+', help="Text/PDF files or directories")
+
+    args = parser.parse_args(argv)
+    documents = read_corpus(args.inputs)
+    if not documents:
+        print("No documents found", file=sys.stderr)
+        return 1
+
+    if args.command == 'fit':
+        model = CorpusTfidfModel.fit(documents, max_features=args.max_features)
+    else:
+        model = CorpusTfidfModel.load(args.model).partial_fit(documents)
+
+    model.save(args.model)
+    print(f"{args.model}: {len(model.vocabulary)} terms, {model.n_documents} documents")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
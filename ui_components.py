@@ -5,6 +5,7 @@ Streamlit UI components and styling
 
 import streamlit as st
 from config import APP_TITLE, APP_SUBTITLE, APP_ICON, APP_VERSION
+from patterns import BOLD_MARKDOWN_PATTERN
 
 
 def apply_custom_css():
@@ -130,6 +131,22 @@ def render_sidebar():
         - Quantify your achievements
         - Keep formatting simple
         """)
+        
+        st.markdown("### 🛠️ Debug")
+        st.checkbox("Show stage timings", key="debug_timings",
+                    help="Time each pipeline stage of the next analysis")
+
+
+def render_timings_panel(timings):
+    """Render per-stage timings of the last run in the sidebar"""
+    stages = timings.as_dict()
+    with st.sidebar:
+        st.markdown("### ⏱️ Stage Timings")
+        st.caption(f"Request {timings.request_id} · total {timings.total * 1000:.1f} ms")
+        if not stages:
+            st.caption("No pipeline stage ran (nothing submitted, or all results were cached).")
+            return
+        st.table({'Stage': list(stages), 'ms': [f"{ms:.2f}" for ms in stages.values()]})
 
 
 def render_section_card(section):
@@ -151,8 +168,7 @@ def render_section_card(section):
     missing = section.get('missing', [])
     
     # Convert markdown bold (**text**) to HTML bold (<strong>text</strong>)
-    import re
-    recommendation_html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', recommendation)
+    recommendation_html = BOLD_MARKDOWN_PATTERN.sub(r'<strong>\1</strong>', recommendation)
     
     # Determine status badge
     if status == 'good':
@@ -0,0 +1,138 @@
+"""
+Bounded-memory upload spooling
+Copies an uploaded PDF in fixed-size chunks into memory, or into a temporary
+file on disk once it outgrows PDF_SPOOL_MAX_BYTES, hashing it on the way in
+
+Uploads larger than PDF_MAX_UPLOAD_BYTES are rejected before any PDF parsing
+starts: immediately when the source reports its size, otherwise as soon as
+the copy passes the limit. Parsers then read the spooled file in place, and
+parallel extraction workers open the spilled file by path instead of
+receiving the PDF bytes.
+"""
+
+import hashlib
+import os
+import tempfile
+from io import BytesIO
+from typing import Optional
+
+from config import PDF_MAX_UPLOAD_BYTES, PDF_SPOOL_MAX_BYTES
+
+CHUNK_SIZE = 256 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """The upload exceeds PDF_MAX_UPLOAD_BYTES"""
+
+
+class SpooledUpload:
+    """
+    A spooled copy of an upload with its size and SHA-256.
+
+    Use as a context manager (or call close()) to delete the temporary file.
+    """
+
+    def __init__(self, spool_bytes=PDF_SPOOL_MAX_BYTES):
+        self.file = BytesIO()
+        self.path: Optional[str] = None
+        self.size = 0
+        self._spool_bytes = spool_bytes
+        self._digest = hashlib.sha256()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of everything written so far"""
+        return self._digest.hexdigest()
+
+    @property
+    def on_disk(self) -> bool:
+        return self.path is not None
+
+    def write(self, chunk) -> None:
+        if self.path is None and self.size + len(chunk) > self._spool_bytes:
+            self._rollover()
+        self.file.write(chunk)
+        self._digest.update(chunk)
+        self.size += len(chunk)
+
+    def _rollover(self):
+        """Move the in-memory buffer to a temporary file on disk"""
+        disk_file = tempfile.NamedTemporaryFile(prefix='ats-upload-', suffix='.pdf')
+        disk_file.write(self.file.getbuffer())
+        self.file.close()
+        self.file = disk_file
+        self.path = disk_file.name
+
+    def rewind(self):
+        """Flush pending writes and return the file positioned at the start"""
+        self.file.flush()
+        self.file.seek(0)
+        return self.file
+
+    def close(self):
+        self.file.close()
+
+
+def upload_size(source) -> Optional[int]:
+    """Size reported by an upload or open file without reading it, or None if unknown"""
+    size = getattr(source, 'size', None)
+    if isinstance(size, int):
+        return size
+    try:
+        return os.fstat(source.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def spool_upload(source, max_bytes=None, spool_bytes=None):
+    """
+    Copy a file-like upload into a SpooledUpload, enforcing the size limit.
+
+    Args:
+        source: Streamlit upload, open binary file or anything with read()
+        max_bytes (int, optional): Size limit (defaults to PDF_MAX_UPLOAD_BYTES; 0 = no limit)
+        spool_bytes (int, optional): Size kept in memory before spilling to disk
+            (defaults to PDF_SPOOL_MAX_BYTES)
+
+    Returns:
+        SpooledUpload: The copy, rewound and ready to read
+
+    Raises:
+        UploadTooLargeError: If the upload exceeds max_bytes
+    """
+    max_bytes = PDF_MAX_UPLOAD_BYTES if max_bytes is None else max_bytes
+    spool_bytes = PDF_SPOOL_MAX_BYTES if spool_bytes is None else spool_bytes
+
+    size = upload_size(source)
+    if max_bytes > 0 and size is not None and size > max_bytes:
+        raise UploadTooLargeError(f"Upload is {size} bytes; the limit is {max_bytes} bytes")
+
+    upload = SpooledUpload(spool_bytes)
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    read_into = getattr(source, 'readinto', None)
+    try:
+        while True:
+            if read_into is not None:
+                count = read_into(buffer)
+                chunk = view[:count]
+            else:
+                chunk = source.read(CHUNK_SIZE)
+                count = len(chunk)
+            if not count:
+                break
+            if max_bytes > 0 and upload.size + count > max_bytes:
+                raise UploadTooLargeError(f"Upload exceeds the {max_bytes} byte limit")
+            upload.write(chunk)
+    except BaseException:
+        upload.close()
+        raise
+
+    upload.rewind()
+    return upload
@@ -1,10 +1,19 @@
 """
 Visualization utilities for ATS Resume Analyzer
 Creates charts and graphs for analysis results
+matplotlib is imported on first use to keep application start-up fast
 """
 
-import matplotlib.pyplot as plt
+from functools import lru_cache
+from io import BytesIO
+
 from config import STATUS_SCORES, EXPECTED_SCORES_AFTER_FIX, SECTION_ORDER, SECTION_LABEL_MAP
+from instrumentation import timed
+
+# st.pyplot's savefig resolution, kept so cached PNGs look the same
+CHART_DPI = 200
+# Rendered charts kept in memory (one per distinct set of section scores)
+CHART_CACHE_ENTRIES = 64
 
 
 def calculate_section_scores(sections_analysis):
@@ -66,42 +75,50 @@ def calculate_section_scores(sections_analysis):
 
 
 
-def create_section_impact_chart(sections_analysis):
+def section_scores_key(section_scores):
+    """Hashable (labels, current, expected) tuple for a calculate_section_scores() result"""
+    return (
+        tuple(section_scores['labels']),
+        tuple(section_scores['current']),
+        tuple(section_scores['expected'])
+    )
+
+
+def _build_figure(labels, current, expected):
     """
-    Create section-by-section impact analysis chart
-    
-    Args:
-        sections_analysis (list): List of section analysis dictionaries
-        
-    Returns:
-        matplotlib.figure.Figure: The created figure
+    Draw the section impact chart on a standalone Figure.
+
+    The Figure is not registered with pyplot, so it needs no explicit
+    close: it is freed like any other object once unreferenced, and
+    concurrent sessions never share pyplot's global figure state.
     """
-    section_scores = calculate_section_scores(sections_analysis)
-    
-    fig, ax = plt.subplots(figsize=(12, 6))
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
     fig.patch.set_facecolor('#1a1a1a')
     ax.set_facecolor('#1a1a1a')
     
     # Plot lines
-    x_positions = range(len(section_scores['labels']))
+    x_positions = range(len(labels))
     
     # Current score line (whitish/gray)
-    ax.plot(x_positions, section_scores['current'], 
+    ax.plot(x_positions, current, 
            marker='o', markersize=8, linewidth=2.5, 
            color='#b0b0b0', label='Current', alpha=0.8)
     
     # Expected score line (greenish)
-    ax.plot(x_positions, section_scores['expected'], 
+    ax.plot(x_positions, expected, 
            marker='o', markersize=8, linewidth=2.5, 
            color='#80d080', label='After Improvements', alpha=0.9)
     
     # Fill area between lines to show improvement potential
-    ax.fill_between(x_positions, section_scores['current'], section_scores['expected'], 
+    ax.fill_between(x_positions, current, expected, 
                    alpha=0.2, color='#80d080')
     
     # Customize chart
     ax.set_xticks(x_positions)
-    ax.set_xticklabels(section_scores['labels'], rotation=0, ha='center', fontsize=9, color='#a0a0a0')
+    ax.set_xticklabels(labels, rotation=0, ha='center', fontsize=9, color='#a0a0a0')
     ax.set_ylim(40, 100)
     ax.set_ylabel('Score (%)', color='#a0a0a0', fontsize=11)
     ax.set_xlabel('Resume Sections', color='#a0a0a0', fontsize=11)
@@ -120,12 +137,62 @@ def create_section_impact_chart(sections_analysis):
              edgecolor='#404040', fontsize=10, labelcolor='#a0a0a0')
     
     # Add value labels on points
-    for i, (curr, exp) in enumerate(zip(section_scores['current'], section_scores['expected'])):
+    for i, (curr, exp) in enumerate(zip(current, expected)):
         ax.text(i, curr - 3, f'{int(curr)}', ha='center', va='top', 
                fontsize=8, color='#b0b0b0', weight='bold')
         if exp != curr:
             ax.text(i, exp + 2, f'{int(exp)}', ha='center', va='bottom', 
                    fontsize=8, color='#80d080', weight='bold')
     
-    plt.tight_layout()
-    return fig
\ No newline at end of file
+    fig.tight_layout()
+    return fig
+
+
+@timed()
+def create_section_impact_chart(sections_analysis):
+    """
+    Create section-by-section impact analysis chart.
+    The app renders through section_impact_chart_png(); this uncached figure
+    is kept for the benchmark (benchmarks/run.py), which times each stage.
+    
+    Args:
+        sections_analysis (list): List of section analysis dictionaries
+        
+    Returns:
+        matplotlib.figure.Figure: The created figure
+    """
+    return _build_figure(*section_scores_key(calculate_section_scores(sections_analysis)))
+
+
+def figure_png(fig):
+    """Render a figure to PNG bytes with the same settings as st.pyplot"""
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=CHART_DPI, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=CHART_CACHE_ENTRIES)
+def _render_chart_png(labels, current, expected):
+    return figure_png(_build_figure(labels, current, expected))
+
+
+def clear_chart_cache():
+    """Drop the cached chart PNGs"""
+    _render_chart_png.cache_clear()
+
+
+@timed()
+def section_impact_chart_png(sections_analysis):
+    """
+    Section impact chart as PNG bytes (for st.image).
+    Only a few score combinations occur in practice, so rendered charts are
+    cached by their calculate_section_scores() values and shared by every
+    session; matplotlib is only imported on the first cache miss.
+    
+    Args:
+        sections_analysis (list): List of section analysis dictionaries
+        
+    Returns:
+        bytes: PNG image
+    """
+    return _render_chart_png(*section_scores_key(calculate_section_scores(sections_analysis)))
@@ -0,0 +1,308 @@
+"""
+Memory-mapped world gazetteer
+Compact on-disk hash index of city/region/country names and aliases, used
+by extract_location() when the built-in gazetteer finds nothing
+
+The index is built once from a TSV file and then memory-mapped read-only,
+so every worker process shares the same pages from the OS page cache and
+nothing is loaded into Python lists. A lookup hashes the normalized name and
+probes an open-addressing table, comparing the stored name on a hash match:
+its cost does not depend on how many entries the gazetteer holds (a sorted
+index would need log2(n) probes, each touching a different page).
+
+TSV input (one place per line, '#' starts a comment, earlier rows win when
+two places share a name, so sort by importance e.g. population):
+    name <TAB> kind (city|region|country) <TAB> country <TAB> aliases (comma-separated)
+
+Usage:
+    python world_gazetteer.py build places.tsv gazetteer.idx
+    python world_gazetteer.py lookup gazetteer.idx "Sao Paulo"
+"""
+
+import argparse
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import unicodedata
+from functools import lru_cache
+from typing import FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+from config import WORLD_GAZETTEER_PATH
+from patterns import PLACE_PUNCTUATION_PATTERN, PLACE_TOKEN_PATTERN
+
+logger = logging.getLogger('ats.world_gazetteer')
+
+MAGIC = b'ATSGAZ02'
+KINDS = ('city', 'region', 'country')
+
+# magic, slot count, entry count, key count, records offset, strings offset
+_HEADER = struct.Struct('<8sIIIQQ')
+# key hash (0 = empty slot), record index, key offset, key length
+_SLOT = struct.Struct('<QIIH2x')
+# name offset, name length, kind, country offset, country length
+_RECORD = struct.Struct('<IHBxIH2x')
+
+# Longest place name probed, in words ("Rio Grande do Sul", "Santa Cruz de Tenerife")
+MAX_NAME_WORDS = 4
+
+
+class GazetteerEntry(NamedTuple):
+    """A place found in the gazetteer"""
+    name: str
+    kind: str
+    country: str
+
+
+def normalize_place(name: str) -> str:
+    """
+    Canonical lookup form of a place name: accents stripped, lowercase,
+    punctuation folded to single spaces ("São Paulo" -> "sao paulo",
+    "Winston-Salem" -> "winston salem").
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    ascii_name = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return PLACE_PUNCTUATION_PATTERN.sub(' ', ascii_name.casefold()).strip()
+
+
+def _key_hash(key: str) -> int:
+    value = int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+    return value or 1  # 0 marks an empty slot
+
+
+def read_places(path) -> Iterator[Tuple[str, str, str, List[str]]]:
+    """Yield (name, kind, country, aliases) rows from a gazetteer TSV file"""
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.rstrip('\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            columns = line.split('\t')
+            columns += [''] * (4 - len(columns))
+            name, kind, country, aliases = (c.strip() for c in columns[:4])
+            kind = kind.lower() or 'city'
+            if kind not in KINDS:
+                raise ValueError(f"{path}:{line_number}: unknown kind {kind!r} (expected one of {KINDS})")
+            yield name, kind, country, [a.strip() for a in aliases.split(',') if a.strip()]
+
+
+def build_index(places, output_path):
+    """
+    Write a gazetteer index.
+
+    Args:
+        places (iterable): (name, kind, country, aliases) rows, most important first
+        output_path (str): Index file to write (replaced atomically)
+
+    Returns:
+        tuple: (entry count, key count)
+    """
+    strings = bytearray()
+    string_offsets = {}
+
+    def intern(text):
+        if text not in string_offsets:
+            string_offsets[text] = len(strings)
+            strings.extend(text.encode('utf-8'))
+        return string_offsets[text], len(text.encode('utf-8'))
+
+    records = bytearray()
+    keys = {}
+    entry_count = 0
+    for name, kind, country, aliases in places:
+        if not name:
+            continue
+        name_offset, name_length = intern(name)
+        country_offset, country_length = intern(country)
+        records.extend(_RECORD.pack(name_offset, name_length, KINDS.index(kind), country_offset, country_length))
+        for alias in [name] + list(aliases):
+            key = normalize_place(alias)
+            if key:
+                keys.setdefault(key, entry_count)
+        entry_count += 1
+
+    # Load factor <= 0.5 keeps probe sequences short
+    slot_count = 1
+    while slot_count < 2 * max(1, len(keys)):
+        slot_count *= 2
+    slots = [(0, 0, 0, 0)] * slot_count
+    mask = slot_count - 1
+    for key, record_index in keys.items():
+        key_hash = _key_hash(key)
+        slot = key_hash & mask
+        while slots[slot][0]:
+            slot = (slot + 1) & mask
+        slots[slot] = (key_hash, record_index, *intern(key))
+
+    records_offset = _HEADER.size + slot_count * _SLOT.size
+    strings_offset = records_offset + len(records)
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, slot_count, entry_count, len(keys), records_offset, strings_offset))
+            f.write(b''.join(_SLOT.pack(*slot) for slot in slots))
+            f.write(records)
+            f.write(strings)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return entry_count, len(keys)
+
+
+class WorldGazetteer:
+    """
+    Read-only view of a gazetteer index.
+
+    The file is memory-mapped, so opening it is instant and the pages are
+    shared by every process that maps the same file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.slot_count, self.entry_count, self.key_count, self._records_offset, self._strings_offset = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a gazetteer index")
+        self._mask = self.slot_count - 1
+
+    def close(self):
+        self._map.close()
+
+    def __len__(self):
+        return self.entry_count
+
+    def _string(self, offset, length):
+        start = self._strings_offset + offset
+        return self._map[start:start + length].decode('utf-8')
+
+    def _entry(self, record_index) -> GazetteerEntry:
+        name_offset, name_length, kind, country_offset, country_length = _RECORD.unpack_from(
+            self._map, self._records_offset + record_index * _RECORD.size
+        )
+        return GazetteerEntry(
+            self._string(name_offset, name_length), KINDS[kind], self._string(country_offset, country_length)
+        )
+
+    def _probe(self, key: str) -> Optional[int]:
+        key_hash = _key_hash(key)
+        key_bytes = key.encode('utf-8')
+        slot = key_hash & self._mask
+        while True:
+            stored_hash, record_index, key_offset, key_length = _SLOT.unpack_from(
+                self._map, _HEADER.size + slot * _SLOT.size
+            )
+            # Compare the stored name too, so a hash collision cannot return another place
+            if stored_hash == key_hash and key_length == len(key_bytes):
+                start = self._strings_offset + key_offset
+                if self._map[start:start + key_length] == key_bytes:
+                    return record_index
+            if not stored_hash:
+                return None
+            slot = (slot + 1) & self._mask
+
+    def lookup(self, name: str) -> Optional[GazetteerEntry]:
+        """Look up a place name or alias (normalized first)"""
+        key = normalize_place(name)
+        if not key:
+            return None
+        record_index = self._probe(key)
+        return None if record_index is None else self._entry(record_index)
+
+    def find_locations(self, text: str, exclude: FrozenSet[str] = frozenset()) -> List[GazetteerEntry]:
+        """
+        Find the places mentioned in text, in order of appearance.
+
+        Only capitalized words are probed (place names are proper nouns;
+        this keeps common words such as "reading" or "mobile" from matching),
+        and the longest name starting at each word wins.
+
+        Args:
+            text (str): Text to scan
+            exclude (frozenset): Normalized names never treated as places,
+                e.g. technologies such as "java" or "spring"
+        """
+        tokens = [(m.group(), m.group()[0].isupper()) for m in PLACE_TOKEN_PATTERN.finditer(text)]
+        found = []
+        i = 0
+        while i < len(tokens):
+            if not tokens[i][1]:
+                i += 1
+                continue
+            for length in range(min(MAX_NAME_WORDS, len(tokens) - i), 0, -1):
+                words = tokens[i:i + length]
+                if not words[-1][1]:
+                    continue
+                key = normalize_place(' '.join(word for word, _ in words))
+                if key in exclude:
+                    continue
+                record_index = self._probe(key)
+                if record_index is not None:
+                    found.append(self._entry(record_index))
+                    i += length
+                    break
+            else:
+                i += 1
+        return found
+
+    def first_location(self, text: str, exclude: FrozenSet[str] = frozenset()) -> Optional[GazetteerEntry]:
+        """The first place mentioned in text, preferring cities and regions over countries"""
+        found = self.find_locations(text, exclude)
+        for entry in found:
+            if entry.kind != 'country':
+                return entry
+        return found[0] if found else None
+
+
+@lru_cache(maxsize=1)
+def get_world_gazetteer() -> Optional[WorldGazetteer]:
+    """Return the process-wide gazetteer, or None when not configured"""
+    if not WORLD_GAZETTEER_PATH:
+        return None
+    try:
+        return WorldGazetteer(WORLD_GAZETTEER_PATH)
+    except (OSError, ValueError) as e:
+        logger.warning("World gazetteer disabled: %s", e)
+        return None
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Build or query the world gazetteer index.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Build an index from a TSV file")
+    build.add_argument('tsv', help="name<TAB>kind<TAB>country<TAB>aliases")
+    build.add_argument('index', help="Index file to write")
+
+    lookup = commands.add_parser('lookup', help="Look up place names")
+    lookup.add_argument('index')
+    lookup.add_argument('names', nargs='+')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        entries, keys = build_index(read_places(args.tsv), args.index)
+        print(f"Indexed {entries} places under {keys} names in {args.index}")
+        return 0
+
+    gazetteer = WorldGazetteer(args.index)
+    for name in args.names:
+        entry = gazetteer.lookup(name)
+        print(f"{name}: {entry.name} ({entry.kind}, {entry.country})" if entry else f"{name}: not found")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())